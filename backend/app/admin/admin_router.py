@@ -1,5 +1,5 @@
 # app/admin/admin_router.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import text
@@ -9,6 +9,7 @@ from app.core.deps import get_current_user
 from app.admin.admin_schema import (
     ResolveUserCommentReportRequest,
     ResolvePostReportRequest,
+    BulkResolveReportsRequest,
 )
 from app.admin.admin_service import (
     approve_post,
@@ -20,6 +21,9 @@ from app.admin.admin_service import (
     unban_user,  
     resolve_user_comment_report,
     resolve_post_report,        
+    list_pending_reports,
+    PENDING_REPORTS_MAX_LIMIT,
+    resolve_reports_for_target,
 )
 
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -44,78 +48,32 @@ def api_get_admin_stats(user=Depends(get_current_user), db: Session = Depends(ge
 
 
 # ✅ 신고 대기 목록 조회 (관리자 신고 처리 페이지용)
-# app/admin/admin_router.py (일부 수정)
 @router.get("/pending-reports")
-def api_get_pending_reports(user=Depends(get_current_user), db: Session = Depends(get_db)):
+def api_get_pending_reports(
+    limit: int = Query(50, ge=1, le=PENDING_REPORTS_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
     """
-    처리 대기 중인 신고 목록 조회
+    처리 대기 중인 신고 목록 조회 (최신순 커서 페이지네이션)
     - 상태: PENDING
     - 게시글/댓글/쪽지/프로젝트/스터디 내용 함께 반환 (관리자 판단용)
     """
     _ensure_admin(user)
-
-    rows = db.execute(
-        text("""
-            SELECT 
-                r.id,
-                r.reporter_user_id,
-                ru.nickname AS reporter_nickname,
-                r.reported_user_id,
-                tu.nickname AS reported_nickname,
-                r.target_type,
-                r.target_id,
-                r.reason,
-                r.status,
-                r.created_at,
-
-                -- ✅ 유저게시판 (BOARD_POST)
-                bp.title AS board_post_title,
-                bp.content AS board_post_content,
-
-                -- ✅ 프로젝트/스터디 (POST)
-                p.title AS project_title,
-                p.description AS project_description,
-
-                -- ✅ 댓글
-                c.content AS comment_content,
-
-                -- ✅ 쪽지
-                m.content AS message_content,
-
-                -- ✅ 통합 표시용 컬럼 (프론트 호환)
-                COALESCE(bp.title, p.title) AS post_title,
-                COALESCE(bp.content, p.description) AS post_content
-
-            FROM reports r
-            LEFT JOIN users ru ON ru.id = r.reporter_user_id
-            LEFT JOIN users tu ON tu.id = r.reported_user_id
-
-            LEFT JOIN posts p 
-                ON r.target_type = 'POST' AND p.id = r.target_id
-
-            LEFT JOIN board_posts bp 
-                ON r.target_type = 'BOARD_POST' AND bp.id = r.target_id
-
-            LEFT JOIN comments c 
-                ON r.target_type = 'COMMENT' AND c.id = r.target_id
-
-            LEFT JOIN messages m 
-                ON r.target_type = 'MESSAGE' AND m.id = r.target_id
-
-            WHERE r.status = 'PENDING'
-            ORDER BY r.created_at DESC
-        """)
-    ).mappings().all()
+    try:
+        page = list_pending_reports(db, limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
 
     return {
         "success": True,
-        "data": [dict(r) for r in rows],
+        "data": page["items"],
+        "next_cursor": page["next_cursor"],
         "message": "신고 대기 목록 조회 성공 (내용 포함)",
     }
 
 
-
-
 # ----------------------------
 # ✅ 신고 처리 요청 스키마
 # ----------------------------
@@ -204,6 +162,25 @@ def api_resolve_post_report(
 # ----------------------------
 # ✅ 게시글 승인/거절 (옵션)
 # ----------------------------
+# ----------------------------
+# ✅ 같은 대상 신고 일괄 처리
+# ----------------------------
+@router.post("/reports/bulk-resolve")
+def api_bulk_resolve_reports(
+    payload: BulkResolveReportsRequest,
+    user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    같은 게시글/댓글 등에 쌓인 처리 대기 신고를 한 번에 처리
+    - 대상 숨김/삭제, 작성자 제재는 한 번만 적용
+    - 모든 신고자에게 결과 알림
+    """
+    _ensure_admin(user)
+    result = resolve_reports_for_target(payload, admin_id=user.id, db=db)
+    return {"success": True, "data": result, "message": f"신고 {result['processed']}건 일괄 처리 완료"}
+
+
 @router.post("/posts/{post_id}/approve")
 def api_approve_post(post_id: int, user=Depends(get_current_user), db: Session = Depends(get_db)):
     """
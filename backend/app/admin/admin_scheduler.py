@@ -0,0 +1,35 @@
+# app/admin/admin_scheduler.py
+import asyncio
+from sqlalchemy.orm import Session
+from app.core.database import SessionLocal
+from app.board.hot3_scheduler import scheduler  # ✅ 스케줄러 인스턴스 공유
+from app.admin.admin_stats import admin_stats
+
+
+def recount_admin_stats():
+    """주기적으로 대시보드 카운터 재집계 (증감 누락/다른 워커 변경 보정)"""
+    db: Session = SessionLocal()
+    try:
+        counts = admin_stats.load(db)
+        print(f"✅ [SCHEDULER] 관리자 통계 재집계 완료: {counts}")
+    except Exception as e:
+        print(f"❌ [SCHEDULER] 관리자 통계 재집계 실패: {e}")
+    finally:
+        db.close()
+
+
+def start_admin_jobs():
+    """hot3 스케줄러에 관리자 통계 재집계 작업 등록 (서버 시작 시 1회 즉시 실행)"""
+    try:
+        admin_stats.bind_loop(asyncio.get_running_loop())  # startup 훅은 서버 루프에서 실행
+    except RuntimeError:
+        print("⚠️ 실행 중인 이벤트 루프 없음 → 관리자 통계 WebSocket 전송 비활성")
+    recount_admin_stats()
+    scheduler.add_job(
+        recount_admin_stats,
+        "interval",
+        minutes=5,
+        id="admin_stats",
+        replace_existing=True,
+    )
+    print("⏰ 관리자 통계 재집계(5분) 스케줄러 등록 + 최초 1회")
@@ -25,3 +25,15 @@ class ResolvePostReportRequest(BaseModel):
         description="게시글 작성자 제재 수준 (NONE / WARNING / BAN_3DAYS / BAN_7DAYS / BAN_PERMANENT)"
     )
     reason: Optional[str] = Field(None, description="처리 사유")
+
+
+# ===============================================
+# ✅ 동일 대상 신고 일괄 처리 요청
+# ===============================================
+class BulkResolveReportsRequest(BaseModel):
+    target_type: str = Field(..., description="신고 대상 종류 (POST / BOARD_POST / COMMENT / MESSAGE / USER)")
+    target_id: int = Field(..., description="신고 대상 ID")
+    action: str = Field(..., description="RESOLVE 또는 REJECT")
+    content_action: str = Field("NONE", description="대상 조치 (NONE / HIDE / DELETE, RESOLVE일 때만)")
+    user_action: str = Field("NONE", description="작성자 제재 (NONE / WARNING / BAN_3DAYS / BAN_7DAYS / BAN_PERMANENT)")
+    reason: Optional[str] = Field(None, description="처리 사유")
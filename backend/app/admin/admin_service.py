@@ -1,16 +1,22 @@
 # app/admin/admin_service.py
 # ✅ 관리자 비즈니스 로직: 게시글 승인/거절, 신고 처리
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import column, select, table, text, bindparam, DateTime
 from fastapi import HTTPException
 from datetime import datetime, timedelta
 from app.core.database import get_db
 from app.events.events import on_post_approved
-from app.notifications.notification_service import send_notification
+from app.notifications.notification_service import send_notification, send_notifications_bulk
 from app.notifications.notification_model import NotificationType, NotificationCategory
 from app.messages.message_service import send_message
 from app.messages.message_model import MessageCategory
+from app.project_post.post_detail_cache import post_detail_cache
+from app.project_post.skill_index import skill_index
+from app.project_post import dashboard_service
+from app.board.board_service import refresh_comment_count
+from app.admin.admin_stats import admin_stats
+from app.core.pagination import encode_cursor, decode_cursor
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,6 +38,7 @@ def _get_db(db: Optional[Session] = None):
 def approve_post(post_id: int, admin_id: int, db: Optional[Session] = None) -> bool:
     db, close = _get_db(db)
     try:
+        prev_status = db.execute(text("SELECT status FROM posts WHERE id=:pid"), {"pid": post_id}).scalar()
         updated = db.execute(
             text("UPDATE posts SET status='APPROVED' WHERE id=:pid"),
             {"pid": post_id},
@@ -44,6 +51,10 @@ def approve_post(post_id: int, admin_id: int, db: Optional[Session] = None) -> b
         ).scalar()
 
         db.commit()
+        post_detail_cache.invalidate(post_id)
+        dashboard_service.invalidate_user(int(leader_id))
+        if prev_status == "PENDING":
+            admin_stats.adjust(pending_posts=-1)
 
         # 승인 이벤트 트리거
         on_post_approved(post_id=post_id, leader_id=int(leader_id), db=db)
@@ -60,6 +71,7 @@ def approve_post(post_id: int, admin_id: int, db: Optional[Session] = None) -> b
 def reject_post(post_id: int, admin_id: int, reason: Optional[str] = None, db: Optional[Session] = None) -> bool:
     db, close = _get_db(db)
     try:
+        prev_status = db.execute(text("SELECT status FROM posts WHERE id=:pid"), {"pid": post_id}).scalar()
         updated = db.execute(
             text("""
                 UPDATE posts
@@ -88,6 +100,10 @@ def reject_post(post_id: int, admin_id: int, reason: Optional[str] = None, db: O
                 db=db,
             )
         db.commit()
+        post_detail_cache.invalidate(post_id)
+        dashboard_service.invalidate_user(leader_id)
+        if prev_status == "PENDING":
+            admin_stats.adjust(pending_posts=-1)
         logger.info(f"🚫 게시글 거절 완료: post_id={post_id}, reason={reason}")
         return True
     finally:
@@ -95,6 +111,100 @@ def reject_post(post_id: int, admin_id: int, reason: Optional[str] = None, db: O
             db.close()
 
 
+# ===============================================
+# ✅ 처리 대기 신고 목록 (커서 페이지네이션)
+# - 신고 행만 먼저 (status, created_at) 인덱스 순서로 조회
+# - 대상 내용은 target_type 별로 IN 쿼리 한 번씩 채움
+# ===============================================
+PENDING_REPORTS_MAX_LIMIT = 100
+
+# target_type → (테이블, 제목 컬럼, 내용 컬럼)
+_REPORT_TARGETS = {
+    "POST": ("posts", "title", "description"),
+    "BOARD_POST": ("board_posts", "title", "content"),
+    "COMMENT": ("comments", None, "content"),
+    "MESSAGE": ("messages", None, "content"),
+}
+
+
+def _hydrate_report_targets(db: Session, reports: List[Dict[str, Any]]) -> None:
+    ids_by_type: Dict[str, set] = {}
+    for r in reports:
+        if r["target_type"] in _REPORT_TARGETS:
+            ids_by_type.setdefault(r["target_type"], set()).add(r["target_id"])
+
+    targets: Dict[tuple, Any] = {}
+    for target_type, ids in ids_by_type.items():
+        table, title_col, content_col = _REPORT_TARGETS[target_type]
+        title_sql = title_col or "NULL"
+        rows = db.execute(
+            text(f"SELECT id, {title_sql} AS title, {content_col} AS content FROM {table} WHERE id IN :ids")
+            .bindparams(bindparam("ids", expanding=True)),
+            {"ids": sorted(ids)},
+        ).mappings().all()
+        for row in rows:
+            targets[(target_type, row["id"])] = row
+
+    for r in reports:
+        target = targets.get((r["target_type"], r["target_id"]))
+        title = target["title"] if target else None
+        content = target["content"] if target else None
+        t = r["target_type"]
+        # 기존 응답 키 유지 (프론트 호환)
+        r["board_post_title"] = title if t == "BOARD_POST" else None
+        r["board_post_content"] = content if t == "BOARD_POST" else None
+        r["project_title"] = title if t == "POST" else None
+        r["project_description"] = content if t == "POST" else None
+        r["comment_content"] = content if t == "COMMENT" else None
+        r["message_content"] = content if t == "MESSAGE" else None
+        r["post_title"] = title if t in ("POST", "BOARD_POST") else None
+        r["post_content"] = content if t in ("POST", "BOARD_POST") else None
+
+
+def list_pending_reports(db: Session, limit: int = 50, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """처리 대기 신고 최신순 → {"items", "next_cursor"} (잘못된 커서는 ValueError)"""
+    limit = max(1, min(limit, PENDING_REPORTS_MAX_LIMIT))
+    params: Dict[str, Any] = {"limit": limit + 1}
+    keyset, binds = "", []
+    if cursor:
+        params["cursor_ts"], params["cursor_id"] = decode_cursor(cursor)
+        keyset = "AND (r.created_at < :cursor_ts OR (r.created_at = :cursor_ts AND r.id < :cursor_id))"
+        binds.append(bindparam("cursor_ts", type_=DateTime))
+
+    rows = db.execute(
+        text(f"""
+            SELECT
+                r.id,
+                r.reporter_user_id,
+                ru.nickname AS reporter_nickname,
+                r.reported_user_id,
+                tu.nickname AS reported_nickname,
+                r.target_type,
+                r.target_id,
+                r.reason,
+                r.status,
+                r.created_at
+            FROM reports r
+            LEFT JOIN users ru ON ru.id = r.reporter_user_id
+            LEFT JOIN users tu ON tu.id = r.reported_user_id
+            WHERE r.status = 'PENDING' {keyset}
+            ORDER BY r.created_at DESC, r.id DESC
+            LIMIT :limit
+        """)
+        .bindparams(*binds)
+        .columns(created_at=DateTime),
+        params,
+    ).mappings().all()
+
+    reports = [dict(r) for r in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(reports[-1]["created_at"], reports[-1]["id"])
+
+    _hydrate_report_targets(db, reports)
+    return {"items": reports, "next_cursor": next_cursor}
+
+
 # ===============================================
 # ✅ 신고 처리 (통합)
 # ===============================================
@@ -117,7 +227,7 @@ def resolve_report(
     db, close = _get_db(db)
     try:
         report = db.execute(text("""
-            SELECT id, reporter_user_id, reported_user_id, target_type, target_id
+            SELECT id, reporter_user_id, reported_user_id, target_type, target_id, status
               FROM reports
              WHERE id = :rid
         """), {"rid": report_id}).mappings().first()
@@ -186,6 +296,8 @@ def resolve_report(
             )
 
         db.commit()
+        if report["status"] == "PENDING":
+            admin_stats.adjust(pending_reports=-1)
         logger.info(f"📢 신고 처리 완료: {report_id}, action={action}")
         return True
     finally:
@@ -193,6 +305,21 @@ def resolve_report(
             db.close()
 
 
+def _claim_report(db: Session, report_id: int, status: str) -> None:
+    """
+    PENDING → status 전환 (commit은 호출 측)
+    - 조건부 UPDATE 로 단건/일괄 처리가 동시에 들어와도 먼저 바꾼 쪽만 진행
+      (이력/알림/대기 신고 카운터가 두 번 반영되지 않음)
+    """
+    claimed = db.execute(
+        text("UPDATE reports SET status=:st WHERE id=:rid AND status='PENDING'"),
+        {"st": status, "rid": report_id},
+    ).rowcount
+    if not claimed:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="이미 처리된 신고입니다.")
+
+
 # ===============================================
 # ✅ 댓글 신고 처리 (RESOLVE + REJECT)
 # ===============================================
@@ -216,7 +343,7 @@ def resolve_user_comment_report(report_id: int, body, admin_id: int, db: Optiona
 
         # ✅ 반려(REJECT)
         if body.comment_action == "REJECT":
-            db.execute(text("UPDATE reports SET status='REJECTED' WHERE id=:rid"), {"rid": report_id})
+            _claim_report(db, report_id, "REJECTED")
 
             msg_id = send_message(
                 sender_id=admin_id,
@@ -237,14 +364,21 @@ def resolve_user_comment_report(report_id: int, body, admin_id: int, db: Optiona
             )
 
             db.commit()
+            admin_stats.adjust(pending_reports=-1)
             logger.info(f"🚫 댓글 신고 반려 완료: report_id={report_id}")
             return True
 
         # ✅ 처리(RESOLVE)
+        _claim_report(db, report_id, "RESOLVED")
+        comment_post_id = db.execute(
+            text("SELECT board_post_id FROM comments WHERE id=:cid"), {"cid": target_id}
+        ).scalar()
         if body.comment_action == "DELETE":
             db.execute(text("DELETE FROM comments WHERE id=:cid"), {"cid": target_id})
         elif body.comment_action == "HIDE":
-            db.execute(text("UPDATE comments SET is_hidden=1 WHERE id=:cid"), {"cid": target_id})
+            db.execute(text("UPDATE comments SET status='HIDDEN' WHERE id=:cid"), {"cid": target_id})
+        if comment_post_id:
+            refresh_comment_count(db, comment_post_id)  # 답글 CASCADE 삭제분 포함
 
         # 제재 로직
         if body.user_action == "WARNING":
@@ -261,8 +395,6 @@ def resolve_user_comment_report(report_id: int, body, admin_id: int, db: Optiona
                  WHERE id=:uid
             """), {"uid": reported_user_id, "d": days})
 
-        db.execute(text("UPDATE reports SET status='RESOLVED' WHERE id=:rid"), {"rid": report_id})
-
         msg_id = send_message(
             sender_id=admin_id,
             receiver_id=reporter_id,
@@ -282,6 +414,7 @@ def resolve_user_comment_report(report_id: int, body, admin_id: int, db: Optiona
         )
 
         db.commit()
+        admin_stats.adjust(pending_reports=-1)
         logger.info(f"🩵 신고 처리 완료: {report_id}")
         return True
     finally:
@@ -313,7 +446,7 @@ def resolve_post_report(report_id: int, body, admin_id: int, db: Optional[Sessio
 
         # ✅ 반려(REJECT)
         if body.post_action == "REJECT":
-            db.execute(text("UPDATE reports SET status='REJECTED' WHERE id=:rid"), {"rid": report_id})
+            _claim_report(db, report_id, "REJECTED")
 
             msg_id = send_message(
                 sender_id=admin_id,
@@ -334,10 +467,12 @@ def resolve_post_report(report_id: int, body, admin_id: int, db: Optional[Sessio
             )
 
             db.commit()
+            admin_stats.adjust(pending_reports=-1)
             logger.info(f"🚫 게시글 신고 반려 완료: {report_id}")
             return True
 
         # ✅ 처리(RESOLVE)
+        _claim_report(db, report_id, "RESOLVED")
         if body.post_action == "DELETE":
             if target_type == "BOARD_POST":
                 db.execute(text("UPDATE board_posts SET status='DELETED' WHERE id=:id"), {"id": target_id})
@@ -360,8 +495,6 @@ def resolve_post_report(report_id: int, body, admin_id: int, db: Optional[Sessio
                      WHERE id=:uid
                 """), {"uid": reported_user_id, "d": days})
 
-        db.execute(text("UPDATE reports SET status='RESOLVED' WHERE id=:rid"), {"rid": report_id})
-
         msg_id = send_message(
             sender_id=admin_id,
             receiver_id=reporter_id,
@@ -381,6 +514,10 @@ def resolve_post_report(report_id: int, body, admin_id: int, db: Optional[Sessio
         )
 
         db.commit()
+        admin_stats.adjust(pending_reports=-1)
+        if body.post_action == "DELETE" and target_type == "POST":
+            post_detail_cache.invalidate(target_id)
+            skill_index.remove_post(target_id)
         logger.info(f"✅ 게시글 신고 및 제재 완료: {report_id}")
         return True
     finally:
@@ -389,15 +526,140 @@ def resolve_post_report(report_id: int, body, admin_id: int, db: Optional[Sessio
 
 
 
+# ===============================================
+# ✅ 동일 대상 신고 일괄 처리 (한 트랜잭션)
+# - 대상 조치 / 작성자 제재는 한 번만
+# - 신고자 알림은 executemany 한 번 (쪽지 발송 생략)
+# ===============================================
+_BAN_DAYS = {"BAN_3DAYS": 3, "BAN_7DAYS": 7, "BAN_PERMANENT": 9999}
+
+# 행 잠금 조회용 (FOR UPDATE 는 지원하는 DB에서만 붙음)
+_reports = table(
+    "reports",
+    column("id"), column("reporter_user_id"), column("reported_user_id"),
+    column("target_type"), column("target_id"), column("status"),
+)
+
+
+def _apply_content_action(db: Session, target_type: str, target_id: int, content_action: str) -> None:
+    if content_action == "NONE":
+        return
+    if target_type == "BOARD_POST":
+        status = "DELETED" if content_action == "DELETE" else "HIDDEN"
+        db.execute(text("UPDATE board_posts SET status=:st WHERE id=:id"), {"st": status, "id": target_id})
+    elif target_type == "COMMENT":
+        comment_post_id = db.execute(
+            text("SELECT board_post_id FROM comments WHERE id=:cid"), {"cid": target_id}
+        ).scalar()
+        if content_action == "DELETE":
+            db.execute(text("DELETE FROM comments WHERE id=:cid"), {"cid": target_id})
+        else:
+            db.execute(text("UPDATE comments SET status='HIDDEN' WHERE id=:cid"), {"cid": target_id})
+        if comment_post_id:
+            refresh_comment_count(db, comment_post_id)
+    elif target_type == "POST":
+        # 모집글은 숨김 상태가 없어 HIDE 도 거절(삭제) 처리
+        db.execute(text("UPDATE posts SET status='REJECTED', deleted_at=NOW() WHERE id=:id"), {"id": target_id})
+
+
+def _apply_user_action(db: Session, user_id: int, admin_id: int, user_action: str, reason: Optional[str]) -> None:
+    if user_action == "WARNING":
+        db.execute(text("""
+            INSERT INTO user_warnings(user_id, admin_id, reason)
+            VALUES (:uid, :aid, :reason)
+        """), {"uid": user_id, "aid": admin_id, "reason": reason or "신고에 따른 경고"})
+    elif user_action in _BAN_DAYS:
+        db.execute(text("""
+            UPDATE users
+               SET status='BANNED',
+                   banned_until=DATE_ADD(UTC_TIMESTAMP(), INTERVAL :d DAY)
+             WHERE id=:uid
+        """), {"uid": user_id, "d": _BAN_DAYS[user_action]})
+
+
+def resolve_reports_for_target(body, admin_id: int, db: Optional[Session] = None) -> dict:
+    """같은 대상의 처리 대기 신고 전체를 한 번에 승낙/반려 → {"processed", "report_ids"}"""
+    if body.action not in {"RESOLVE", "REJECT"}:
+        raise HTTPException(status_code=400, detail="action은 RESOLVE 또는 REJECT 중 하나여야 합니다.")
+    if body.content_action not in {"NONE", "HIDE", "DELETE"}:
+        raise HTTPException(status_code=400, detail="content_action은 NONE / HIDE / DELETE 중 하나여야 합니다.")
+    if body.user_action not in {"NONE", "WARNING", *_BAN_DAYS}:
+        raise HTTPException(status_code=400, detail="허용되지 않는 제재 수준입니다.")
+
+    db, close = _get_db(db)
+    try:
+        # 대기 신고 행 잠금 (SELECT ... FOR UPDATE) → 동시에 단건 처리된 신고는 제외되고,
+        # 여기서 고른 id 만 처리 이력/알림 대상 (중복 알림·이력 방지)
+        reports = db.execute(
+            select(_reports.c.id, _reports.c.reporter_user_id, _reports.c.reported_user_id)
+            .where(
+                _reports.c.target_type == body.target_type,
+                _reports.c.target_id == body.target_id,
+                _reports.c.status == "PENDING",
+            )
+            .order_by(_reports.c.id)
+            .with_for_update()
+        ).mappings().all()
+        if not reports:
+            raise HTTPException(status_code=404, detail="처리 대기 중인 신고가 없습니다.")
+
+        report_ids = [r["id"] for r in reports]
+        status = "RESOLVED" if body.action == "RESOLVE" else "REJECTED"
+        processed = db.execute(
+            text("UPDATE reports SET status=:st WHERE id IN :ids AND status='PENDING'")
+            .bindparams(bindparam("ids", expanding=True)),
+            {"st": status, "ids": report_ids},
+        ).rowcount
+
+        db.execute(
+            text("""
+                INSERT INTO report_actions (report_id, admin_id, action, reason)
+                VALUES (:rid, :aid, :act, :reason)
+            """),
+            [
+                {"rid": rid, "aid": admin_id, "act": body.action, "reason": body.reason or "(사유 없음)"}
+                for rid in report_ids
+            ],
+        )
+
+        if body.action == "RESOLVE":
+            _apply_content_action(db, body.target_type, body.target_id, body.content_action)
+            if body.user_action != "NONE":
+                _apply_user_action(db, reports[0]["reported_user_id"], admin_id, body.user_action, body.reason)
+            type_, message = NotificationType.REPORT_RESOLVED, "신고하신 내용이 처리되었습니다."
+        else:
+            type_, message = NotificationType.REPORT_REJECTED, "신고가 반려되었습니다."
+
+        send_notifications_bulk(
+            db,
+            [{"user_id": r["reporter_user_id"], "message": message, "related_id": r["id"]} for r in reports],
+            type_=type_,
+            category=NotificationCategory.NORMAL,
+        )
+
+        db.commit()
+        admin_stats.adjust(pending_reports=-processed)
+        if body.action == "RESOLVE" and body.target_type == "POST" and body.content_action != "NONE":
+            post_detail_cache.invalidate(body.target_id)
+            skill_index.remove_post(body.target_id)
+        logger.info(
+            f"✅ 신고 일괄 처리 완료: {body.target_type}({body.target_id}) {body.action} {processed}건"
+        )
+        return {"processed": processed, "report_ids": report_ids}
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        if close:
+            db.close()
+
+
 # ===============================================
 # ✅ 관리자 대시보드 통계
 # ===============================================
 def get_admin_stats(db: Session):
-    result = {
-        "pending_posts": db.execute(text("SELECT COUNT(*) FROM posts WHERE status='PENDING'")).scalar() or 0,
-        "pending_reports": db.execute(text("SELECT COUNT(*) FROM reports WHERE status='PENDING'")).scalar() or 0,
-    }
-    return result
+    """인메모리 카운터 (첫 호출 시에만 COUNT 집계, 이후 증감 + 주기 재집계)"""
+    return admin_stats.snapshot(db)
 
 
 # ===============================================
@@ -0,0 +1,95 @@
+# ============================================================
+# 📁 /app/admin/admin_stats.py
+# ------------------------------------------------------------
+# 관리자 대시보드 카운터 인메모리 집계
+# - 승인 대기 게시글 / 처리 대기 신고 수를 메모리에 보관 (대시보드 조회 시 COUNT 없음)
+# - 게시글 등록·승인·거절, 신고 접수·처리 시 commit 이후 증감
+# - 스케줄러 주기적 재집계로 오차 보정 (다른 워커 변경분, 직접 SQL 수정 등)
+# - 값이 바뀌면 접속 중인 관리자 WebSocket 세션에 ADMIN_STATS 전송
+# ============================================================
+
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_COUNT_SQL = {
+    "pending_posts": "SELECT COUNT(*) FROM posts WHERE status='PENDING'",
+    "pending_reports": "SELECT COUNT(*) FROM reports WHERE status='PENDING'",
+}
+
+
+class AdminStats:
+    def __init__(self):
+        self._counts: Dict[str, int] = {key: 0 for key in _COUNT_SQL}
+        self._admin_ids: Set[int] = set()
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """WebSocket 전송용 이벤트 루프 등록 (서버 시작 시)"""
+        self._loop = loop
+
+    def load(self, db: Session) -> Dict[str, int]:
+        """COUNT 재집계 + 관리자 id 갱신 (값이 바뀌었으면 전송)"""
+        counts = {key: int(db.execute(text(sql)).scalar() or 0) for key, sql in _COUNT_SQL.items()}
+        admin_ids = set(db.execute(text("SELECT id FROM users WHERE role='ADMIN'")).scalars())
+        with self._lock:
+            changed = counts != self._counts
+            self._counts = counts
+            self._admin_ids = admin_ids
+            self._loaded = True
+        if changed:
+            self._push(counts)
+        return dict(counts)
+
+    def ensure_loaded(self, db: Session) -> None:
+        if not self._loaded:
+            self.load(db)
+
+    def snapshot(self, db: Session) -> Dict[str, int]:
+        self.ensure_loaded(db)
+        with self._lock:
+            return dict(self._counts)
+
+    def adjust(self, **deltas: int) -> None:
+        """commit 이후 호출 (예: adjust(pending_reports=-1)) / 적재 전이면 무시 (첫 조회 때 집계)"""
+        with self._lock:
+            if not self._loaded:
+                return
+            for key, delta in deltas.items():
+                self._counts[key] = max(0, self._counts[key] + delta)
+            counts = dict(self._counts)
+        self._push(counts)
+
+    # ---------------------------------------------
+    # 📡 관리자 WebSocket 전송
+    # ---------------------------------------------
+    def _push(self, counts: Dict[str, int]) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        from app.notifications.notification_ws_manager import manager
+
+        message = {"type": "ADMIN_STATS", "data": counts}
+        with self._lock:
+            targets = [uid for uid in self._admin_ids if str(uid) in manager.active_connections]
+        for uid in targets:
+            try:
+                # 동기 서비스 코드(스레드풀/스케줄러 스레드)에서 호출 → 서버 루프에 전송 예약
+                asyncio.run_coroutine_threadsafe(manager.send_personal_message(uid, message), loop)
+            except RuntimeError as e:
+                logger.warning(f"⚠️ 관리자 통계 전송 실패 (admin_id={uid}): {e}")
+
+
+admin_stats = AdminStats()
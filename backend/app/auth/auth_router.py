@@ -6,14 +6,15 @@ from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from pydantic import BaseModel
 from datetime import datetime
 import re
-import dns.resolver  # ✅ 추가
 from fastapi.responses import JSONResponse
 
 from app.core.database import get_db
+from app.core import email_utils
 from app.auth import auth_service
 from app.auth.auth_schema import UserRegister
 from app.core.security import verify_token, hash_password
 from app.users.user_model import User, UserStatus
+from app.profile.profile_service import invalidate_profile
 
 # ✅ 추가: 이메일 인증 모듈
 from app.core.email_verifier import (
@@ -66,30 +67,17 @@ class UpdateUserRequest(BaseModel):
 # 🧩 공용 함수: 이메일 도메인 유효성 검사 (DNS MX)
 # ===============================
 def is_valid_email_domain(email: str) -> bool:
-    """📧 입력된 이메일의 도메인 MX 레코드 존재 여부 확인"""
-    try:
-        domain = email.split("@")[1]
-        dns.resolver.resolve(domain, "MX")
-        return True
-    except (
-        IndexError,
-        dns.resolver.NoAnswer,
-        dns.resolver.NXDOMAIN,
-        dns.resolver.NoNameservers,
-        dns.resolver.LifetimeTimeout,
-    ):
-        return False
-    except Exception:
-        return False
+    """📧 입력된 이메일의 도메인 MX 레코드 존재 여부 확인 (email_utils 캐시 공유)"""
+    return email_utils.is_valid_email_domain(email)
 
 
 # ===============================
 # ✅ 이메일 유효성 검증 (DNS MX)
 # ===============================
 @router.get("/verify-email")
-def verify_email(email: str = Query(..., description="확인할 이메일 주소")):
-    """📧 실제 존재하는 이메일 도메인 검증 (DNS MX 조회 기반)"""
-    if not is_valid_email_domain(email):
+async def verify_email(email: str = Query(..., description="확인할 이메일 주소")):
+    """📧 실제 존재하는 이메일 도메인 검증 (DNS MX 조회 기반, 이벤트 루프 비차단)"""
+    if not await email_utils.is_valid_email_domain_async(email):
         return {"valid": False, "message": "존재하지 않는 이메일 주소입니다."}
     return {"valid": True, "message": "유효한 이메일 주소입니다."}
 
@@ -346,6 +334,7 @@ def update_me(
         user.password_hash = hash_password(req.password)
     db.commit()
     db.refresh(user)
+    invalidate_profile(user.id)
     return {"msg": "개인정보가 수정되었습니다."}
 
 
@@ -373,6 +362,7 @@ def delete_account(token: str = Depends(oauth2_scheme), db: Session = Depends(ge
     user.deleted_at = datetime.utcnow()
     user.is_logged_in = False
     db.commit()
+    invalidate_profile(user.id)
     return {"msg": "회원 탈퇴가 완료되었습니다."}
 
 
@@ -499,6 +489,8 @@ def send_verification_email(req: EmailCodeRequest):
     try:
         send_code(req.email)
         return {"message": f"{req.purpose}용 인증 코드가 전송되었습니다."}
+    except HTTPException:
+        raise  # 도메인 오류(400) / 발송 횟수 초과(429) 그대로 전달
     except Exception as e:
         print("이메일 발송 오류:", e)
         raise HTTPException(
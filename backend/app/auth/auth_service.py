@@ -17,6 +17,7 @@ from sqlalchemy.orm import Session
 from app.users.user_model import User, UserStatus
 from app.auth.auth_schema import UserRegister
 from app.profile.profile_model import Profile
+from app.notifications.notification_service import init_unread_counter
 from app.core.security import (
     hash_password,
     verify_password,
@@ -28,6 +29,8 @@ from app.core.security import (
     REFRESH_TOKEN_EXPIRE_DAYS,
 )
 from app.core.database import get_db
+from app.core.cache import TTLCache, MISSING
+from app.auth import oauth_http
 
 # ✅ 추가됨: WebSocket 매니저 import
 from app.notifications.notification_ws_manager import manager
@@ -38,7 +41,7 @@ from app.notifications.notification_ws_manager import manager
 MAX_LOGIN_FAILS = 5
 LOCK_TIME_MINUTES = 15
 RESET_TOKEN_EXPIRE_MINUTES = 30
-HTTP_TIMEOUT = 8
+PROVIDER_METADATA_TTL = 24 * 3600  # OIDC discovery 결과 보관(초)
 
 logger = logging.getLogger(__name__)
 
@@ -84,7 +87,7 @@ def _safe_name(provider: str, default: Optional[str]) -> str:
 
 def _token_exchange(url: str, data: dict) -> dict:
     try:
-        res = requests.post(url, data=data, timeout=HTTP_TIMEOUT)
+        res = oauth_http.get_session().post(url, data=data, timeout=oauth_http.HTTP_TIMEOUT)
         res.raise_for_status()
         return res.json()
     except requests.RequestException as e:
@@ -94,7 +97,7 @@ def _token_exchange(url: str, data: dict) -> dict:
 
 def _get_json(url: str, headers: dict) -> dict:
     try:
-        res = requests.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        res = oauth_http.get_session().get(url, headers=headers, timeout=oauth_http.HTTP_TIMEOUT)
         res.raise_for_status()
         return res.json()
     except requests.RequestException as e:
@@ -198,6 +201,7 @@ def _upsert_social_user(
         profile_image="/assets/profile/default_profile.png",
     )
     db.add(new_profile)
+    init_unread_counter(db, user.id)  # 안 읽은 알림 카운터 행
     db.commit()
 
     return user, True  # 신규 가입자
@@ -264,6 +268,7 @@ def register_user(db: Session, user: UserRegister) -> User:
         profile_image="/assets/profile/default_profile.png",
     )
     db.add(new_profile)
+    init_unread_counter(db, new_user.id)  # 안 읽은 알림 카운터 행
     db.commit()
 
     logger.info("회원가입 성공: id=%s email=%s", new_user.id, new_user.email)
@@ -479,10 +484,12 @@ _PROVIDER_CONFIG: Dict[str, Dict[str, Any]] = {
             "redirect_uri": _provider_redirect_uri("google"),
         },
         "userinfo_url": "https://www.googleapis.com/oauth2/v2/userinfo",
+        "discovery_url": "https://accounts.google.com/.well-known/openid-configuration",
         "extract": lambda data: {
             "email": data.get("email"),
             "name": _safe_name("google", data.get("name")),
-            "social_id": data.get("id"),
+            # v2 userinfo는 id, OIDC userinfo는 sub
+            "social_id": data.get("id") or data.get("sub"),
         },
         "missing_token_msg": "구글 액세스 토큰 없음",
     },
@@ -529,6 +536,51 @@ def get_oauth_login_url(provider: str) -> str:
     return f"{base['auth_url']}?{urlencode(base['params']())}"
 
 
+# provider 메타데이터(엔드포인트) 캐시: discovery 지원 provider만 네트워크 조회
+_provider_metadata_cache = TTLCache(maxsize=16, default_ttl=PROVIDER_METADATA_TTL)
+
+
+def _provider_metadata(provider: str, cfg: Dict[str, Any]) -> Dict[str, str]:
+    """token/userinfo 엔드포인트 (discovery 실패 시 고정값 사용, 실패도 짧게 캐싱)"""
+    cached = _provider_metadata_cache.get(provider)
+    if cached is not MISSING:
+        return cached
+
+    meta = {"token_url": cfg["token_url"], "userinfo_url": cfg["userinfo_url"]}
+    ttl = PROVIDER_METADATA_TTL
+    if cfg.get("discovery_url"):
+        try:
+            doc = _get_json(cfg["discovery_url"], headers={})
+            meta["token_url"] = doc.get("token_endpoint") or meta["token_url"]
+            meta["userinfo_url"] = doc.get("userinfo_endpoint") or meta["userinfo_url"]
+        except ValueError:
+            logger.warning("OIDC discovery 실패 → 기본 엔드포인트 사용: %s", provider)
+            ttl = 300
+    _provider_metadata_cache.set(provider, meta, ttl=ttl)
+    return meta
+
+
+def _fetch_social_profile(provider: str, code: str) -> Dict[str, Optional[str]]:
+    """인가 코드 → 액세스 토큰 교환 → 사용자 정보 조회 (공유 HTTP 세션 사용)"""
+    cfg = _PROVIDER_CONFIG.get(provider)
+    if not cfg:
+        raise ValueError("지원하지 않는 provider입니다.")
+    meta = _provider_metadata(provider, cfg)
+
+    # ✅ 토큰 교환
+    token_json = _token_exchange(meta["token_url"], cfg["token_payload"](code))
+    access_token = token_json.get("access_token")
+    if not access_token:
+        raise ValueError(cfg["missing_token_msg"])
+
+    # ✅ 유저 정보 조회
+    user_info_raw = _get_json(
+        meta["userinfo_url"],
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    return cfg["extract"](user_info_raw)
+
+
 def handle_oauth_callback(db: Session, provider: str, code: str) -> RedirectResponse:
     """
     ✅ 소셜 로그인 콜백 처리
@@ -540,22 +592,7 @@ def handle_oauth_callback(db: Session, provider: str, code: str) -> RedirectResp
     base_redirect = _oauth_base_redirect()
 
     try:
-        cfg = _PROVIDER_CONFIG.get(provider)
-        if not cfg:
-            raise ValueError("지원하지 않는 provider입니다.")
-
-        # ✅ 토큰 교환
-        token_json = _token_exchange(cfg["token_url"], cfg["token_payload"](code))
-        access_token = token_json.get("access_token")
-        if not access_token:
-            raise ValueError(cfg["missing_token_msg"])
-
-        # ✅ 유저 정보 조회
-        user_info_raw = _get_json(
-            cfg["userinfo_url"],
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-        parsed = cfg["extract"](user_info_raw)
+        parsed = _fetch_social_profile(provider, code)
         email = parsed.get("email")
         name = parsed.get("name")
         social_id = parsed.get("social_id")
@@ -1,7 +1,7 @@
 # app/auth/email_verification_router.py
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, EmailStr
-import dns.resolver
+from app.core.email_utils import is_valid_email_domain
 from app.core.email_verifier import send_code, verify_code
 
 router = APIRouter(prefix="/auth/email", tags=["Email Verification"])
@@ -16,10 +16,7 @@ class VerifyReq(BaseModel):
 @router.post("/send-code")
 def send_code_api(req: SendReq):
     """이메일 인증 코드 발송 (DNS MX 도메인 검증 포함)"""
-    domain = req.email.split("@")[1]
-    try:
-        dns.resolver.resolve(domain, "MX")
-    except Exception:
+    if not is_valid_email_domain(req.email):
         raise HTTPException(status_code=400, detail="존재하지 않는 이메일 도메인입니다.")
     send_code(req.email)
     return {"msg": "인증 코드가 전송되었습니다."}
@@ -0,0 +1,121 @@
+# app/auth/oauth_http.py
+# 소셜 로그인(OAuth) 전용 HTTP 클라이언트
+# - requests.Session 1개를 공유해 Kakao/Naver/Google 커넥션(TCP+TLS) 재사용
+# - 연결 타임아웃/읽기 타임아웃 분리 + 안전한 재시도 정책
+# - 테스트용 로컬 스텁 provider (StubOAuthAdapter)
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+CONNECT_TIMEOUT = float(os.getenv("OAUTH_CONNECT_TIMEOUT", "3.05"))
+READ_TIMEOUT = float(os.getenv("OAUTH_READ_TIMEOUT", "8"))
+POOL_MAXSIZE = int(os.getenv("OAUTH_POOL_MAXSIZE", "20"))
+
+# (connect, read) 튜플 → 연결 지연과 응답 지연을 따로 제한
+HTTP_TIMEOUT = (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    # ⚠️ 인가 코드는 1회용 → POST는 연결 실패만 재시도 (응답 후 재전송 금지)
+    retry = Retry(
+        total=2,
+        connect=2,
+        read=1,
+        status=2,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept": "application/json"})
+    return session
+
+
+def get_session() -> requests.Session:
+    """프로세스 공유 세션 (최초 호출 시 생성)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def close_session() -> None:
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+# ===============================
+# 🧪 테스트용 로컬 스텁 provider
+# ===============================
+class StubOAuthAdapter(BaseAdapter):
+    """
+    네트워크 없이 토큰 교환/사용자 정보 조회에 응답하는 어댑터
+    - routes: {"https://host/path": dict 또는 callable(request) -> (status, dict)}
+    - 등록되지 않은 URL은 404
+    """
+
+    def __init__(self, routes: Dict[str, object]):
+        super().__init__()
+        self.routes = routes
+        self.calls = []
+
+    def send(self, request, **kwargs):
+        parsed = urlparse(request.url)
+        key = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        self.calls.append((request.method, key))
+
+        handler = self.routes.get(key)
+        status, payload = 404, {"error": "not_found"}
+        if callable(handler):
+            status, payload = handler(request)
+        elif handler is not None:
+            status, payload = 200, handler
+
+        response = requests.Response()
+        response.status_code = status
+        response.url = request.url
+        response.request = request
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(payload).encode("utf-8")
+        return response
+
+    def close(self):
+        pass
+
+
+def form_body(request) -> Dict[str, str]:
+    """스텁 핸들러에서 x-www-form-urlencoded 본문 파싱"""
+    body = request.body or ""
+    if isinstance(body, bytes):
+        body = body.decode("utf-8")
+    return {k: v[0] for k, v in parse_qs(body).items()}
+
+
+def install_stub(routes: Dict[str, object]) -> StubOAuthAdapter:
+    """공유 세션의 해당 URL들을 스텁으로 교체 (테스트 종료 후 close_session() 호출)"""
+    adapter = StubOAuthAdapter(routes)
+    session = get_session()
+    for url in routes:
+        session.mount(url, adapter)
+    return adapter
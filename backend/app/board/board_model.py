@@ -24,8 +24,11 @@ class ReportStatus(str, enum.Enum):
 
 
 class ReportTarget(str, enum.Enum):
+    POST = "POST"
     BOARD_POST = "BOARD_POST"
     COMMENT = "COMMENT"
+    USER = "USER"
+    MESSAGE = "MESSAGE"
 
 
 # # ===============================
@@ -61,7 +64,6 @@ class BoardPost(Base):
     __tablename__ = "board_posts"
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    board_id = Column(BigInteger, ForeignKey("boards.id"), nullable=True)
     category_id = Column(BigInteger, ForeignKey("categories.id"), nullable=True)
     author_id = Column(BigInteger, ForeignKey("users.id"), nullable=False)
 
@@ -69,12 +71,13 @@ class BoardPost(Base):
     content = Column(Text, nullable=False)
     attachment_url = Column(String(255), nullable=True)
 
-    view_count = Column(Integer, nullable=False, default=0)
-    like_count = Column(Integer, nullable=False, default=0)
+    view_count = Column(Integer, nullable=False, default=0, server_default="0")
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")  # VISIBLE 댓글 수 (작성/삭제 시 증감)
 
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=True, onupdate=func.now())
-    status = Column(Enum(BoardStatus), nullable=False, default=BoardStatus.VISIBLE)
+    status = Column(Enum(BoardStatus), nullable=False, default=BoardStatus.VISIBLE, server_default=BoardStatus.VISIBLE.value)
     deleted_at = Column(DateTime, nullable=True)
 
     # 관계
@@ -131,7 +134,7 @@ class Comment(Base):
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=True, onupdate=func.now())
-    status = Column(Enum(BoardStatus), nullable=False, default=BoardStatus.VISIBLE)
+    status = Column(Enum(BoardStatus), nullable=False, default=BoardStatus.VISIBLE, server_default=BoardStatus.VISIBLE.value)
     deleted_at = Column(DateTime, nullable=True)
 
     board_post = relationship("BoardPost", back_populates="comments")
@@ -14,7 +14,8 @@ from app.board.board_schema import (
     BoardPostCreate,
     BoardPostUpdate,
     CommentCreate,
-    CommentThread,
+    CommentPage,
+    ReplyPage,
     ReportCreate,
 )
 from app.core.database import get_db
@@ -287,8 +288,8 @@ def get_post_detail(
     if not post:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
 
-    comments = svc.list_comments(db, post_id)
-    return {"post": post, "comments": comments}
+    comments = svc.list_comments(db, post_id)  # 첫 페이지만 (이후는 /{post_id}/comments?cursor=)
+    return {"post": post, "comments": comments["items"], "comments_next_cursor": comments["next_cursor"]}
 
 
 # ===============================
@@ -334,9 +335,32 @@ def like_toggle(post_id: int, db: Session = Depends(get_db), me=Depends(get_curr
 # ===============================
 # 💬 댓글 관련
 # ===============================
-@router.get("/{post_id}/comments", response_model=List[CommentThread])
-def get_comments(post_id: int, db: Session = Depends(get_db)):
-    return svc.list_comments(db, post_id)
+@router.get("/{post_id}/comments", response_model=CommentPage)
+def get_comments(
+    post_id: int,
+    limit: int = Query(20, ge=1, le=svc.COMMENT_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: Session = Depends(get_db),
+):
+    """최상위 댓글 페이지 (대댓글은 앞 몇 개 + 전체 수만 포함)"""
+    try:
+        return svc.list_comments(db, post_id, limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+
+@router.get("/comments/{comment_id}/replies", response_model=ReplyPage)
+def get_replies(
+    comment_id: int,
+    limit: int = Query(20, ge=1, le=svc.COMMENT_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="replies_cursor 또는 이전 응답의 next_cursor"),
+    db: Session = Depends(get_db),
+):
+    """대댓글 더보기"""
+    try:
+        return svc.list_replies(db, comment_id, limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
 
 
 @router.post("/{post_id}/comments", status_code=201)
@@ -373,13 +397,16 @@ def update_comment(comment_id: int, payload: CommentCreate, db: Session = Depend
 # ===============================
 @router.post("/reports", status_code=201)
 def report(payload: ReportCreate, db: Session = Depends(get_db), me=Depends(get_current_user)):
-    rid = svc.create_report(
-        db=db,
-        reporter_id=me.id,
-        target_type=payload.target_type,
-        target_id=payload.target_id,
-        reason=payload.reason,
-    )
+    try:
+        rid = svc.create_report(
+            db=db,
+            reporter_id=me.id,
+            target_type=payload.target_type,
+            target_id=payload.target_id,
+            reason=payload.reason,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return {"id": rid, "success": True}
 
 
@@ -450,42 +477,15 @@ def list_posts_simple(
 @router.get("/user/{user_id}/posts")
 def get_user_posts(
     user_id: int,
+    limit: int = Query(20, ge=1, le=svc.USER_LIST_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
     db: Session = Depends(get_db),
 ):
-    """특정 유저가 작성한 게시글 목록 (누구나 조회 가능)"""
-    result = db.execute(text("""
-        SELECT
-            bp.id,
-            bp.title,
-            bp.created_at,
-            bp.view_count,
-            bp.like_count,
-            ct.name AS category,
-            COALESCE(
-                (SELECT COUNT(*) 
-                 FROM comments c 
-                 WHERE c.board_post_id = bp.id 
-                   AND c.status = 'VISIBLE' 
-                   AND c.deleted_at IS NULL), 
-                0
-            ) AS comment_count
-        FROM board_posts bp
-        LEFT JOIN categories ct ON ct.id = bp.category_id
-        WHERE bp.author_id = :user_id
-          AND bp.status = 'VISIBLE'
-          AND bp.deleted_at IS NULL
-        ORDER BY bp.created_at DESC
-    """), {"user_id": user_id}).mappings().all()
-    
-    return [{
-        "id": r["id"],
-        "title": r["title"],
-        "category": r["category"] or "일반",
-        "view_count": r["view_count"] or 0,
-        "like_count": r["like_count"] or 0,
-        "comment_count": r["comment_count"],
-        "created_at": r["created_at"],
-    } for r in result]
+    """특정 유저가 작성한 게시글 목록 (누구나 조회 가능, 최신순 커서 페이지네이션)"""
+    try:
+        return svc.list_user_posts(db, user_id, limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
 
 
 # ===============================
@@ -494,32 +494,19 @@ def get_user_posts(
 @router.get("/user/{user_id}/comments")
 def get_user_comments(
     user_id: int,
+    limit: int = Query(20, ge=1, le=svc.USER_LIST_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    특정 유저가 작성한 댓글 목록
+    특정 유저가 작성한 댓글 목록 (최신순 커서 페이지네이션)
     - 본인 또는 관리자만 조회 가능
     """
     if current_user.id != user_id and current_user.role != "ADMIN":
         raise HTTPException(status_code=403, detail="권한이 없습니다")
 
-    rows = db.execute(
-        text("""
-            SELECT 
-                c.id,
-                c.content,
-                c.created_at,
-                c.board_post_id,
-                bp.title AS post_title
-            FROM comments c
-            JOIN board_posts bp ON c.board_post_id = bp.id
-            WHERE c.user_id = :uid
-              AND c.deleted_at IS NULL
-              AND c.status = 'VISIBLE'
-            ORDER BY c.created_at DESC
-        """),
-        {"uid": user_id}
-    ).mappings().all()
-
-    return [dict(r) for r in rows]
+    try:
+        return svc.list_user_comments(db, user_id, limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
@@ -91,9 +91,21 @@ class CommentItem(BaseModel):
 
 
 class CommentThread(BaseModel):
-    # 단일 depth(댓글 + 대댓글 배열)
+    # 단일 depth(댓글 + 대댓글 미리보기)
     comment: CommentItem
     replies: List[CommentItem]
+    reply_count: int = 0                  # 전체 대댓글 수
+    replies_cursor: Optional[str] = None  # 나머지 대댓글 조회용 (없으면 전부 포함)
+
+
+class CommentPage(BaseModel):
+    items: List[CommentThread]
+    next_cursor: Optional[str] = None
+
+
+class ReplyPage(BaseModel):
+    items: List[CommentItem]
+    next_cursor: Optional[str] = None
 
 
 # 신고
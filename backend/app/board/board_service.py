@@ -12,9 +12,13 @@ from datetime import date
 
 from typing import List, Optional, Tuple, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import text, bindparam, DateTime
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timedelta, timezone, date
 import numpy as np
+from app.files import file_store
+from app.core.pagination import encode_cursor, decode_cursor
+from app.admin.admin_stats import admin_stats
 
 # ─────────────────────────────────────────────────────────
 # 공통 상수/유틸
@@ -583,6 +587,7 @@ def create_post(db: Session, author_id: int, data: Dict[str, Any]) -> int:
             "attachment_url": image_url,  # ✅ 기본 이미지든 직접 업로드든 최종값 저장
         },
     )
+    file_store.add_ref(db, image_url)
     db.commit()
     return res.lastrowid
 
@@ -594,6 +599,11 @@ def update_post(db: Session, post_id: int, author_id: int, data: Dict[str, Any])
     ).first()
     if not own:
         return False
+    if data.get("attachment_url") is not None:
+        old_url = db.execute(
+            text("SELECT attachment_url FROM board_posts WHERE id = :id"), {"id": post_id}
+        ).scalar()
+        file_store.replace_ref(db, old_url, data["attachment_url"])
     sets, params = [], {"id": post_id}
     for k in ("category_id", "title", "content", "attachment_url"):
         if k in data and data[k] is not None:
@@ -679,73 +689,143 @@ def toggle_like(db: Session, post_id: int, user_id: int) -> Tuple[bool, int]:
 # ===============================
 # 💬 댓글 / 대댓글 CRUD + 신고
 # ===============================
-def list_comments(db: Session, post_id: int) -> List[Dict[str, Any]]:
-    parents = db.execute(
-        text("""
-        SELECT c.id, c.user_id, u.nickname, p.profile_image, c.content, c.status, c.created_at
-        FROM comments c
-        JOIN users u ON u.id = c.user_id
-        LEFT JOIN profiles p ON p.id = u.id
-        WHERE c.board_post_id = :pid AND c.parent_id IS NULL
-        ORDER BY c.created_at ASC
-    """),
-        {"pid": post_id},
-    ).mappings().all()
+COMMENT_PAGE_MAX_LIMIT = 50
+REPLY_PREVIEW = 3  # 댓글마다 미리 보여줄 대댓글 수
+
 
-    parent_ids = [r["id"] for r in parents] or [0]
-    replies = db.execute(
+def _comment_item(r, parent_id: Optional[int]) -> Dict[str, Any]:
+    return dict(
+        id=r["id"],
+        user=dict(
+            id=r["user_id"],
+            nickname=r["nickname"],
+            profile_image=r["profile_image"],
+        ),
+        content=(
+            "삭제된 댓글입니다." if r["status"] == "DELETED" else r["content"]
+        ),
+        status=r["status"],
+        created_at=r["created_at"],
+        parent_id=parent_id,
+    )
+
+
+def list_comments(
+    db: Session,
+    post_id: int,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    reply_preview: int = REPLY_PREVIEW,
+) -> Dict[str, Any]:
+    """
+    최상위 댓글 페이지 (오래된 순) + 댓글마다 대댓글 앞 reply_preview 개, 전체 대댓글 수
+    - 한 번의 쿼리: 페이지 CTE → 대댓글 ROW_NUMBER/COUNT 윈도우 → UNION ALL
+    - 나머지 대댓글은 replies_cursor 로 list_replies 호출
+    - 잘못된 커서는 ValueError
+    """
+    limit = max(1, min(limit, COMMENT_PAGE_MAX_LIMIT))
+    params: Dict[str, Any] = {"pid": post_id, "limit": limit + 1, "preview": reply_preview}
+    keyset, binds = "", []
+    if cursor:
+        params["cursor_ts"], params["cursor_id"] = decode_cursor(cursor)
+        keyset = (
+            " AND (c.created_at > :cursor_ts"
+            " OR (c.created_at = :cursor_ts AND c.id > :cursor_id))"
+        )
+        binds.append(bindparam("cursor_ts", type_=DateTime))
+
+    rows = db.execute(
         text(f"""
-        SELECT c.id, c.parent_id, c.user_id, u.nickname, p.profile_image, c.content, c.status, c.created_at
-        FROM comments c
-        JOIN users u ON u.id = c.user_id
-        LEFT JOIN profiles p ON p.id = u.id
-        WHERE c.board_post_id = :pid AND c.parent_id IN ({','.join(map(str, parent_ids))})
-        ORDER BY c.created_at ASC
-    """),
-        {"pid": post_id},
+            WITH page AS (
+                SELECT c.id
+                FROM comments c
+                WHERE c.board_post_id = :pid AND c.parent_id IS NULL{keyset}
+                ORDER BY c.created_at ASC, c.id ASC
+                LIMIT :limit
+            ),
+            ranked AS (
+                SELECT c.id, c.parent_id,
+                       ROW_NUMBER() OVER (PARTITION BY c.parent_id ORDER BY c.created_at, c.id) AS rn,
+                       COUNT(*) OVER (PARTITION BY c.parent_id) AS reply_count
+                FROM comments c
+                JOIN page pg ON pg.id = c.parent_id
+                WHERE c.board_post_id = :pid
+            ),
+            picked AS (
+                SELECT id, NULL AS parent_id, 0 AS rn, 0 AS reply_count FROM page
+                UNION ALL
+                SELECT id, parent_id, rn, reply_count FROM ranked WHERE rn <= :preview
+            )
+            SELECT pk.id, pk.parent_id, pk.reply_count,
+                   c.user_id, u.nickname, p.profile_image, c.content, c.status, c.created_at
+            FROM picked pk
+            JOIN comments c ON c.id = pk.id
+            JOIN users u ON u.id = c.user_id
+            LEFT JOIN profiles p ON p.id = u.id
+            ORDER BY c.created_at ASC, c.id ASC
+        """)
+        .bindparams(*binds)
+        .columns(created_at=DateTime),
+        params,
     ).mappings().all()
 
-    reply_map: Dict[int, List[Dict[str, Any]]] = {}
-    for r in replies:
-        reply_map.setdefault(r["parent_id"], []).append(
-            dict(
-                id=r["id"],
-                user=dict(
-                    id=r["user_id"],
-                    nickname=r["nickname"],
-                    profile_image=r["profile_image"],
-                ),
-                content=(
-                    "삭제된 댓글입니다." if r["status"] == "DELETED" else r["content"]
-                ),
-                status=r["status"],
-                created_at=r["created_at"],
-                parent_id=r["parent_id"],
+    threads: Dict[int, Dict[str, Any]] = {}
+    replies: List[Any] = []
+    for r in rows:
+        if r["parent_id"] is None:
+            threads[r["id"]] = dict(
+                comment=_comment_item(r, None),
+                replies=[],
+                reply_count=0,
+                replies_cursor=None,
             )
-        )
+        else:
+            replies.append(r)
 
-    threads = []
-    for r in parents:
-        threads.append(
-            dict(
-                comment=dict(
-                    id=r["id"],
-                    user=dict(
-                        id=r["user_id"],
-                        nickname=r["nickname"],
-                        profile_image=r["profile_image"],
-                    ),
-                    content=(
-                        "삭제된 댓글입니다." if r["status"] == "DELETED" else r["content"]
-                    ),
-                    status=r["status"],
-                    created_at=r["created_at"],
-                    parent_id=None,
-                ),
-                replies=reply_map.get(r["id"], []),
-            )
-        )
-    return threads
+    order = list(threads)  # 최상위 댓글은 정렬 순서대로 들어옴
+    next_cursor = None
+    if len(order) > limit:
+        del threads[order[limit]]
+        order = order[:limit]
+        last = threads[order[-1]]["comment"]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+
+    for r in replies:
+        thread = threads.get(r["parent_id"])
+        if thread is None:
+            continue  # limit+1 번째(다음 페이지) 댓글의 대댓글
+        thread["replies"].append(_comment_item(r, r["parent_id"]))
+        thread["reply_count"] = r["reply_count"]
+
+    for thread in threads.values():
+        shown = thread["replies"]
+        if thread["reply_count"] > len(shown):
+            thread["replies_cursor"] = encode_cursor(shown[-1]["created_at"], shown[-1]["id"])
+
+    return {"items": [threads[cid] for cid in order], "next_cursor": next_cursor}
+
+
+def list_replies(
+    db: Session, parent_id: int, limit: int = 20, cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """대댓글 더보기 (오래된 순 커서 페이지네이션, 잘못된 커서는 ValueError)"""
+    limit = max(1, min(limit, COMMENT_PAGE_MAX_LIMIT))
+    rows, next_cursor = _keyset_page(
+        db,
+        """
+        SELECT c.id, c.parent_id, c.user_id, u.nickname, p.profile_image, c.content, c.status, c.created_at
+        FROM comments c
+        JOIN users u ON u.id = c.user_id
+        LEFT JOIN profiles p ON p.id = u.id
+        WHERE c.parent_id = :parent_id{keyset}
+        """,
+        {"parent_id": parent_id},
+        limit,
+        cursor,
+        "c",
+        ascending=True,
+    )
+    return {"items": [_comment_item(r, r["parent_id"]) for r in rows], "next_cursor": next_cursor}
 
 
 def create_comment(db: Session, post_id: int, user_id: int, content: str, parent_id: Optional[int]) -> int:
@@ -762,6 +842,10 @@ def create_comment(db: Session, post_id: int, user_id: int, content: str, parent
         ),
         {"pid": post_id, "uid": user_id, "parent_id": parent_id, "content": content},
     )
+    db.execute(
+        text("UPDATE board_posts SET comment_count = comment_count + 1 WHERE id = :pid"),
+        {"pid": post_id},
+    )
     db.commit()
     return res.lastrowid
 
@@ -788,20 +872,44 @@ def delete_comment(db: Session, comment_id: int, user_id: int) -> bool:
     if not (is_comment_author or is_post_author):
         return False
 
-    db.execute(
+    deleted = db.execute(
         text("""
             UPDATE comments
             SET status='DELETED',
                 content='삭제된 댓글입니다.',
                 deleted_at=NOW()
-            WHERE id=:cid
+            WHERE id=:cid AND status='VISIBLE'
         """),
         {"cid": comment_id},
-    )
+    ).rowcount
+    if deleted:
+        db.execute(
+            text("""
+                UPDATE board_posts
+                SET comment_count = CASE WHEN comment_count > 0 THEN comment_count - 1 ELSE 0 END
+                WHERE id = :pid
+            """),
+            {"pid": own["board_post_id"]},
+        )
     db.commit()
     return True
 
 
+def refresh_comment_count(db: Session, post_id: int) -> None:
+    """댓글 일괄 변경(관리자 삭제/숨김 등) 후 해당 게시글 댓글 수 재계산 (commit은 호출 측)"""
+    db.execute(
+        text("""
+            UPDATE board_posts
+            SET comment_count = (
+                SELECT COUNT(*) FROM comments
+                WHERE board_post_id = :pid AND status = 'VISIBLE'
+            )
+            WHERE id = :pid
+        """),
+        {"pid": post_id},
+    )
+
+
 def update_comment(db: Session, comment_id: int, user_id: int, content: str) -> bool:
     if not content or not content.strip():
         return False
@@ -819,6 +927,96 @@ def update_comment(db: Session, comment_id: int, user_id: int, content: str) ->
     db.commit()
     return True
 
+# ============================================================
+# 👤 프로필 탭: 유저별 게시글 / 댓글 (커서 페이지네이션)
+# - (author_id, status, created_at) / (user_id, status, created_at) 인덱스 순서 그대로 조회
+# - 댓글 수는 board_posts.comment_count 사용 (행마다 COUNT 서브쿼리 없음)
+# ============================================================
+USER_LIST_MAX_LIMIT = 50
+
+
+def _keyset_page(
+    db: Session,
+    sql: str,
+    params: Dict[str, Any],
+    limit: int,
+    cursor: Optional[str],
+    alias: str,
+    ascending: bool = False,
+):
+    """(created_at, id) keyset 페이지 (기본 최신순) → (rows, next_cursor) / 잘못된 커서는 ValueError"""
+    op, direction = (">", "ASC") if ascending else ("<", "DESC")
+    keyset, binds = "", []
+    if cursor:
+        params["cursor_ts"], params["cursor_id"] = decode_cursor(cursor)
+        keyset = (
+            f" AND ({alias}.created_at {op} :cursor_ts"
+            f" OR ({alias}.created_at = :cursor_ts AND {alias}.id {op} :cursor_id))"
+        )
+        binds.append(bindparam("cursor_ts", type_=DateTime))
+    stmt = (
+        text(sql.format(keyset=keyset) + f" ORDER BY {alias}.created_at {direction}, {alias}.id {direction} LIMIT :limit")
+        .bindparams(*binds)
+        .columns(created_at=DateTime)
+    )
+    rows = db.execute(stmt, {**params, "limit": limit + 1}).mappings().all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+    return rows, next_cursor
+
+
+def list_user_posts(db: Session, author_id: int, limit: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+    limit = max(1, min(limit, USER_LIST_MAX_LIMIT))
+    rows, next_cursor = _keyset_page(
+        db,
+        """
+        SELECT bp.id, bp.title, bp.created_at, bp.view_count, bp.like_count, bp.comment_count,
+               ct.name AS category
+        FROM board_posts bp
+        LEFT JOIN categories ct ON ct.id = bp.category_id
+        WHERE bp.author_id = :author_id
+          AND bp.status = 'VISIBLE'
+          AND bp.deleted_at IS NULL{keyset}
+        """,
+        {"author_id": author_id},
+        limit,
+        cursor,
+        "bp",
+    )
+    items = [{
+        "id": r["id"],
+        "title": r["title"],
+        "category": r["category"] or "일반",
+        "view_count": r["view_count"] or 0,
+        "like_count": r["like_count"] or 0,
+        "comment_count": r["comment_count"] or 0,
+        "created_at": r["created_at"],
+    } for r in rows]
+    return {"items": items, "next_cursor": next_cursor}
+
+
+def list_user_comments(db: Session, user_id: int, limit: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+    limit = max(1, min(limit, USER_LIST_MAX_LIMIT))
+    rows, next_cursor = _keyset_page(
+        db,
+        """
+        SELECT c.id, c.content, c.created_at, c.board_post_id, bp.title AS post_title
+        FROM comments c
+        JOIN board_posts bp ON c.board_post_id = bp.id
+        WHERE c.user_id = :uid
+          AND c.status = 'VISIBLE'
+          AND c.deleted_at IS NULL{keyset}
+        """,
+        {"uid": user_id},
+        limit,
+        cursor,
+        "c",
+    )
+    return {"items": [dict(r) for r in rows], "next_cursor": next_cursor}
+
+
 def create_report(
     db: Session, reporter_id: int, target_type: str, target_id: int, reason: str
 ) -> int:
@@ -835,19 +1033,24 @@ def create_report(
     if not row:
         raise ValueError("신고 대상이 존재하지 않습니다.")
 
-    res = db.execute(
-        text(
-            "INSERT INTO reports (reported_user_id, reporter_user_id, target_type, target_id, reason) VALUES (:reported, :reporter, :tt, :tid, :reason)"
-        ),
-        {
-            "reported": row["uid"],
-            "reporter": reporter_id,
-            "tt": target_type,
-            "tid": target_id,
-            "reason": reason,
-        },
-    )
+    try:
+        res = db.execute(
+            text(
+                "INSERT INTO reports (reported_user_id, reporter_user_id, target_type, target_id, reason) VALUES (:reported, :reporter, :tt, :tid, :reason)"
+            ),
+            {
+                "reported": row["uid"],
+                "reporter": reporter_id,
+                "tt": target_type,
+                "tid": target_id,
+                "reason": reason,
+            },
+        )
+    except IntegrityError:  # UNIQUE(reporter_user_id, target_type, target_id)
+        db.rollback()
+        raise ValueError("이미 신고한 대상입니다.")
     db.commit()
+    admin_stats.adjust(pending_reports=1)
 
     # ✅ 신고 접수 시 관리자 알림 트리거
     from app.events.events import on_report_created
@@ -0,0 +1,71 @@
+# app/core/cache.py
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+# 캐시 미스 표시용 (None 값도 캐싱할 수 있도록 별도 센티널 사용)
+MISSING = object()
+
+
+class TTLCache:
+    """
+    ✅ 프로세스 로컬 TTL + LRU 캐시 (thread-safe)
+    - 항목별 TTL 지정 가능 (미지정 시 default_ttl)
+    - maxsize 초과 시 가장 오래 사용되지 않은 항목부터 제거
+    - get() 시 만료된 항목은 즉시 제거
+    """
+
+    def __init__(self, maxsize: int = 1024, default_ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._data: "OrderedDict[Hashable, tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """키 조회 (없거나 만료되면 default 반환)"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expire_at = item
+            if expire_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """키 저장 (ttl <= 0 이면 저장하지 않음)"""
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def purge_expired(self) -> int:
+        """만료 항목 일괄 제거 (제거된 개수 반환)"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, (_, exp) in self._data.items() if exp <= now]
+            for k in expired:
+                del self._data[k]
+            return len(expired)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not MISSING
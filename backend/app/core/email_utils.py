@@ -1,8 +1,11 @@
 # app/core/email_utils.py
 import os
+import asyncio
 import smtplib
+from typing import Callable, Optional, Tuple
 from email.mime.text import MIMEText
 import dns.resolver  # ✅ 추가: 도메인 검증용
+from app.core.cache import TTLCache, MISSING
 
 EMAIL_MODE = os.getenv("EMAIL_MODE", "dev")
 SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
@@ -44,28 +47,118 @@ def send_email_smtp(to_email: str, subject: str, body: str) -> None:
         raise ValueError("이메일 전송 처리 중 문제가 발생했습니다. (관리자 확인 필요)")
 
 
-# ✅ 추가: 이메일 도메인 유효성 검사 함수
+# ===============================
+# ✅ 이메일 도메인 MX 검증 (TTL 캐시 + 허용 목록)
+# ===============================
+# 자주 쓰이는 메일 도메인은 DNS 조회 없이 통과
+KNOWN_EMAIL_DOMAINS = frozenset(
+    {
+        "gmail.com",
+        "naver.com",
+        "daum.net",
+        "hanmail.net",
+        "kakao.com",
+        "nate.com",
+        "outlook.com",
+        "hotmail.com",
+        "yahoo.com",
+        "icloud.com",
+    }
+    | {
+        d.strip().lower()
+        for d in os.getenv("EMAIL_DOMAIN_ALLOWLIST", "").split(",")
+        if d.strip()
+    }
+)
+
+MX_CACHE_MAX_TTL = int(os.getenv("MX_CACHE_MAX_TTL", "3600"))  # 양성 결과 최대 보관(초)
+MX_NEGATIVE_TTL = int(os.getenv("MX_NEGATIVE_TTL", "300"))  # 음성 결과 보관(초)
+MX_LOOKUP_TIMEOUT = float(os.getenv("MX_LOOKUP_TIMEOUT", "3"))
+
+_mx_cache = TTLCache(maxsize=4096, default_ttl=MX_NEGATIVE_TTL)
+
+# resolver(domain) -> (MX 존재 여부, TTL 초) / None 이면 일시적 오류(캐싱 안 함)
+MxResolver = Callable[[str], Optional[Tuple[bool, int]]]
+
+
+def _dns_mx_resolver(domain: str) -> Optional[Tuple[bool, int]]:
+    """dnspython 기반 기본 MX 조회"""
+    try:
+        answers = dns.resolver.resolve(domain, "MX", lifetime=MX_LOOKUP_TIMEOUT)
+        ttl = answers.rrset.ttl if answers.rrset is not None else MX_NEGATIVE_TTL
+        return len(answers) > 0, ttl
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+        return False, MX_NEGATIVE_TTL
+    except (dns.resolver.NoNameservers, dns.resolver.LifetimeTimeout) as e:
+        print(f"[EMAIL CHECK] ⚠️ DNS 조회 실패(캐싱 안 함): {domain}, {e}")
+        return None
+
+
+_mx_resolver: MxResolver = _dns_mx_resolver
+
+
+def set_mx_resolver(resolver: Optional[MxResolver]) -> None:
+    """MX 조회 함수 교체 (테스트용 오프라인 resolver 주입, None 이면 기본값 복원)"""
+    global _mx_resolver
+    _mx_resolver = resolver or _dns_mx_resolver
+    _mx_cache.clear()
+
+
+def _extract_domain(email: str) -> Optional[str]:
+    if not email or "@" not in email:
+        return None
+    domain = email.rsplit("@", 1)[-1].strip().lower().rstrip(".")
+    if not domain or "." not in domain:
+        return None
+    return domain
+
+
+def _cached_domain_result(domain: str):
+    """허용 목록/캐시 조회 (결과 없으면 MISSING)"""
+    if domain in KNOWN_EMAIL_DOMAINS:
+        return True
+    return _mx_cache.get(domain)
+
+
+def _lookup_and_cache(domain: str) -> bool:
+    try:
+        result = _mx_resolver(domain)
+    except Exception as e:
+        print(f"[EMAIL CHECK] ⚠️ 도메인 확인 중 오류: {domain}, {e}")
+        return False
+    if result is None:
+        return False
+
+    valid, ttl = result
+    ttl = min(ttl, MX_CACHE_MAX_TTL) if valid else min(ttl, MX_NEGATIVE_TTL)
+    _mx_cache.set(domain, valid, ttl=ttl)
+    print(f"[EMAIL CHECK] {'✅ 유효한 도메인' if valid else '❌ MX 레코드 없음'}: {domain}")
+    return valid
+
+
 def is_valid_email_domain(email: str) -> bool:
     """
     이메일 도메인 유효성 검사 (MX 레코드 존재 여부 확인)
-    예: test@gmail.com → gmail.com MX 조회
+    예: test@gmail.com → 허용 목록 통과 / 그 외 도메인은 MX 조회 후 TTL 동안 캐싱
     """
-    try:
-        domain = email.split("@")[-1]
-        if not domain or "." not in domain:
-            print(f"[EMAIL CHECK] ❌ 잘못된 이메일 형식: {email}")
-            return False
-
-        answers = dns.resolver.resolve(domain, "MX")
-        if len(answers) > 0:
-            print(f"[EMAIL CHECK] ✅ 유효한 도메인: {domain}")
-            return True
-        else:
-            print(f"[EMAIL CHECK] ❌ MX 레코드 없음: {domain}")
-            return False
-    except dns.resolver.NXDOMAIN:
-        print(f"[EMAIL CHECK] ❌ 존재하지 않는 도메인: {email}")
+    domain = _extract_domain(email)
+    if not domain:
+        print(f"[EMAIL CHECK] ❌ 잘못된 이메일 형식: {email}")
         return False
-    except Exception as e:
-        print(f"[EMAIL CHECK] ⚠️ 도메인 확인 중 오류: {email}, {e}")
+
+    cached = _cached_domain_result(domain)
+    if cached is not MISSING:
+        return cached
+    return _lookup_and_cache(domain)
+
+
+async def is_valid_email_domain_async(email: str) -> bool:
+    """비동기 버전: 캐시 적중 시 즉시 반환, 미스일 때만 스레드에서 DNS 조회"""
+    domain = _extract_domain(email)
+    if not domain:
         return False
+
+    cached = _cached_domain_result(domain)
+    if cached is not MISSING:
+        return cached
+    return await asyncio.to_thread(_lookup_and_cache, domain)
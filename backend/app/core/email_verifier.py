@@ -2,13 +2,18 @@
 import os
 import time
 import secrets
-from typing import Dict, Tuple, Optional
 from fastapi import HTTPException  # ✅ 추가
 from .email_utils import send_email_smtp, is_valid_email_domain  # ✅ 도메인 검증 함수 import
+from .verification_store import (
+    CodeRecord,
+    VerificationCodeStore,
+    create_store,
+    RATE_LIMIT,
+    RATE_WINDOW_SEC,
+)
 
-# 메모리 저장소 (개발용). 배포 시 Redis/DB 권장
-_store: Dict[str, Tuple[str, float, bool]] = {}
-# value: (code, expire_ts, verified)
+# 저장소: EMAIL_CODE_STORE=memory(기본, 단일 프로세스) / db(멀티 워커 공유)
+_store: VerificationCodeStore = create_store()
 
 EXPIRE_MIN = int(os.getenv("EMAIL_CODE_EXPIRE_MINUTES", "5"))
 SKIP = os.getenv("SKIP_EMAIL_VERIFICATION", "False") == "True"
@@ -22,6 +27,12 @@ def _gen_code() -> str:
     return f"{secrets.randbelow(1_000_000):06d}"
 
 
+def set_store(store: VerificationCodeStore) -> None:
+    """저장소 교체 (테스트/운영 설정용)"""
+    global _store
+    _store = store
+
+
 def send_code(email: str) -> None:
     """인증 코드 생성+저장 후 메일(또는 콘솔) 발송"""
     try:
@@ -30,9 +41,17 @@ def send_code(email: str) -> None:
             print(f"[email_verifier] 유효하지 않은 이메일 도메인: {email}")
             raise HTTPException(status_code=400, detail="존재하지 않는 이메일 도메인입니다.")
 
+        # ✅ 이메일별 발송 횟수 제한
+        if not _store.hit_send(email.lower(), RATE_WINDOW_SEC, RATE_LIMIT):
+            print(f"[email_verifier] 발송 횟수 초과: {email}")
+            raise HTTPException(
+                status_code=429,
+                detail="인증 코드 요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+            )
+
         code = _gen_code()
         expire = _now() + EXPIRE_MIN * 60
-        _store[email.lower()] = (code, expire, False)
+        _store.put(email.lower(), CodeRecord(code, expire, False))
 
         # ✅ SMTP 메일 발송
         send_email_smtp(
@@ -42,16 +61,19 @@ def send_code(email: str) -> None:
         )
         print(f"[email_verifier] 인증 코드 발송 완료: {email} → {code}")
 
+    except HTTPException:
+        raise
+
     except ValueError as e:
         # ✅ 이메일 전송 실패 (SMTP 오류 등)
         print(f"[email_verifier] 이메일 발송 실패: {email}, 오류: {e}")
-        _store.pop(email.lower(), None)  # 실패 시 저장된 코드 제거
+        _store.delete(email.lower())  # 실패 시 저장된 코드 제거
         raise HTTPException(status_code=400, detail=str(e))
 
     except Exception as e:
         # ✅ 예기치 못한 오류 처리
         print(f"[email_verifier] 이메일 발송 중 알 수 없는 오류: {email}, 오류: {e}")
-        _store.pop(email.lower(), None)
+        _store.delete(email.lower())
         raise HTTPException(status_code=500, detail="이메일 발송 중 서버 오류가 발생했습니다.")
 
 
@@ -67,7 +89,7 @@ def verify_code(email: str, code: str) -> bool:
 
         # ✅ 만료 확인
         if _now() > expire:
-            _store.pop(email.lower(), None)
+            _store.delete(email.lower())
             print(f"[email_verifier] 코드 만료됨: {email}")
             return False
 
@@ -77,7 +99,7 @@ def verify_code(email: str, code: str) -> bool:
             return False
 
         # ✅ 인증 완료 처리
-        _store[email.lower()] = (saved, expire, True)
+        _store.put(email.lower(), CodeRecord(saved, expire, True))
         print(f"[email_verifier] 인증 성공: {email}")
         return True
     except Exception as e:
@@ -100,7 +122,7 @@ def is_verified(email: str) -> bool:
 
         # ✅ 만료 시 자동 제거
         if _now() > expire:
-            _store.pop(email.lower(), None)
+            _store.delete(email.lower())
             print(f"[email_verifier] 인증 만료됨: {email}")
             return False
 
@@ -0,0 +1,22 @@
+# app/core/http_cache.py
+# HTTP 조건부 GET 공용 (ETag / If-None-Match → 304)
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(쉼표 구분 목록, W/ 접두사, *) 비교"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def conditional_json(payload: Any, etag: str, if_none_match: Optional[str], cache_control: str) -> Response:
+    """ETag 일치 → 304 (본문 없음) / 아니면 JSON + ETag·Cache-Control"""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=payload, headers=headers)
@@ -0,0 +1,20 @@
+# app/core/pagination.py
+# keyset(커서) 페이지네이션 공용 커서: (정렬 시각, id) → URL-safe base64 문자열
+import base64
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(sort_at: datetime, row_id: int) -> str:
+    raw = f"{sort_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """잘못된 커서는 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        sort_at, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(sort_at), int(row_id)
+    except Exception as e:
+        raise ValueError("invalid cursor") from e
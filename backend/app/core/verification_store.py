@@ -0,0 +1,285 @@
+# app/core/verification_store.py
+import os
+import time
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+
+class CodeRecord(NamedTuple):
+    code: str
+    expire_ts: float
+    verified: bool
+
+
+def _now() -> float:
+    return time.time()
+
+
+# ===============================
+# 🧩 공통 인터페이스
+# ===============================
+class VerificationCodeStore(ABC):
+    """
+    이메일 인증 코드 저장소 인터페이스
+    - 키는 항상 소문자 이메일
+    - hit_send()는 고정 윈도우 방식의 이메일별 발송 횟수 제한
+    """
+
+    @abstractmethod
+    def get(self, email: str) -> Optional[CodeRecord]:
+        ...
+
+    @abstractmethod
+    def put(self, email: str, record: CodeRecord) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, email: str) -> None:
+        ...
+
+    @abstractmethod
+    def hit_send(self, email: str, window_sec: int, limit: int) -> bool:
+        """발송 1회 기록 후 허용 여부 반환 (윈도우 내 limit 초과 시 False)"""
+
+    @abstractmethod
+    def sweep(self) -> int:
+        """만료된 항목 정리 (정리된 개수 반환)"""
+
+
+# ===============================
+# 🧠 메모리 저장소 (단일 프로세스용)
+# ===============================
+class InMemoryCodeStore(VerificationCodeStore):
+    """
+    프로세스 로컬 저장소
+    - 만료 시각을 초 단위 버킷(타이밍 휠)에 등록 → sweep 시 지난 버킷만 확인
+    - 쓰기 요청 시 sweep_interval 마다 자동 정리 (별도 스레드 불필요)
+    """
+
+    def __init__(self, sweep_interval: float = 60.0, resolution: int = 10):
+        self._codes: Dict[str, CodeRecord] = {}
+        self._sends: Dict[str, Tuple[float, int]] = {}  # email → (윈도우 만료, 횟수)
+        self._wheel: Dict[int, Set[str]] = {}
+        self._resolution = resolution
+        self._sweep_interval = sweep_interval
+        self._last_sweep = _now()
+        self._lock = threading.Lock()
+
+    def _schedule(self, email: str, expire_ts: float) -> None:
+        self._wheel.setdefault(int(expire_ts // self._resolution), set()).add(email)
+
+    def _maybe_sweep(self) -> None:
+        if _now() - self._last_sweep >= self._sweep_interval:
+            self._sweep_locked()
+
+    def _sweep_locked(self) -> int:
+        now = _now()
+        self._last_sweep = now
+        current = int(now // self._resolution)
+        removed = 0
+        for bucket in [b for b in self._wheel if b < current]:
+            for email in self._wheel.pop(bucket):
+                rec = self._codes.get(email)
+                if rec and rec.expire_ts <= now:
+                    del self._codes[email]
+                    removed += 1
+                window = self._sends.get(email)
+                if window and window[0] <= now:
+                    del self._sends[email]
+                # 아직 살아있는 항목은 자신의 만료 버킷에 이미 재등록되어 있음
+        return removed
+
+    def get(self, email: str) -> Optional[CodeRecord]:
+        with self._lock:
+            return self._codes.get(email)
+
+    def put(self, email: str, record: CodeRecord) -> None:
+        with self._lock:
+            self._codes[email] = record
+            self._schedule(email, record.expire_ts)
+            self._maybe_sweep()
+
+    def delete(self, email: str) -> None:
+        with self._lock:
+            self._codes.pop(email, None)
+
+    def hit_send(self, email: str, window_sec: int, limit: int) -> bool:
+        now = _now()
+        with self._lock:
+            window_end, count = self._sends.get(email, (0.0, 0))
+            if window_end <= now:
+                window_end, count = now + window_sec, 0
+                self._schedule(email, window_end)
+            if count >= limit:
+                return False
+            self._sends[email] = (window_end, count + 1)
+            return True
+
+    def sweep(self) -> int:
+        with self._lock:
+            return self._sweep_locked()
+
+
+# ===============================
+# 🗄️ DB 저장소 (멀티 워커 공유)
+# ===============================
+class DatabaseCodeStore(VerificationCodeStore):
+    """
+    email_verification_codes 테이블 기반 저장소
+    - uvicorn 워커 여러 개가 같은 코드를 공유
+    - sweep_interval 마다 만료 행 일괄 삭제
+    """
+
+    def __init__(self, sweep_interval: float = 300.0):
+        self._sweep_interval = sweep_interval
+        self._last_sweep = _now()
+
+    @staticmethod
+    def _session():
+        from app.core.database import SessionLocal  # 메모리 모드에선 DB 설정 불필요
+
+        return SessionLocal()
+
+    def _maybe_sweep(self) -> None:
+        if _now() - self._last_sweep >= self._sweep_interval:
+            self.sweep()
+
+    def get(self, email: str) -> Optional[CodeRecord]:
+        db = self._session()
+        try:
+            row = db.execute(
+                text("""
+                    SELECT code, expires_at, verified
+                    FROM email_verification_codes
+                    WHERE email = :email AND code IS NOT NULL
+                """),
+                {"email": email},
+            ).mappings().first()
+        finally:
+            db.close()
+        if not row:
+            return None
+        expire_ts = row["expires_at"].replace(tzinfo=None)
+        return CodeRecord(
+            row["code"],
+            (expire_ts - datetime(1970, 1, 1)).total_seconds(),
+            bool(row["verified"]),
+        )
+
+    def put(self, email: str, record: CodeRecord) -> None:
+        db = self._session()
+        try:
+            db.execute(
+                text("""
+                    INSERT INTO email_verification_codes (email, code, expires_at, verified)
+                    VALUES (:email, :code, :expires_at, :verified)
+                    ON DUPLICATE KEY UPDATE
+                        code = VALUES(code),
+                        expires_at = VALUES(expires_at),
+                        verified = VALUES(verified)
+                """),
+                {
+                    "email": email,
+                    "code": record.code,
+                    "expires_at": datetime.utcfromtimestamp(record.expire_ts),
+                    "verified": record.verified,
+                },
+            )
+            db.commit()
+        finally:
+            db.close()
+        self._maybe_sweep()
+
+    def delete(self, email: str) -> None:
+        db = self._session()
+        try:
+            db.execute(
+                text("""
+                    UPDATE email_verification_codes
+                    SET code = NULL, verified = FALSE
+                    WHERE email = :email
+                """),
+                {"email": email},
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def hit_send(self, email: str, window_sec: int, limit: int) -> bool:
+        now = datetime.utcnow()
+        db = self._session()
+        try:
+            # 행이 없으면 생성 후 FOR UPDATE 로 워커 간 경쟁 방지
+            db.execute(
+                text("""
+                    INSERT IGNORE INTO email_verification_codes
+                        (email, expires_at, window_started_at, send_count)
+                    VALUES (:email, :now, :now, 0)
+                """),
+                {"email": email, "now": now},
+            )
+            row = db.execute(
+                text("""
+                    SELECT window_started_at, send_count
+                    FROM email_verification_codes
+                    WHERE email = :email
+                    FOR UPDATE
+                """),
+                {"email": email},
+            ).mappings().first()
+
+            started = row["window_started_at"]
+            count = row["send_count"]
+            if (now - started).total_seconds() >= window_sec:
+                started, count = now, 0
+            if count >= limit:
+                db.rollback()
+                return False
+
+            db.execute(
+                text("""
+                    UPDATE email_verification_codes
+                    SET window_started_at = :started, send_count = :count
+                    WHERE email = :email
+                """),
+                {"email": email, "started": started, "count": count + 1},
+            )
+            db.commit()
+            return True
+        finally:
+            db.close()
+
+    def sweep(self) -> int:
+        self._last_sweep = _now()
+        db = self._session()
+        try:
+            result = db.execute(
+                text("""
+                    DELETE FROM email_verification_codes
+                    WHERE expires_at < UTC_TIMESTAMP()
+                      AND window_started_at < UTC_TIMESTAMP() - INTERVAL :window SECOND
+                """),
+                {"window": RATE_WINDOW_SEC},
+            )
+            db.commit()
+            return result.rowcount or 0
+        finally:
+            db.close()
+
+
+# ===============================
+# ⚙️ 저장소 선택
+# ===============================
+RATE_WINDOW_SEC = int(os.getenv("EMAIL_CODE_RATE_WINDOW_SEC", "600"))
+RATE_LIMIT = int(os.getenv("EMAIL_CODE_RATE_LIMIT", "5"))
+STORE_BACKEND = os.getenv("EMAIL_CODE_STORE", "memory")  # memory / db
+
+
+def create_store(backend: str = STORE_BACKEND) -> VerificationCodeStore:
+    if backend == "db":
+        return DatabaseCodeStore()
+    return InMemoryCodeStore()
@@ -0,0 +1,31 @@
+# app/files/file_scheduler.py
+from sqlalchemy.orm import Session
+from app.core.database import SessionLocal
+from app.board.hot3_scheduler import scheduler  # ✅ 스케줄러 인스턴스 공유
+from app.files.file_store import collect_garbage
+
+
+def collect_unused_files():
+    """매일 새벽: 참조 수 재집계 후 참조 없는 업로드 파일 삭제"""
+    db: Session = SessionLocal()
+    try:
+        result = collect_garbage(db)
+        print(f"✅ [SCHEDULER] 업로드 파일 정리 완료: {result}")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ [SCHEDULER] 업로드 파일 정리 실패: {e}")
+    finally:
+        db.close()
+
+
+def start_file_jobs():
+    """hot3 스케줄러에 업로드 파일 GC 작업 등록"""
+    scheduler.add_job(
+        collect_unused_files,
+        "cron",
+        hour=4,
+        minute=30,
+        id="file_gc",
+        replace_existing=True,
+    )
+    print("⏰ 업로드 파일 정리(매일 4시 30분) 스케줄러 등록")
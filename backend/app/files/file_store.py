@@ -0,0 +1,236 @@
+# app/files/file_store.py
+# 콘텐츠 주소 기반 업로드 저장소 (files 테이블 = sha256 인덱스)
+# - 경로: uploads/{종류}/ab/cd/{sha256}{ext} (폴더당 파일 수 분산)
+# - 같은 내용은 한 번만 저장 → 기존 file_url 재사용 (샤딩 이전 평면 경로 포함)
+# - ref_count: 게시글/프로필/게시판 이미지 URL 참조 수
+#   (이미지 지정/교체 시 증감 + GC 실행 시 실제 참조로 재집계)
+# - GC: 참조 0 + 유예 시간 경과한 파일 삭제 (썸네일 포함)
+import os
+import re
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.files.image_derivatives import remove_derivatives
+
+logger = logging.getLogger(__name__)
+
+FILE_GC_GRACE_HOURS = int(os.getenv("FILE_GC_GRACE_HOURS", "24"))
+FILE_GC_BATCH = 500
+
+_HASH_IN_URL = re.compile(r"/uploads/[\w/]+/([0-9a-f]{64})\.\w+$")
+
+# 업로드 이미지 URL을 저장하는 컬럼들 (GC 참조 재집계 대상)
+REFERENCE_COLUMNS = (
+    ("posts", "image_url"),
+    ("profiles", "profile_image"),
+    ("board_posts", "attachment_url"),
+)
+
+
+def content_hash_from_url(url: Optional[str]) -> Optional[str]:
+    """/uploads/.../{sha256}.ext (절대 URL 포함) → sha256"""
+    if not url:
+        return None
+    match = _HASH_IN_URL.search(url)
+    return match.group(1) if match else None
+
+
+def sharded_url(url_prefix: str, file_hash: str, ext: str) -> str:
+    return f"{url_prefix}/{file_hash[:2]}/{file_hash[2:4]}/{file_hash}{ext}"
+
+
+def url_to_path(url: str) -> str:
+    """/uploads/... → 서버 작업 디렉터리 기준 상대 경로"""
+    return url.lstrip("/")
+
+
+# ===============================
+# 📥 업로드 등록
+# ===============================
+def register_blob(
+    db: Session,
+    file_hash: str,
+    url: str,
+    size: int,
+    content_type: Optional[str],
+    user_id: Optional[int] = None,
+) -> str:
+    """
+    sha256 인덱스에 등록 후 실제 사용할 URL 반환 (commit 포함)
+    - 이미 있으면 기존 URL 재사용 + last_seen_at 갱신 (GC 유예 시간 리셋)
+    """
+    now = datetime.utcnow()
+    existing = db.execute(
+        text("SELECT file_url FROM files WHERE content_hash = :h"), {"h": file_hash}
+    ).scalar()
+    if existing is None:
+        try:
+            db.execute(
+                text("""
+                    INSERT INTO files (user_id, file_url, file_type, content_hash, size_bytes,
+                                       ref_count, last_seen_at, created_at)
+                    VALUES (:uid, :url, :type, :h, :size, 0, :now, :now)
+                """),
+                {"uid": user_id, "url": url, "type": content_type, "h": file_hash, "size": size, "now": now},
+            )
+            db.commit()
+            return url
+        except IntegrityError:  # 동시에 같은 파일 업로드
+            db.rollback()
+            existing = db.execute(
+                text("SELECT file_url FROM files WHERE content_hash = :h"), {"h": file_hash}
+            ).scalar()
+            if existing is None:
+                raise
+
+    db.execute(
+        text("UPDATE files SET last_seen_at = :now WHERE content_hash = :h"),
+        {"now": now, "h": file_hash},
+    )
+    db.commit()
+    return existing
+
+
+# ===============================
+# 🔗 참조 수 증감 (commit은 호출 측)
+# ===============================
+def add_ref(db: Session, url: Optional[str]) -> None:
+    file_hash = content_hash_from_url(url)
+    if file_hash:
+        db.execute(
+            text("UPDATE files SET ref_count = ref_count + 1, last_seen_at = :now WHERE content_hash = :h"),
+            {"now": datetime.utcnow(), "h": file_hash},
+        )
+
+
+def release_ref(db: Session, url: Optional[str]) -> None:
+    file_hash = content_hash_from_url(url)
+    if file_hash:
+        db.execute(
+            text("""
+                UPDATE files
+                SET ref_count = CASE WHEN ref_count > 0 THEN ref_count - 1 ELSE 0 END,
+                    last_seen_at = :now
+                WHERE content_hash = :h
+            """),
+            {"now": datetime.utcnow(), "h": file_hash},
+        )
+
+
+def replace_ref(db: Session, old_url: Optional[str], new_url: Optional[str]) -> None:
+    if content_hash_from_url(old_url) != content_hash_from_url(new_url):
+        release_ref(db, old_url)
+        add_ref(db, new_url)
+
+
+# ===============================
+# 🧹 GC
+# ===============================
+def recount_refs(db: Session) -> int:
+    """실제 참조 컬럼 기준 ref_count 재집계 (값이 바뀐 행 수 반환)"""
+    refs: Counter = Counter()
+    for table, column in REFERENCE_COLUMNS:
+        urls = db.execute(
+            text(f"SELECT {column} FROM {table} WHERE {column} LIKE '%/uploads/%'")
+        ).scalars()
+        refs.update(h for h in map(content_hash_from_url, urls) if h)
+
+    rows = db.execute(
+        text("SELECT id, content_hash, ref_count FROM files WHERE content_hash IS NOT NULL")
+    ).all()
+    changes = [
+        {"id": row_id, "cnt": refs.get(file_hash, 0)}
+        for row_id, file_hash, ref_count in rows
+        if refs.get(file_hash, 0) != ref_count
+    ]
+    if changes:
+        db.execute(text("UPDATE files SET ref_count = :cnt WHERE id = :id"), changes)
+    db.commit()
+    return len(changes)
+
+
+def collect_garbage(db: Session, grace: timedelta = timedelta(hours=FILE_GC_GRACE_HOURS)) -> dict:
+    """참조 없는 파일 정리 → {"recounted", "removed"}"""
+    recounted = recount_refs(db)
+    cutoff = datetime.utcnow() - grace
+    removed = 0
+
+    while True:
+        orphans = db.execute(
+            text("""
+                SELECT id, file_url, content_hash FROM files
+                WHERE content_hash IS NOT NULL AND ref_count = 0 AND last_seen_at < :cutoff
+                ORDER BY id
+                LIMIT :batch
+            """),
+            {"cutoff": cutoff, "batch": FILE_GC_BATCH},
+        ).all()
+        if not orphans:
+            break
+
+        for row_id, url, file_hash in orphans:
+            # 조회 이후 재업로드/참조된 경우는 조건에 걸려 삭제되지 않음
+            deleted = db.execute(
+                text("DELETE FROM files WHERE id = :id AND ref_count = 0 AND last_seen_at < :cutoff"),
+                {"id": row_id, "cutoff": cutoff},
+            ).rowcount
+            db.commit()
+            if not deleted:
+                continue
+            path = url_to_path(url)
+            if os.path.exists(path):
+                os.remove(path)
+            remove_derivatives(file_hash)
+            removed += 1
+
+        if len(orphans) < FILE_GC_BATCH:
+            break
+
+    return {"recounted": recounted, "removed": removed}
+
+
+def index_existing_uploads(db: Session, upload_dirs: Iterable[str]) -> int:
+    """인덱스 도입 이전 업로드 파일 등록 (기존 평면 경로 URL 그대로)"""
+    known = set(db.execute(text("SELECT content_hash FROM files WHERE content_hash IS NOT NULL")).scalars())
+    now = datetime.utcnow()
+    rows = []
+    for upload_dir in upload_dirs:
+        for root, _, files in os.walk(upload_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                file_hash = content_hash_from_url("/" + path.replace(os.sep, "/"))
+                if not file_hash or file_hash in known:
+                    continue
+                known.add(file_hash)
+                rows.append({
+                    "url": "/" + path.replace(os.sep, "/"), "h": file_hash,
+                    "size": os.path.getsize(path), "now": now,
+                })
+    if rows:
+        db.execute(
+            text("""
+                INSERT INTO files (file_url, content_hash, size_bytes, ref_count, last_seen_at, created_at)
+                VALUES (:url, :h, :size, 0, :now, :now)
+            """),
+            rows,
+        )
+    db.commit()
+    return len(rows)
+
+
+if __name__ == "__main__":
+    from app.core.database import SessionLocal
+    from app.files.upload_router import PROFILE_UPLOAD_DIR, PROJECT_UPLOAD_DIR
+
+    session = SessionLocal()
+    try:
+        print(f"✅ 기존 업로드 등록: {index_existing_uploads(session, [PROFILE_UPLOAD_DIR, PROJECT_UPLOAD_DIR])}개")
+        print(f"✅ GC: {collect_garbage(session)}")
+    finally:
+        session.close()
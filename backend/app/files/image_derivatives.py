@@ -0,0 +1,119 @@
+# app/files/image_derivatives.py
+# 업로드 이미지 파생본(썸네일) 생성/조회
+# - 원본 sha256 기준 키: uploads/thumbs/ab/cd/{hash}_{size}.webp
+# - EXIF 회전 반영 후 메타데이터 제거 + WebP 재인코딩
+# - 업로드 직후 BackgroundTasks 로 생성, 목록 API는 thumbnail_url() 로 파생본 URL 사용
+#   (파생본이 아직 없거나 Pillow 미설치면 원본 URL 그대로)
+import os
+import re
+import logging
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow 미설치 환경에서는 파생본 생성 생략
+    Image = None
+    ImageOps = None
+
+logger = logging.getLogger(__name__)
+
+THUMB_DIR = "uploads/thumbs"
+THUMB_URL_PREFIX = "/uploads/thumbs"
+WEBP_QUALITY = int(os.getenv("THUMB_WEBP_QUALITY", "80"))
+
+# 이름 → 긴 변 최대 픽셀
+DERIVATIVE_SIZES: Dict[str, int] = {
+    "sm": 160,   # 아바타/랭킹
+    "md": 480,   # 목록 카드
+}
+IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
+
+_HASHED_UPLOAD = re.compile(r"^/uploads/[\w/]+/([0-9a-f]{64})\.\w+$")
+_known: set = set()  # 존재 확인된 파생본 경로 (stat 반복 방지)
+
+os.makedirs(THUMB_DIR, exist_ok=True)
+
+
+def _derivative_relpath(file_hash: str, size: str) -> str:
+    return f"{file_hash[:2]}/{file_hash[2:4]}/{file_hash}_{size}.webp"
+
+
+def derivative_path(file_hash: str, size: str) -> str:
+    return os.path.join(THUMB_DIR, *_derivative_relpath(file_hash, size).split("/"))
+
+
+def remove_derivatives(file_hash: str) -> None:
+    """원본 삭제(GC) 시 파생본도 삭제"""
+    for size in DERIVATIVE_SIZES:
+        path = derivative_path(file_hash, size)
+        _known.discard(path)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def is_image_filename(filename: str) -> bool:
+    return os.path.splitext(filename or "")[1].lower() in IMAGE_EXTS
+
+
+def generate_derivatives(source_path: str, file_hash: str, sizes: Iterable[str] = DERIVATIVE_SIZES) -> int:
+    """원본 → 크기별 WebP 파생본 (이미 있는 건 건너뜀, 생성 개수 반환)"""
+    if Image is None:
+        return 0
+    targets = [s for s in sizes if not os.path.exists(derivative_path(file_hash, s))]
+    if not targets:
+        return 0
+
+    created = 0
+    try:
+        with Image.open(source_path) as opened:
+            image = ImageOps.exif_transpose(opened)  # 회전 정보 반영 (EXIF 자체는 저장하지 않음)
+            image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+            for size in targets:
+                copy = image.copy()
+                copy.thumbnail((DERIVATIVE_SIZES[size],) * 2, Image.LANCZOS)
+                out_path = derivative_path(file_hash, size)
+                os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                temp_path = f"{out_path}.part"
+                copy.save(temp_path, "WEBP", quality=WEBP_QUALITY, method=4)
+                os.replace(temp_path, out_path)
+                created += 1
+    except Exception as e:
+        logger.warning(f"⚠️ 썸네일 생성 실패 ({source_path}): {e}")
+    return created
+
+
+def thumbnail_url(url: Optional[str], size: str = "md") -> Optional[str]:
+    """업로드 이미지 URL → 파생본 URL (없으면 원본 그대로)"""
+    if not url:
+        return url
+    match = _HASHED_UPLOAD.match(urlparse(url).path)
+    if not match:
+        return url  # 기본 이미지(/assets) 등
+
+    file_hash = match.group(1)
+    path = derivative_path(file_hash, size)
+    if path not in _known:
+        if not os.path.exists(path):
+            return url
+        _known.add(path)
+    prefix = url[: url.index("/uploads/")]  # 절대 URL이면 호스트 유지
+    return f"{prefix}{THUMB_URL_PREFIX}/{_derivative_relpath(file_hash, size)}"
+
+
+def backfill_derivatives(upload_dirs: Iterable[str]) -> int:
+    """기존 업로드 파일 파생본 일괄 생성 (python -m app.files.image_derivatives)"""
+    created = 0
+    for upload_dir in upload_dirs:
+        for root, _, files in os.walk(upload_dir):
+            for name in files:
+                stem = os.path.splitext(name)[0]
+                if is_image_filename(name) and re.fullmatch(r"[0-9a-f]{64}", stem):
+                    created += generate_derivatives(os.path.join(root, name), stem)
+    return created
+
+
+if __name__ == "__main__":
+    from app.files.upload_router import PROFILE_UPLOAD_DIR, PROJECT_UPLOAD_DIR
+
+    print(f"✅ 썸네일 생성: {backfill_derivatives([PROFILE_UPLOAD_DIR, PROJECT_UPLOAD_DIR])}개")
@@ -1,8 +1,16 @@
 # app/files/upload_router.py
-from fastapi import APIRouter, UploadFile, File, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, File, HTTPException, Query
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 import os
 import hashlib
-from typing import Optional
+import tempfile
+from typing import Optional, Tuple
+from app import models
+from app.core.database import get_db
+from app.core.deps import get_current_user_optional
+from app.files.file_store import register_blob, sharded_url, url_to_path
+from app.files.image_derivatives import generate_derivatives, is_image_filename
 
 router = APIRouter(prefix="/upload", tags=["Upload"])
 
@@ -10,15 +18,87 @@ router = APIRouter(prefix="/upload", tags=["Upload"])
 PROFILE_UPLOAD_DIR = "uploads/profile_images"
 PROJECT_UPLOAD_DIR = "uploads/project_images"
 
+# 업로드 제한 / 스트리밍 단위
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(10 * 1024 * 1024)))  # 기본 10MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
 # 폴더 생성
 os.makedirs(PROFILE_UPLOAD_DIR, exist_ok=True)
 os.makedirs(PROJECT_UPLOAD_DIR, exist_ok=True)
 
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"파일 크기는 최대 {UPLOAD_MAX_BYTES // (1024 * 1024)}MB까지 업로드할 수 있습니다.",
+    )
+
+
+def _commit_temp(temp_path: str, file_path: str) -> None:
+    """임시 파일 → 최종 경로 (같은 파일이 이미 있으면 임시 파일만 삭제)"""
+    if os.path.exists(file_path):
+        os.remove(temp_path)
+    else:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        os.replace(temp_path, file_path)  # 같은 파일시스템 내 rename → 원자적
+
+
+def _reuse_canonical(file_path: str, canonical_path: str) -> None:
+    """
+    기존 URL 재사용 시 디스크 정리
+    - 원본 파일이 있으면 방금 옮긴 중복 파일 삭제
+    - 원본 파일이 없으면 (이동 실패/수동 삭제 등) 같은 내용인 방금 파일로 복구
+    """
+    if os.path.exists(canonical_path):
+        if file_path != canonical_path and os.path.exists(file_path):
+            os.remove(file_path)
+    else:
+        os.makedirs(os.path.dirname(canonical_path) or ".", exist_ok=True)
+        os.replace(file_path, canonical_path)
+
+
+async def save_upload(file: UploadFile, upload_dir: str) -> Tuple[str, str, int]:
+    """
+    업로드 파일을 청크 단위로 임시 저장 → (sha256, 임시 파일 경로, 바이트 수)
+    - 메모리에 전체 내용을 올리지 않고 읽으면서 해시 계산
+    - 디스크 쓰기는 스레드풀에서 (이벤트 루프 블로킹 방지)
+    - 최대 크기를 넘는 순간 중단 후 413
+    - 최종 위치로의 이동은 호출 측 (_commit_temp)
+    """
+    # 크기를 미리 알 수 있으면 읽기 전에 차단
+    if file.size is not None and file.size > UPLOAD_MAX_BYTES:
+        raise _too_large()
+
+    hasher = hashlib.sha256()
+    size = 0
+    fd, temp_path = tempfile.mkstemp(dir=upload_dir, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > UPLOAD_MAX_BYTES:
+                    raise _too_large()
+                hasher.update(chunk)
+                await run_in_threadpool(out.write, chunk)
+        return hasher.hexdigest(), temp_path, size
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
 @router.post("/")
 async def upload_file(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    type: Optional[str] = Query("project", description="업로드 타입: profile 또는 project")
+    type: Optional[str] = Query("project", description="업로드 타입: profile 또는 project"),
+    db: Session = Depends(get_db),
+    current_user: Optional[models.User] = Depends(get_current_user_optional),
 ):
+    temp_path = None
     try:
         # 업로드 타입에 따라 폴더 선택
         if type == "profile":
@@ -28,24 +108,38 @@ async def upload_file(
             upload_dir = PROJECT_UPLOAD_DIR
             url_prefix = "/uploads/project_images"
 
-        # 파일 내용 읽기
-        content = await file.read()
+        file_hash, temp_path, size = await save_upload(file, upload_dir)
+
+        # 파일 해시(SHA256) → 동일한 파일은 항상 같은 이름 (확장자 유지, ab/cd/ 샤딩)
+        ext = os.path.splitext(file.filename or "")[1].lower()
+        url = sharded_url(url_prefix, file_hash, ext)
 
-        # 파일 해시(SHA256) 생성 → 동일한 파일은 항상 같은 이름
-        file_hash = hashlib.sha256(content).hexdigest()
+        # 파일을 먼저 최종 경로에 둔 뒤 인덱스 등록 (등록된 행이 없는 파일을 가리키지 않도록)
+        file_path = os.path.join(upload_dir, file_hash[:2], file_hash[2:4], f"{file_hash}{ext}")
+        await run_in_threadpool(_commit_temp, temp_path, file_path)
+        temp_path = None
 
-        # 확장자 유지
-        ext = os.path.splitext(file.filename)[1].lower()
-        filename = f"{file_hash}{ext}"
-        file_path = os.path.join(upload_dir, filename)
+        # sha256 인덱스 등록 → 이미 있는 내용이면 기존 URL 재사용 (원본이 없으면 복구)
+        canonical_url = await run_in_threadpool(
+            register_blob, db, file_hash, url, size, file.content_type,
+            current_user.id if current_user else None,
+        )
+        if canonical_url != url:
+            canonical_path = url_to_path(canonical_url)
+            await run_in_threadpool(_reuse_canonical, file_path, canonical_path)
+            file_path = canonical_path
 
-        # 파일이 이미 있지 않으면 저장
-        if not os.path.exists(file_path):
-            with open(file_path, "wb") as buffer:
-                buffer.write(content)
+        # 썸네일(WebP) 파생본은 응답 이후 생성
+        if is_image_filename(canonical_url):
+            background_tasks.add_task(generate_derivatives, file_path, file_hash)
 
         # URL 반환 (DB에 저장 가능)
-        return {"url": f"{url_prefix}/{filename}"}
+        return {"url": canonical_url}
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 업로드 실패: {str(e)}")
+    finally:
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
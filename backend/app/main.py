@@ -2,7 +2,8 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from app.project_post import ai_router
+from app.project_post import ai_router, ai_client
+from app.auth import oauth_http
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -10,6 +11,11 @@ from fastapi.responses import JSONResponse
 from app.notifications.notification_router import router as notification_router
 from app.messages.message_router import router as message_router
 from app.board.hot3_scheduler import start_scheduler   # ✅ team-project 기능
+from app.project_post.recipe_scheduler import start_recipe_jobs
+from app.files.file_scheduler import start_file_jobs
+from app.profile.follow_scheduler import start_follow_jobs
+from app.admin.admin_scheduler import start_admin_jobs
+from app.notifications.notification_scheduler import start_notification_jobs
 from app.search import search_router                   # ✅ soldesk 기능
 from app.stats import stats_router                     # ✅ soldesk 기능
 from fastapi import HTTPException
@@ -62,6 +68,20 @@ app = FastAPI(
 @app.on_event("startup")
 def on_startup():
     start_scheduler()
+    start_recipe_jobs()  # ✅ 모집공고 기간 만료 상태 전환 (같은 스케줄러 사용)
+    start_file_jobs()    # ✅ 참조 없는 업로드 파일 정리
+    start_follow_jobs()  # ✅ 팔로우 그래프 적재
+    start_admin_jobs()   # ✅ 관리자 대시보드 카운터 적재
+    start_notification_jobs()  # ✅ 안 읽은 알림 카운터 보정
+
+
+# ✅ 서버 종료 시 공유 HTTP 클라이언트(AI / OAuth) 정리
+@app.on_event("shutdown")
+async def on_shutdown():
+    backend = ai_client.get_backend()
+    if hasattr(backend, "aclose"):
+        await backend.aclose()
+    oauth_http.close_session()
 
 # ===================================
 # 🌐 CORS 설정 (필수)
@@ -4,7 +4,7 @@ from typing import Optional, List, Dict
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from app.core.database import get_db
-from app.notifications.notification_service import send_notification
+from app.notifications.notification_service import send_notification, release_unread
 from app.users.user_model import User
 from fastapi import HTTPException
 import re
@@ -402,14 +402,16 @@ def mark_read(user_id: int, message_id: int, db: Optional[Session] = None) -> bo
              WHERE message_id = :mid AND user_id = :u
         """), {"mid": message_id, "u": user_id})
 
-        # 🩵 [수정] 알림 연동 — MESSAGE 타입만 읽음 처리
-        db.execute(text("""
+        # 🩵 [수정] 알림 연동 — MESSAGE 타입만 읽음 처리 (안 읽은 알림 수만큼 카운터 감소)
+        result = db.execute(text("""
             UPDATE notifications
                SET is_read = 1
              WHERE user_id = :u
                AND type = :type
                AND related_id = :mid
+               AND is_read = 0
         """), {"u": user_id, "mid": message_id, "type": NotificationType.MESSAGE.value})
+        release_unread(db, user_id, result.rowcount or 0)
 
         db.commit()
         print(f"✅ 메시지 읽음 처리 완료 (message_id={message_id})")
@@ -0,0 +1,152 @@
+# ============================================================
+# 📁 /app/meta/catalog.py
+# ------------------------------------------------------------
+# 스킬 / 지원분야 카탈로그 인메모리 스냅샷
+# - 불변 스냅샷 하나를 통째로 교체 (읽는 쪽은 락 없이 참조)
+# - 소문자 이름·아이콘 경로 미리 계산
+# - 스킬 검색: 정렬된 소문자 이름 이진 탐색(접두사) + 3-gram 역색인(부분 문자열)
+# - create_skill 시 즉시 재적재, 다른 워커 변경분은 CATALOG_TTL_SEC 경과 후 재적재
+# - ETag = 카탈로그 내용 해시 → /meta 응답 조건부 GET(304)
+# ============================================================
+
+import os
+import json
+import time
+import hashlib
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+CATALOG_TTL_SEC = float(os.getenv("CATALOG_TTL_SEC", "600"))
+CATALOG_CACHE_CONTROL = "public, max-age=300"
+
+
+def skill_icon(name: str) -> str:
+    return f"/assets/skills/{name.lower().replace('+', 'plus').replace('#', 'sharp')}.png"
+
+
+def _trigrams(value: str) -> FrozenSet[str]:
+    return frozenset(value[i:i + 3] for i in range(len(value) - 2))
+
+
+def _etag(kind: str, items: List[dict]) -> str:
+    raw = json.dumps(items, ensure_ascii=False, sort_keys=True)
+    return f'"{kind}-{hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]}"'
+
+
+@dataclass(frozen=True)
+class SkillEntry:
+    id: int
+    name: str
+    lower: str
+    icon: str
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    skills: Tuple[SkillEntry, ...]                       # id 순
+    skills_payload: Tuple[dict, ...]                     # /meta/skills 응답
+    skills_etag: str
+    fields_payload: Tuple[dict, ...]                     # /meta/required-fields 응답
+    fields_etag: str
+    sorted_lower: Tuple[str, ...]                        # 접두사 탐색용 (소문자 이름 오름차순)
+    sorted_skills: Tuple[SkillEntry, ...]                # sorted_lower 와 같은 순서
+    trigram_index: Dict[str, FrozenSet[int]]             # 3-gram → sorted_skills 위치
+    loaded_at: float
+
+    def search_skills(self, q: str, limit: int = 10) -> List[SkillEntry]:
+        """
+        대소문자 무시 부분 검색 (기존 ILIKE '%q%' 와 같은 결과 집합)
+        - 접두사 일치 먼저, 그다음 부분 일치 (각각 이름순)
+        """
+        q = (q or "").strip().lower()
+        if not q:
+            return list(self.sorted_skills[:limit])
+
+        # 접두사: 정렬 배열에서 연속 구간
+        start = bisect_left(self.sorted_lower, q)
+        end = start
+        while end < len(self.sorted_lower) and self.sorted_lower[end].startswith(q):
+            end += 1
+        results = list(self.sorted_skills[start:min(end, start + limit)])
+        if len(results) >= limit:
+            return results
+
+        # 부분 문자열: 3-gram 후보 교집합 후 확인 (짧은 검색어는 전체 확인)
+        if len(q) >= 3:
+            grams = sorted(_trigrams(q), key=lambda g: len(self.trigram_index.get(g, ())))
+            candidates = set(self.trigram_index.get(grams[0], ()))
+            for gram in grams[1:]:
+                candidates &= self.trigram_index.get(gram, frozenset())
+                if not candidates:
+                    break
+            positions = sorted(candidates)
+        else:
+            positions = range(len(self.sorted_skills))
+
+        for pos in positions:
+            if start <= pos < end:
+                continue  # 접두사로 이미 포함
+            if q in self.sorted_lower[pos]:
+                results.append(self.sorted_skills[pos])
+                if len(results) >= limit:
+                    break
+        return results
+
+
+def build_snapshot(skill_rows: List[Tuple[int, str]], field_rows: List[Tuple[int, str]]) -> CatalogSnapshot:
+    skills = tuple(SkillEntry(id=sid, name=name, lower=name.lower(), icon=skill_icon(name)) for sid, name in skill_rows)
+    sorted_skills = tuple(sorted(skills, key=lambda s: (s.lower, s.id)))
+
+    trigram_index: Dict[str, set] = {}
+    for pos, skill in enumerate(sorted_skills):
+        for gram in _trigrams(skill.lower):
+            trigram_index.setdefault(gram, set()).add(pos)
+
+    skills_payload = [{"id": s.id, "name": s.name} for s in skills]
+    fields_payload = [{"id": fid, "name": name} for fid, name in field_rows]
+    return CatalogSnapshot(
+        skills=skills,
+        skills_payload=tuple(skills_payload),
+        skills_etag=_etag("skills", skills_payload),
+        fields_payload=tuple(fields_payload),
+        fields_etag=_etag("fields", fields_payload),
+        sorted_lower=tuple(s.lower for s in sorted_skills),
+        sorted_skills=sorted_skills,
+        trigram_index={gram: frozenset(positions) for gram, positions in trigram_index.items()},
+        loaded_at=time.monotonic(),
+    )
+
+
+_snapshot: Optional[CatalogSnapshot] = None
+_load_lock = threading.Lock()
+
+
+def refresh_catalog(db: Session) -> CatalogSnapshot:
+    """DB에서 다시 읽어 스냅샷 교체 (스킬 추가 직후 호출)"""
+    global _snapshot
+    skill_rows = db.execute(text("SELECT id, name FROM skills ORDER BY id")).all()
+    field_rows = db.execute(text("SELECT id, name FROM application_fields ORDER BY id")).all()
+    snapshot = build_snapshot([tuple(r) for r in skill_rows], [tuple(r) for r in field_rows])
+    _snapshot = snapshot
+    return snapshot
+
+
+def get_catalog(db: Session) -> CatalogSnapshot:
+    snapshot = _snapshot
+    if snapshot is not None and time.monotonic() - snapshot.loaded_at < CATALOG_TTL_SEC:
+        return snapshot
+    with _load_lock:  # 만료 직후 동시 요청이 한 번만 재적재
+        snapshot = _snapshot
+        if snapshot is None or time.monotonic() - snapshot.loaded_at >= CATALOG_TTL_SEC:
+            snapshot = refresh_catalog(db)
+    return snapshot
+
+
+def clear_catalog() -> None:
+    global _snapshot
+    _snapshot = None
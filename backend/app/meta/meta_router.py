@@ -1,17 +1,23 @@
 # app/meta/meta_router.py
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.meta import meta_service   # ✅ 경로 수정
+from app.core.http_cache import conditional_json
+from app.meta.catalog import get_catalog, CATALOG_CACHE_CONTROL
 from app.meta.meta_schema import SkillResponse, ApplicationFieldResponse
 
 router = APIRouter(prefix="/meta", tags=["meta"])
 
+# ✅ 카탈로그 스냅샷 + ETag (변경 없으면 304)
 @router.get("/skills", response_model=list[SkillResponse])
-def get_skills(db: Session = Depends(get_db)):
-    return meta_service.get_skills(db)
+def get_skills(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    catalog = get_catalog(db)
+    return conditional_json(list(catalog.skills_payload), catalog.skills_etag, if_none_match, CATALOG_CACHE_CONTROL)
 
 @router.get("/required-fields", response_model=list[ApplicationFieldResponse])
-def get_required_fields(db: Session = Depends(get_db)):
-    return meta_service.get_required_fields(db)
\ No newline at end of file
+def get_required_fields(if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db)):
+    catalog = get_catalog(db)
+    return conditional_json(list(catalog.fields_payload), catalog.fields_etag, if_none_match, CATALOG_CACHE_CONTROL)
@@ -1,10 +1,12 @@
 # app/meta/meta_service.py
+# 스킬 / 지원분야 목록은 정적 참조 데이터 → 인메모리 카탈로그 스냅샷에서 제공
 from sqlalchemy.orm import Session
-from app.meta.skill_model import Skill
-from app.meta.application_field_model import ApplicationField
+from app.meta.catalog import get_catalog
+
 
 def get_skills(db: Session):
-    return db.query(Skill).all()
+    return list(get_catalog(db).skills_payload)
+
 
 def get_required_fields(db: Session):
-    return db.query(ApplicationField).all()
\ No newline at end of file
+    return list(get_catalog(db).fields_payload)
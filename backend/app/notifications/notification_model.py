@@ -1,6 +1,6 @@
 # app/notifications/notification_model.py
 from datetime import datetime
-from sqlalchemy import BigInteger, DateTime, Enum, String, Boolean, ForeignKey
+from sqlalchemy import BigInteger, DateTime, Enum, String, Boolean, ForeignKey, false, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.database import Base
 import enum
@@ -43,8 +43,8 @@ class Notification(Base):
     type: Mapped[NotificationType] = mapped_column(Enum(NotificationType), nullable=False)
     message: Mapped[str] = mapped_column(String(255), nullable=False)
     related_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
-    is_read: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    is_read: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, server_default=func.now())
 
     # ✅ 기존: 클릭 시 이동 경로
     redirect_path: Mapped[str | None] = mapped_column(String(255), nullable=True, comment="알림 클릭 시 이동 경로")
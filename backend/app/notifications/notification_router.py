@@ -7,7 +7,9 @@ from typing import List
 
 from app.core.deps import get_current_user, get_db
 from app.notifications.notification_model import Notification
-from app.notifications.notification_service import list_notifications, mark_read as service_mark_read, unread_count
+from app.notifications.notification_service import (
+    list_notifications, mark_read as service_mark_read, mark_all_read, unread_count
+)
 from app.notifications.notification_ws_manager import manager  # ✅ 단일 로그인 WebSocket 매니저 추가
 from app.users.user_model import User
 
@@ -51,17 +53,18 @@ def api_mark_read(
     if not notification_ids:
         raise HTTPException(status_code=400, detail="알림 ID 목록이 비어있습니다.")
 
-    updated = (
-        db.query(Notification)
+    # 안 읽은 알림만 갱신 + 카운터 감소 (같은 트랜잭션)
+    updated = service_mark_read(current_user.id, notification_ids, db)
+
+    # 0건이면 이미 읽은 알림인지 / 없는 알림인지 구분
+    if updated == 0 and not (
+        db.query(Notification.id)
         .filter(
             Notification.id.in_(notification_ids),
             Notification.user_id == current_user.id
         )
-        .update({"is_read": True}, synchronize_session=False)
-    )
-    db.commit()
-
-    if updated == 0:
+        .first()
+    ):
         raise HTTPException(status_code=404, detail="대상 알림을 찾을 수 없습니다.")
 
     return {"success": True, "message": f"{updated}개의 알림 읽음 처리 완료"}
@@ -76,15 +79,7 @@ def api_mark_all_read(
     """
     현재 로그인한 사용자의 모든 알림을 읽음 처리합니다.
     """
-    updated = (
-        db.query(Notification)
-        .filter(
-            Notification.user_id == current_user.id,
-            Notification.is_read == False
-        )
-        .update({"is_read": True}, synchronize_session=False)
-    )
-    db.commit()
+    updated = mark_all_read(current_user.id, db)
 
     return {"success": True, "message": f"{updated}개의 알림이 읽음 처리되었습니다."}
 
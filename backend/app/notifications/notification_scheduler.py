@@ -0,0 +1,30 @@
+# app/notifications/notification_scheduler.py
+from sqlalchemy.orm import Session
+from app.core.database import SessionLocal
+from app.board.hot3_scheduler import scheduler  # ✅ 스케줄러 인스턴스 공유
+from app.notifications.notification_service import recount_unread
+
+
+def recount_notification_counters():
+    """안 읽은 알림 카운터 재집계 (증감 누락/직접 SQL 수정 보정)"""
+    db: Session = SessionLocal()
+    try:
+        changed = recount_unread(db)
+        print(f"✅ [SCHEDULER] 알림 카운터 재집계 완료: {changed}명 보정")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ [SCHEDULER] 알림 카운터 재집계 실패: {e}")
+    finally:
+        db.close()
+
+
+def start_notification_jobs():
+    """hot3 스케줄러에 알림 카운터 재집계 작업 등록 (매시 정각)"""
+    scheduler.add_job(
+        recount_notification_counters,
+        "cron",
+        minute=0,
+        id="notification_counters",
+        replace_existing=True,
+    )
+    print("⏰ 알림 카운터 재집계(매시) 스케줄러 등록")
@@ -1,7 +1,10 @@
 # app/notifications/notification_service.py
 # 알림 생성/조회/읽음 처리 서비스 (SQLAlchemy 세션 직접 사용)
+# - 안 읽은 알림 수는 notification_counters(user_id PK) 에 보관
+#   (알림 생성/읽음 처리와 같은 트랜잭션에서 증감 → 배지 조회는 PK 조회 1회)
 
-from typing import Optional, List
+from collections import Counter
+from typing import Dict, Optional, List
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from app.core.database import get_db
@@ -20,6 +23,44 @@ def _get_db(db: Optional[Session] = None):
         close = True
     return db, close
 
+# ----------------------------
+# ✅ 안 읽은 알림 카운터 증감 (commit은 호출 측)
+# ----------------------------
+def init_unread_counter(db: Session, user_id: int) -> None:
+    """회원가입 시 카운터 행 생성"""
+    db.execute(
+        text("INSERT INTO notification_counters (user_id, unread_count) VALUES (:uid, 0)"),
+        {"uid": user_id},
+    )
+
+
+def _add_unread(db: Session, counts: Dict[int, int]) -> None:
+    """{user_id: 새 알림 수} → 카운터 증가 (행이 없는 사용자는 upsert 로 생성)"""
+    rows = [{"uid": uid, "cnt": cnt} for uid, cnt in counts.items() if cnt]
+    if rows:
+        db.execute(
+            text("""
+                INSERT INTO notification_counters (user_id, unread_count)
+                VALUES (:uid, :cnt)
+                ON DUPLICATE KEY UPDATE unread_count = unread_count + :cnt
+            """),
+            rows,
+        )
+
+
+def release_unread(db: Session, user_id: int, count: int) -> None:
+    """읽음 처리된 알림 수만큼 카운터 감소 (count = 실제로 안 읽음 → 읽음 전환된 행 수)"""
+    if count:
+        db.execute(
+            text("""
+                UPDATE notification_counters
+                   SET unread_count = GREATEST(unread_count - :cnt, 0)
+                 WHERE user_id = :uid
+            """),
+            {"uid": user_id, "cnt": count},
+        )
+
+
 # ----------------------------
 # ✅ 알림 전송
 # ----------------------------
@@ -56,7 +97,7 @@ def send_notification(
         redirect_value = redirect_path if redirect_path not in [None, "None"] else None
 
         # 🩵 [10/20 수정]  INSERT 후 즉시 커밋하여 알림 생성 지연 제거
-        db.execute(
+        result = db.execute(
             text("""
                 INSERT INTO notifications (
                     user_id, type, message, related_id, redirect_path, is_read, created_at, category
@@ -74,9 +115,10 @@ def send_notification(
                 "category": category_value,
             },
         )
+        _add_unread(db, {user_id: 1})
         db.commit()  # 💥 커밋 즉시 반영 (딜레이 제거 핵심)
 
-        inserted_id = db.execute(text("SELECT LAST_INSERT_ID()")).scalar()
+        inserted_id = result.lastrowid
 
         print(
             f"✅ 알림 전송 완료: user={user_id}, type={type_}, category={category_value}, redirect={redirect_value}"
@@ -87,6 +129,50 @@ def send_notification(
         if close:
             db.close()
 
+# ----------------------------
+# ✅ 알림 일괄 전송 (한 번의 executemany, commit은 호출 측)
+# ----------------------------
+def send_notifications_bulk(
+    db: Session,
+    notifications: List[dict],
+    type_: str,
+    category: Optional[str] = None,
+) -> int:
+    """
+    여러 사용자에게 같은 종류의 알림을 한 번에 INSERT
+    - notifications: [{"user_id", "message", "related_id", "redirect_path"}]
+    - 호출 측 트랜잭션에 포함 (신고 일괄 처리 등)
+    """
+    if not notifications:
+        return 0
+    category_value = category.value if isinstance(category, NotificationCategory) else (
+        category or NotificationCategory.NORMAL.value
+    )
+    type_value = type_.value if isinstance(type_, NotificationType) else type_
+    db.execute(
+        text("""
+            INSERT INTO notifications (
+                user_id, type, message, related_id, redirect_path, is_read, created_at, category
+            )
+            VALUES (
+                :user_id, :type, :message, :related_id, :redirect_path, 0, UTC_TIMESTAMP(), :category
+            )
+        """),
+        [
+            {
+                "user_id": n["user_id"],
+                "type": type_value,
+                "message": n["message"],
+                "related_id": n.get("related_id"),
+                "redirect_path": n.get("redirect_path"),
+                "category": category_value,
+            }
+            for n in notifications
+        ],
+    )
+    _add_unread(db, Counter(n["user_id"] for n in notifications))
+    return len(notifications)
+
 # ----------------------------
 # ✅ 알림 목록 조회
 # ----------------------------
@@ -142,6 +228,7 @@ def list_notifications(
 def mark_read(user_id: int, notification_ids: List[int], db: Optional[Session] = None) -> int:
     """
     선택한 알림을 읽음 처리
+    - 안 읽은 알림만 갱신 → 반환값 = 새로 읽음 처리된 수 (카운터 감소량)
     """
     if not notification_ids:
         return 0
@@ -151,11 +238,13 @@ def mark_read(user_id: int, notification_ids: List[int], db: Optional[Session] =
             UPDATE notifications
                SET is_read=1
              WHERE user_id=:user_id
+               AND is_read=0
                AND id IN ({ids})
         """.format(
             ids=",".join(str(int(i)) for i in notification_ids)
         )
         result = db.execute(text(sql), {"user_id": user_id})
+        release_unread(db, user_id, result.rowcount or 0)
         db.commit()
         # 🩵 [10/20 추가] 디버그 로그
         print(f"✅ 읽음 처리 완료: {result.rowcount}개 알림 갱신됨")
@@ -165,24 +254,40 @@ def mark_read(user_id: int, notification_ids: List[int], db: Optional[Session] =
             db.close()
 
 
+# ----------------------------
+# ✅ 전체 읽음 처리
+# ----------------------------
+def mark_all_read(user_id: int, db: Optional[Session] = None) -> int:
+    """
+    사용자의 안 읽은 알림 전체 읽음 처리 + 카운터 감소
+    (0 으로 덮어쓰면 동시에 commit 된 새 알림이 카운트에서 빠짐 → 전환된 행 수만큼만 차감)
+    """
+    db, close = _get_db(db)
+    try:
+        result = db.execute(
+            text("UPDATE notifications SET is_read=1 WHERE user_id=:user_id AND is_read=0"),
+            {"user_id": user_id},
+        )
+        updated = result.rowcount or 0
+        release_unread(db, user_id, updated)
+        db.commit()
+        return updated
+    finally:
+        if close:
+            db.close()
+
+
 # ----------------------------
 # ✅ 안 읽은 알림 수 조회
 # ----------------------------
 def unread_count(user_id: int, db: Optional[Session] = None) -> int:
     """
-    읽지 않은 알림 개수 반환
+    읽지 않은 알림 개수 반환 (notification_counters PK 조회, 행이 없으면 0)
     """
     db, close = _get_db(db)
     try:
         cnt = db.execute(
-            text(
-                """
-                SELECT COUNT(*)
-                  FROM notifications
-                 WHERE user_id=:user_id
-                   AND is_read=0
-            """
-            ),
+            text("SELECT unread_count FROM notification_counters WHERE user_id=:user_id"),
             {"user_id": user_id},
         ).scalar()
         return int(cnt or 0)
@@ -191,6 +296,41 @@ def unread_count(user_id: int, db: Optional[Session] = None) -> int:
             db.close()
 
 
+# ----------------------------
+# ✅ 카운터 재집계 (스케줄러 / 증감 누락·직접 SQL 수정 보정)
+# ----------------------------
+def recount_unread(db: Session) -> int:
+    """
+    notifications 기준 안 읽은 수 재집계 (값이 바뀐 사용자 수 반환)
+    - 읽기/덮어쓰기를 나누지 않고 문장 하나로 재계산 → 재집계 도중 commit 된 증감도 유실되지 않음
+    """
+    inserted = db.execute(
+        text("""
+            INSERT INTO notification_counters (user_id, unread_count)
+            SELECT n.user_id, COUNT(*)
+              FROM notifications n
+             WHERE n.is_read = 0
+               AND NOT EXISTS (SELECT 1 FROM notification_counters c WHERE c.user_id = n.user_id)
+             GROUP BY n.user_id
+        """)
+    ).rowcount
+    fixed = db.execute(
+        text("""
+            UPDATE notification_counters
+               SET unread_count = (
+                   SELECT COUNT(*) FROM notifications n
+                    WHERE n.user_id = notification_counters.user_id AND n.is_read = 0
+               )
+             WHERE unread_count <> (
+                   SELECT COUNT(*) FROM notifications n
+                    WHERE n.user_id = notification_counters.user_id AND n.is_read = 0
+               )
+        """)
+    ).rowcount
+    db.commit()
+    return (inserted or 0) + (fixed or 0)
+
+
 # ----------------------------
 # ✅ 관리자 신고 알림 분기 (쪽지와 분리)
 # ----------------------------
@@ -299,22 +439,17 @@ def send_notification_to_all(
         if not users:
             return {"count": 0, "message": "대상 사용자가 없습니다."}
 
-        for (uid,) in users:
-            db.execute(
-                text("""
-                    INSERT INTO notifications
-                        (user_id, type, message, related_id, redirect_path, is_read, created_at, category)
-                    VALUES
-                        (:uid, :type, :msg, NULL, :path, 0, UTC_TIMESTAMP(), :cat)
-                """),
-                {
-                    "uid": uid,
-                    "type": type_,
-                    "msg": message,
-                    "path": redirect_path if redirect_path not in [None, "None"] else None,
-                    "cat": category,
-                },
-            )
+        path = redirect_path if redirect_path not in [None, "None"] else None
+        db.execute(
+            text("""
+                INSERT INTO notifications
+                    (user_id, type, message, related_id, redirect_path, is_read, created_at, category)
+                VALUES
+                    (:uid, :type, :msg, NULL, :path, 0, UTC_TIMESTAMP(), :cat)
+            """),
+            [{"uid": uid, "type": type_, "msg": message, "path": path, "cat": category} for (uid,) in users],
+        )
+        _add_unread(db, {uid: 1 for (uid,) in users})
         db.commit()
         print(f"✅ 전체 유저 알림 전송 완료 ({len(users)}명)")
         return {"count": len(users), "message": "전체 알림 전송 완료"}
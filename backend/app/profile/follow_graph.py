@@ -0,0 +1,211 @@
+# ============================================================
+# 📁 /app/profile/follow_graph.py
+# ------------------------------------------------------------
+# 팔로우 그래프 인메모리 인접 리스트
+# - 사용자별 팔로잉/팔로워 id를 정렬된 array('q')로 보관 (id당 8바이트)
+# - 맞팔로우: 두 정렬 배열 병합 교집합 / 팔로우 여부: 이진 탐색
+# - 알 수도 있는 사람: 내가 팔로우하는 사람들이 팔로우하는 사람 (겹친 수 순)
+# - 팔로우/언팔로우 시 증분 갱신 + 스케줄러 주기적 전체 재적재
+#   (재적재 도중 들어온 증분 변경은 기록해 두었다가 교체 직후 다시 적용 → 유실 없음)
+#   (프로세스 로컬이므로 다른 워커의 변경은 재적재 주기만큼 늦게 반영
+#    → 조회자 본인의 팔로우 여부는 그래프가 아닌 DB로 확인)
+# ============================================================
+
+import os
+import heapq
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# 추천 계산 시 한 사용자에게서 따라갈 최대 팔로잉 수 (대형 계정 팬아웃 상한)
+FOLLOW_SUGGESTION_MAX_FANOUT = int(os.getenv("FOLLOW_SUGGESTION_MAX_FANOUT", "500"))
+
+_EMPTY = array("q")
+
+
+def _contains(ids: array, value: int) -> bool:
+    i = bisect_left(ids, value)
+    return i < len(ids) and ids[i] == value
+
+
+def _insert(index: Dict[int, array], key: int, value: int) -> bool:
+    ids = index.setdefault(key, array("q"))
+    i = bisect_left(ids, value)
+    if i < len(ids) and ids[i] == value:
+        return False
+    ids.insert(i, value)
+    return True
+
+
+def _remove(index: Dict[int, array], key: int, value: int) -> bool:
+    ids = index.get(key)
+    if ids is None:
+        return False
+    i = bisect_left(ids, value)
+    if i == len(ids) or ids[i] != value:
+        return False
+    del ids[i]
+    if not ids:
+        del index[key]
+    return True
+
+
+def _intersect(a: array, b: array) -> List[int]:
+    """정렬 배열 병합 교집합"""
+    result, i, j = [], 0, 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            result.append(a[i])
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _apply(following: Dict[int, array], followers: Dict[int, array], added: bool,
+           follower_id: int, following_id: int) -> None:
+    if added:
+        if _insert(following, follower_id, following_id):
+            _insert(followers, following_id, follower_id)
+    elif _remove(following, follower_id, following_id):
+        _remove(followers, following_id, follower_id)
+
+
+class FollowGraph:
+    def __init__(self):
+        self._following: Dict[int, array] = {}  # user_id → 팔로우하는 id (오름차순)
+        self._followers: Dict[int, array] = {}  # user_id → 팔로워 id (오름차순)
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._loading = 0                                  # 진행 중인 load() 수
+        self._journal: List[Tuple[bool, int, int]] = []    # load 도중 증분 변경 (추가 여부, follower, following)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self, db: Session) -> int:
+        """활성 팔로우 관계 전체 재적재 (적재한 관계 수 반환)"""
+        with self._lock:
+            self._loading += 1  # 이 시점 이후 증분 변경은 기록
+        try:
+            rows = db.execute(
+                text("""
+                    SELECT follower_id, following_id
+                    FROM follows
+                    WHERE deleted_at IS NULL
+                    ORDER BY follower_id, following_id
+                """)
+            ).all()
+
+            following: Dict[int, array] = {}
+            followers: Dict[int, List[int]] = {}
+            for follower_id, following_id in rows:
+                following.setdefault(follower_id, array("q")).append(following_id)
+                followers.setdefault(following_id, []).append(follower_id)
+            followers_index = {uid: array("q", sorted(ids)) for uid, ids in followers.items()}
+
+            with self._lock:
+                # 조회 중/직후 commit 된 팔로우·언팔로우 재적용 (이미 반영된 변경은 무시됨)
+                for added, follower_id, following_id in self._journal:
+                    _apply(following, followers_index, added, follower_id, following_id)
+                self._following = following  # 정렬 쿼리 순서 그대로 오름차순
+                self._followers = followers_index
+                self._loaded = True
+            return len(rows)
+        finally:
+            with self._lock:
+                self._loading -= 1
+                if not self._loading:
+                    self._journal.clear()
+
+    def ensure_loaded(self, db: Session) -> None:
+        if not self._loaded:
+            self.load(db)
+
+    # ---------------------------------------------
+    # ✏️ 증분 갱신 (follow_service commit 이후 호출)
+    # ---------------------------------------------
+    def add_edge(self, follower_id: int, following_id: int) -> None:
+        self._change(True, follower_id, following_id)
+
+    def remove_edge(self, follower_id: int, following_id: int) -> None:
+        self._change(False, follower_id, following_id)
+
+    def _change(self, added: bool, follower_id: int, following_id: int) -> None:
+        with self._lock:
+            _apply(self._following, self._followers, added, follower_id, following_id)
+            if self._loading:
+                self._journal.append((added, follower_id, following_id))
+
+    # ---------------------------------------------
+    # 🔍 조회
+    # ---------------------------------------------
+    def following(self, user_id: int) -> List[int]:
+        with self._lock:
+            return list(self._following.get(user_id, _EMPTY))
+
+    def followers(self, user_id: int) -> List[int]:
+        with self._lock:
+            return list(self._followers.get(user_id, _EMPTY))
+
+    def follows(self, follower_id: int, following_id: int) -> bool:
+        with self._lock:
+            return _contains(self._following.get(follower_id, _EMPTY), following_id)
+
+    def follows_many(self, follower_id: int, user_ids: Iterable[int]) -> Set[int]:
+        """user_ids 중 follower_id 가 팔로우 중인 id 집합"""
+        with self._lock:
+            ids = self._following.get(follower_id, _EMPTY)
+            return {uid for uid in user_ids if _contains(ids, uid)}
+
+    def mutuals(self, user_id: int) -> List[int]:
+        """맞팔로우 (서로 팔로우 중인) id 오름차순"""
+        with self._lock:
+            return _intersect(self._following.get(user_id, _EMPTY), self._followers.get(user_id, _EMPTY))
+
+    def common_followings(self, user_id: int, other_id: int) -> List[int]:
+        """두 사용자가 함께 팔로우하는 id 오름차순"""
+        with self._lock:
+            return _intersect(self._following.get(user_id, _EMPTY), self._following.get(other_id, _EMPTY))
+
+    def suggestions(
+        self,
+        user_id: int,
+        limit: int = 10,
+        exclude: Iterable[int] = (),
+    ) -> List[Tuple[int, int]]:
+        """
+        알 수도 있는 사람 → [(user_id, 겹친 팔로잉 수)]
+        - 내가 팔로우하는 사람들이 팔로우하는 사람 중 아직 팔로우하지 않은 사람
+        - 겹친 수 → 팔로워 수 → id 순
+        """
+        with self._lock:
+            mine = self._following.get(user_id, _EMPTY)
+            counts: Counter = Counter()
+            for friend_id in mine:
+                friend_following = self._following.get(friend_id, _EMPTY)
+                counts.update(friend_following[:FOLLOW_SUGGESTION_MAX_FANOUT])
+
+            skip = set(exclude)
+            skip.add(user_id)
+            ranked = heapq.nsmallest(
+                limit,
+                (
+                    (-count, -len(self._followers.get(candidate, _EMPTY)), candidate)
+                    for candidate, count in counts.items()
+                    if candidate not in skip and not _contains(mine, candidate)
+                ),
+            )
+        return [(candidate, -neg_count) for neg_count, _, candidate in ranked]
+
+
+follow_graph = FollowGraph()
@@ -1,65 +1,63 @@
 # app/profile/follow_router.py
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.core.deps import get_current_user
-from app.models import User, Follow, Profile
+from app.core.deps import get_current_user, get_current_user_optional
+from app.models import User
+from app.profile import follow_service
 
 # ✅ prefix를 /follows로 설정 (프론트엔드 경로에 맞춤)
 router = APIRouter(prefix="/follows", tags=["follow"])
 
 
+# ---------------------------------------------------------------------
+# 🕸️ 팔로우 그래프 (알 수도 있는 사람 / 일괄 팔로우 여부 / 맞팔로우)
+# ---------------------------------------------------------------------
+@router.get("/suggestions")
+def get_follow_suggestions(
+    limit: int = Query(10, ge=1, le=follow_service.FOLLOW_LIST_MAX_LIMIT),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """알 수도 있는 사람 (내가 팔로우하는 사람들이 팔로우하는 사람)"""
+    return follow_service.get_suggestions(db, current_user.id, limit=limit)
+
+
+@router.get("/check")
+def check_following(
+    ids: List[int] = Query(..., description="확인할 유저 id 목록 (?ids=1&ids=2)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """내가 각 유저를 팔로우 중인지 일괄 확인 → {user_id: bool}"""
+    if len(ids) > follow_service.FOLLOW_LIST_MAX_LIMIT:
+        raise HTTPException(status_code=400, detail=f"최대 {follow_service.FOLLOW_LIST_MAX_LIMIT}명까지 확인할 수 있습니다.")
+    return follow_service.check_following(db, current_user.id, ids)
+
+
+@router.get("/{user_id}/mutuals")
+def get_mutuals(
+    user_id: int,
+    limit: int = Query(20, ge=1, le=follow_service.FOLLOW_LIST_MAX_LIMIT),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_optional),
+):
+    """특정 유저와 서로 팔로우 중인 유저 목록"""
+    return follow_service.get_mutuals(
+        db, user_id, current_user.id if current_user else None, limit=limit, offset=offset
+    )
+
+
 @router.post("/{user_id}")
 def follow_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """유저 팔로우"""
-    if user_id == current_user.id:
-        raise HTTPException(status_code=400, detail="자기 자신을 팔로우할 수 없습니다")
-    
-    # ✅ 모든 팔로우 관계 확인 (deleted 포함)
-    existing = db.query(Follow).filter(
-        Follow.follower_id == current_user.id,
-        Follow.following_id == user_id
-    ).first()
-    
-    # ✅ 이미 활성 팔로우가 있는 경우
-    if existing and existing.deleted_at is None:
-        raise HTTPException(status_code=400, detail="이미 팔로우 중입니다")
-    
-    # ✅ soft delete된 팔로우가 있는 경우 → 복구
-    if existing and existing.deleted_at is not None:
-        existing.deleted_at = None
-        
-        # 카운트 증가
-        following_profile = db.query(Profile).filter(Profile.id == user_id).first()
-        if following_profile:
-            following_profile.follower_count += 1
-        
-        follower_profile = db.query(Profile).filter(Profile.id == current_user.id).first()
-        if follower_profile:
-            follower_profile.following_count += 1
-        
-        db.commit()
-        return {"message": "팔로우 완료"}
-    
-    # ✅ 새로운 팔로우 관계 생성
-    follow = Follow(follower_id=current_user.id, following_id=user_id)
-    db.add(follow)
-    
-    # 카운트 증가
-    following_profile = db.query(Profile).filter(Profile.id == user_id).first()
-    if following_profile:
-        following_profile.follower_count += 1
-    
-    follower_profile = db.query(Profile).filter(Profile.id == current_user.id).first()
-    if follower_profile:
-        follower_profile.following_count += 1
-    
-    db.commit()
-    
+    """유저 팔로우 (soft delete된 관계는 복구, 카운터는 follow_service에서 원자적 증감)"""
+    follow_service.follow_user(db, current_user.id, user_id)
     return {"message": "팔로우 완료"}
 
 
@@ -69,84 +67,37 @@ def unfollow_user(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """유저 언팔로우"""
-    follow = db.query(Follow).filter(
-        Follow.follower_id == current_user.id,
-        Follow.following_id == user_id,
-        Follow.deleted_at.is_(None)
-    ).first()
-    
-    if not follow:
-        raise HTTPException(status_code=404, detail="팔로우 관계가 존재하지 않습니다")
-    
-    # 팔로우 관계 삭제 (soft delete)
-    from datetime import datetime
-    follow.deleted_at = datetime.now()
-    
-    # ✅ 팔로워 카운트 감소 (팔로우 받는 사람)
-    following_profile = db.query(Profile).filter(Profile.id == user_id).first()
-    if following_profile and following_profile.follower_count > 0:
-        following_profile.follower_count -= 1
-    
-    # ✅ 팔로잉 카운트 감소 (팔로우 하는 사람)
-    follower_profile = db.query(Profile).filter(Profile.id == current_user.id).first()
-    if follower_profile and follower_profile.following_count > 0:
-        follower_profile.following_count -= 1
-    
-    db.commit()
-    
+    """유저 언팔로우 (soft delete)"""
+    follow_service.unfollow_user(db, current_user.id, user_id)
     return {"message": "언팔로우 완료"}
 
 
+def _follow_list(fetch, db: Session, user_id: int, current_user: Optional[User], limit: int, cursor: Optional[str]):
+    try:
+        return fetch(db, user_id, current_user.id if current_user else None, limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+
 @router.get("/{user_id}/followers")
 def get_followers(
     user_id: int,
+    limit: int = Query(20, ge=1, le=follow_service.FOLLOW_LIST_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
     db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_optional),
 ):
-    """특정 유저의 팔로워 목록"""
-    followers = (
-        db.query(User)
-        .join(Follow, Follow.follower_id == User.id)
-        .filter(
-            Follow.following_id == user_id,
-            Follow.deleted_at.is_(None)
-        )
-        .all()
-    )
-    
-    return [
-        {
-            "id": user.id,
-            "nickname": user.nickname,
-            "headline": db.query(Profile).filter(Profile.id == user.id).first().headline,  # ✅ 추가됨
-            "profile_image": db.query(Profile).filter(Profile.id == user.id).first().profile_image
-        }
-        for user in followers
-    ]
-
-
-@router.get("/{user_id}/followings")  
-def get_followings(  
+    """특정 유저의 팔로워 목록 (최신 팔로우순, 커서 페이지네이션)"""
+    return _follow_list(follow_service.get_followers, db, user_id, current_user, limit, cursor)
+
+
+@router.get("/{user_id}/followings")
+def get_followings(
     user_id: int,
+    limit: int = Query(20, ge=1, le=follow_service.FOLLOW_LIST_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
     db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_optional),
 ):
-    """특정 유저가 팔로우하는 목록"""
-    followings = (  
-        db.query(User)
-        .join(Follow, Follow.following_id == User.id)
-        .filter(
-            Follow.follower_id == user_id,
-            Follow.deleted_at.is_(None)
-        )
-        .all()
-    )
-    
-    return [
-        {
-            "id": user.id,
-            "nickname": user.nickname,
-            "headline": db.query(Profile).filter(Profile.id == user.id).first().headline,  # ✅ 추가됨
-            "profile_image": db.query(Profile).filter(Profile.id == user.id).first().profile_image
-        }
-        for user in followings  
-    ]
+    """특정 유저가 팔로우하는 목록 (최신 팔로우순, 커서 페이지네이션)"""
+    return _follow_list(follow_service.get_followings, db, user_id, current_user, limit, cursor)
@@ -0,0 +1,30 @@
+# app/profile/follow_scheduler.py
+from sqlalchemy.orm import Session
+from app.core.database import SessionLocal
+from app.board.hot3_scheduler import scheduler  # ✅ 스케줄러 인스턴스 공유
+from app.profile.follow_graph import follow_graph
+
+
+def refresh_follow_graph():
+    """주기적으로 팔로우 그래프 전체 재적재 (다른 워커에서 바뀐 팔로우 반영)"""
+    db: Session = SessionLocal()
+    try:
+        count = follow_graph.load(db)
+        print(f"✅ [SCHEDULER] 팔로우 그래프 재적재 완료: edges={count}")
+    except Exception as e:
+        print(f"❌ [SCHEDULER] 팔로우 그래프 재적재 실패: {e}")
+    finally:
+        db.close()
+
+
+def start_follow_jobs():
+    """hot3 스케줄러에 팔로우 그래프 재적재 작업 등록 (서버 시작 시 1회 즉시 실행)"""
+    refresh_follow_graph()
+    scheduler.add_job(
+        refresh_follow_graph,
+        "interval",
+        minutes=10,
+        id="follow_graph",
+        replace_existing=True,
+    )
+    print("⏰ 팔로우 그래프 재적재(10분) 스케줄러 등록 + 최초 1회")
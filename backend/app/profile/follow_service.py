@@ -1,10 +1,25 @@
 # app/profile/follow_service.py
 from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
 from fastapi import HTTPException
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.profile.follow_model import Follow
-from app.users.user_model import User
+from app.users.user_model import User, UserStatus
 from app.profile.profile_model import Profile
+from app.profile.profile_service import invalidate_profile
+from app.profile.follow_graph import follow_graph
+from app.core.pagination import encode_cursor, decode_cursor
+
+
+def _bump_follow_counts(db: Session, follower_id: int, following_id: int, delta: int) -> None:
+    """팔로워/팔로잉 카운터를 UPDATE 한 번씩으로 증감 (읽고 쓰지 않음 → 동시 요청에도 누락 없음)"""
+    for user_id, column in ((following_id, Profile.follower_count), (follower_id, Profile.following_count)):
+        query = db.query(Profile).filter(Profile.id == user_id)
+        if delta < 0:
+            query = query.filter(column > 0)
+        query.update({column: column + delta}, synchronize_session=False)
 
 
 def follow_user(db: Session, follower_id: int, following_id: int):
@@ -15,24 +30,29 @@ def follow_user(db: Session, follower_id: int, following_id: int):
     if not target_user:
         raise HTTPException(status_code=404, detail="대상 유저를 찾을 수 없습니다.")
 
-    follow = db.query(Follow).filter_by(
-        follower_id=follower_id,
-        following_id=following_id
-    ).first()
-
-    if follow:
-        follow.created_at = datetime.utcnow()  # ✅ UTC로 변경
-        follow.deleted_at = None
-    else:
-        follow = Follow(
-            follower_id=follower_id,
-            following_id=following_id,
-            created_at=datetime.utcnow(),  # ✅ UTC로 변경
-            deleted_at=None
+    now = datetime.utcnow()  # ✅ UTC
+    # 언팔로우 상태였던 관계 복구 (조건부 UPDATE → 활성 관계는 건드리지 않음)
+    restored = (
+        db.query(Follow)
+        .filter(
+            Follow.follower_id == follower_id,
+            Follow.following_id == following_id,
+            Follow.deleted_at.isnot(None),
         )
-        db.add(follow)
-
+        .update({Follow.created_at: now, Follow.deleted_at: None}, synchronize_session=False)
+    )
+    if not restored:
+        db.add(Follow(follower_id=follower_id, following_id=following_id, created_at=now, deleted_at=None))
+        try:
+            db.flush()
+        except IntegrityError:  # PK(follower_id, following_id) 중복 = 이미 팔로우 중
+            db.rollback()
+            raise HTTPException(status_code=400, detail="이미 팔로우 중입니다.")
+
+    _bump_follow_counts(db, follower_id, following_id, 1)
     db.commit()
+    follow_graph.add_edge(follower_id, following_id)
+    invalidate_profile(follower_id, following_id)
     return {
         "success": True,
         "message": "팔로우 성공",
@@ -42,20 +62,22 @@ def follow_user(db: Session, follower_id: int, following_id: int):
 
 
 def unfollow_user(db: Session, follower_id: int, following_id: int):
-    follow = (
+    unfollowed = (
         db.query(Follow)
-        .filter(Follow.follower_id == follower_id, Follow.following_id == following_id)
-        .first()
+        .filter(
+            Follow.follower_id == follower_id,
+            Follow.following_id == following_id,
+            Follow.deleted_at.is_(None),
+        )
+        .update({Follow.deleted_at: datetime.utcnow()}, synchronize_session=False)  # ✅ UTC
     )
-
-    if not follow:
+    if not unfollowed:
         raise HTTPException(status_code=404, detail="팔로우 관계가 존재하지 않습니다.")
 
-    if follow.deleted_at is not None:
-        raise HTTPException(status_code=400, detail="이미 언팔로우된 상태입니다.")
-
-    follow.deleted_at = datetime.utcnow()  # ✅ UTC로 변경
+    _bump_follow_counts(db, follower_id, following_id, -1)
     db.commit()
+    follow_graph.remove_edge(follower_id, following_id)
+    invalidate_profile(follower_id, following_id)
     return {
         "success": True,
         "message": "언팔로우 성공",
@@ -64,69 +86,138 @@ def unfollow_user(db: Session, follower_id: int, following_id: int):
     }
 
 
-def get_followers(db: Session, user_id: int, current_user_id: int = None):
-    followers = (
-        db.query(Follow, User, Profile)
-        .join(User, Follow.follower_id == User.id)
-        .join(Profile, Profile.id == User.id)
-        .filter(Follow.following_id == user_id, Follow.deleted_at.is_(None))
+FOLLOW_LIST_MAX_LIMIT = 100
+
+
+def following_ids_among(db: Session, viewer_id: Optional[int], user_ids: Iterable[int]) -> Set[int]:
+    """
+    viewer 가 팔로우 중인 id 집합 (IN 쿼리 한 번)
+    - 본인 팔로우 상태는 다른 워커에서 바뀐 직후에도 정확해야 하므로 그래프 캐시 대신 DB 조회
+    """
+    user_ids = list(set(user_ids))
+    if not viewer_id or not user_ids:
+        return set()
+    rows = (
+        db.query(Follow.following_id)
+        .filter(
+            Follow.follower_id == viewer_id,
+            Follow.following_id.in_(user_ids),
+            Follow.deleted_at.is_(None),
+        )
         .all()
     )
-
-    result = []
-    for _, user, profile in followers:
-        is_following = False
-        if current_user_id:
-            check = (
-                db.query(Follow)
-                .filter(
-                    Follow.follower_id == current_user_id,
-                    Follow.following_id == user.id,
-                    Follow.deleted_at.is_(None)
-                )
-                .first()
+    return {following_id for (following_id,) in rows}
+
+
+def _follow_page(
+    db: Session,
+    owner_column,
+    other_column,
+    user_id: int,
+    current_user_id: Optional[int],
+    limit: int,
+    cursor: Optional[str],
+) -> dict:
+    """
+    팔로워/팔로잉 목록 공통: 팔로우 시작일 최신순 keyset 페이지
+    - 목록 1쿼리 + 조회자 팔로우 여부 IN 1쿼리 (행 수와 무관)
+    - 잘못된 커서는 ValueError
+    """
+    limit = max(1, min(limit, FOLLOW_LIST_MAX_LIMIT))
+    query = (
+        db.query(Follow.created_at, User.id, User.nickname, Profile.profile_image, Profile.headline)
+        .join(User, other_column == User.id)
+        .outerjoin(Profile, Profile.id == User.id)
+        .filter(owner_column == user_id, Follow.deleted_at.is_(None))
+    )
+    if cursor:
+        created_at, last_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(
+                Follow.created_at < created_at,
+                and_(Follow.created_at == created_at, other_column < last_id),
             )
-            is_following = bool(check)
-
-        result.append({
-            "id": user.id,
-            "nickname": user.nickname,
-            "profile_image": profile.profile_image,
-            "headline": profile.headline,
-            "is_following": is_following,
-        })
-    return result
-
-
-def get_followings(db: Session, user_id: int, current_user_id: int = None):
-    followings = (
-        db.query(Follow, User, Profile)
-        .join(User, Follow.following_id == User.id)
-        .join(Profile, Profile.id == User.id)
-        .filter(Follow.follower_id == user_id, Follow.deleted_at.is_(None))
+        )
+    rows = query.order_by(Follow.created_at.desc(), other_column.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    followed = following_ids_among(db, current_user_id, (row.id for row in rows))
+    items = [
+        {
+            "id": row.id,
+            "nickname": row.nickname,
+            "profile_image": row.profile_image,
+            "headline": row.headline,
+            "is_following": row.id in followed,
+        }
+        for row in rows
+    ]
+    return {"items": items, "next_cursor": next_cursor}
+
+
+def get_followers(
+    db: Session, user_id: int, current_user_id: int = None, limit: int = 20, cursor: Optional[str] = None
+) -> dict:
+    return _follow_page(db, Follow.following_id, Follow.follower_id, user_id, current_user_id, limit, cursor)
+
+
+def get_followings(
+    db: Session, user_id: int, current_user_id: int = None, limit: int = 20, cursor: Optional[str] = None
+) -> dict:
+    return _follow_page(db, Follow.follower_id, Follow.following_id, user_id, current_user_id, limit, cursor)
+
+
+# ===============================
+# 🕸️ 팔로우 그래프 기반 조회
+# ===============================
+def _user_cards(db: Session, user_ids: List[int], current_user_id: Optional[int]) -> List[dict]:
+    """id 순서 유지한 프로필 카드 (users+profiles IN 1쿼리, 탈퇴 회원 제외)"""
+    if not user_ids:
+        return []
+    rows = (
+        db.query(User.id, User.nickname, Profile.profile_image, Profile.headline)
+        .outerjoin(Profile, Profile.id == User.id)
+        .filter(User.id.in_(user_ids), User.status != UserStatus.DELETED)
         .all()
     )
-
-    result = []
-    for _, user, profile in followings:
-        is_following = False
-        if current_user_id:
-            check = (
-                db.query(Follow)
-                .filter(
-                    Follow.follower_id == current_user_id,
-                    Follow.following_id == user.id,
-                    Follow.deleted_at.is_(None)
-                )
-                .first()
-            )
-            is_following = bool(check)
-
-        result.append({
-            "id": user.id,
-            "nickname": user.nickname,
-            "profile_image": profile.profile_image,
-            "headline": profile.headline,
-            "is_following": is_following,
-        })
-    return result
\ No newline at end of file
+    by_id = {row.id: row for row in rows}
+    followed = following_ids_among(db, current_user_id, by_id)
+    return [
+        {
+            "id": uid,
+            "nickname": by_id[uid].nickname,
+            "profile_image": by_id[uid].profile_image,
+            "headline": by_id[uid].headline,
+            "is_following": uid in followed,
+        }
+        for uid in user_ids
+        if uid in by_id
+    ]
+
+
+def get_mutuals(db: Session, user_id: int, current_user_id: int = None, limit: int = 20, offset: int = 0) -> dict:
+    """맞팔로우 목록 → {"items", "total"}"""
+    follow_graph.ensure_loaded(db)
+    mutual_ids = follow_graph.mutuals(user_id)
+    page_ids = mutual_ids[offset:offset + max(1, min(limit, FOLLOW_LIST_MAX_LIMIT))]
+    return {"items": _user_cards(db, page_ids, current_user_id), "total": len(mutual_ids)}
+
+
+def get_suggestions(db: Session, user_id: int, limit: int = 10) -> List[dict]:
+    """알 수도 있는 사람 (겹친 팔로잉 수 포함)"""
+    follow_graph.ensure_loaded(db)
+    ranked = follow_graph.suggestions(user_id, limit=max(1, min(limit, FOLLOW_LIST_MAX_LIMIT)))
+    mutual_counts = dict(ranked)
+    cards = _user_cards(db, [uid for uid, _ in ranked], None)
+    return [{**card, "mutual_count": mutual_counts[card["id"]]} for card in cards]
+
+
+def check_following(db: Session, follower_id: int, user_ids: Iterable[int]) -> Dict[int, bool]:
+    """follower_id 가 user_ids 각각을 팔로우 중인지"""
+    user_ids = list(dict.fromkeys(user_ids))
+    followed = following_ids_among(db, follower_id, user_ids)
+    return {uid: uid in followed for uid in user_ids}
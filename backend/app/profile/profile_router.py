@@ -1,13 +1,14 @@
 # app/profile/profile_router.py
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, File, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from app.core.database import get_db
 from app.profile.profile_schemas import ProfileOut, ProfileUpdate
-from app.profile.profile_service import get_profile_detail, update_profile, get_or_create_profile
+from app.profile.profile_service import get_profile_detail, update_profile, get_or_create_profile, invalidate_profile
 from app.core.deps import get_current_user
 from app.models import User
 from app.files import upload_router   # ✅ 업로드 모듈 가져오기
+from app.files import file_store
 from typing import Optional
 from app.core.deps import get_current_user_optional
 
@@ -68,19 +69,24 @@ def update_my_profile(
 # ---------------------------------------------------------------------
 @router.post("/me/image", response_model=ProfileOut)
 async def upload_profile_image(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     # 👉 upload_router.upload_file 사용 (type="profile")
-    result = await upload_router.upload_file(file=file, type="profile")
+    result = await upload_router.upload_file(
+        background_tasks, file=file, type="profile", db=db, current_user=current_user
+    )
     image_url = result["url"]
 
-    # DB 업데이트
+    # DB 업데이트 (이전 이미지 참조 해제 → 새 이미지 참조)
     profile = get_or_create_profile(db, current_user.id)
+    file_store.replace_ref(db, profile.profile_image, image_url)
     profile.profile_image = image_url
     db.commit()
     db.refresh(profile)
+    invalidate_profile(current_user.id)
 
     return get_profile_detail(
         db,
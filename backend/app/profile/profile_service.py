@@ -1,13 +1,59 @@
 # app/profile/profile_service.py
+# 프로필 페이지 조회
+# - 유저+프로필+보유 스킬을 한 번의 JOIN 쿼리로 조회 (팔로워/팔로잉 수는 profiles 카운터 컬럼)
+# - 조회자와 무관한 부분은 사용자별 캐시 → 프로필/스킬/팔로우 변경 시 invalidate_profile()
+# - 조회자별 값(is_following, 공개 범위 필터)은 요청마다 적용
+import os
+import threading
+from typing import Dict, Optional
+
+from sqlalchemy import text, Date, JSON
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
+from app.core.cache import TTLCache, MISSING
 from app.users.user_model import User
 from app.profile.profile_model import Profile
-from app.meta.skill_model import Skill  
-from app.profile.user_skill_model import UserSkill
 from app.profile.profile_schemas import ProfileUpdate
 from app.profile.follow_model import Follow
 
+PROFILE_CACHE_TTL_SEC = float(os.getenv("PROFILE_CACHE_TTL_SEC", "60"))
+
+# 공개 범위(visibility)로 숨길 수 있는 필드
+PRIVATE_FIELDS = ("birth_date", "gender", "bio", "experience", "certifications")
+
+_PROFILE_SQL = text("""
+    SELECT u.id, u.nickname, u.email,
+           p.id AS profile_id, p.profile_image, p.headline, p.bio, p.experience, p.certifications,
+           p.birth_date, p.gender, p.visibility, p.follower_count, p.following_count,
+           s.id AS skill_id, s.name AS skill_name, us.level AS skill_level
+    FROM users u
+    LEFT JOIN profiles p ON p.id = u.id
+    LEFT JOIN user_skills us ON us.user_id = u.id
+    LEFT JOIN skills s ON s.id = us.skill_id
+    WHERE u.id = :user_id
+    ORDER BY us.skill_id
+""").columns(birth_date=Date, visibility=JSON)
+
+
+# ===============================
+# 🗃️ 사용자별 캐시
+# ===============================
+_cache = TTLCache(maxsize=4096, default_ttl=PROFILE_CACHE_TTL_SEC)
+_versions: Dict[int, int] = {}
+_versions_lock = threading.Lock()
+
+
+def invalidate_profile(*user_ids: Optional[int]) -> None:
+    with _versions_lock:
+        for user_id in user_ids:
+            if user_id is not None:
+                _versions[user_id] = _versions.get(user_id, 0) + 1
+
+
+def _version(user_id: int) -> int:
+    with _versions_lock:
+        return _versions.get(user_id, 0)
+
 
 def get_or_create_profile(db: Session, user_id: int) -> Profile:
     profile = db.query(Profile).filter(Profile.id == user_id).first()
@@ -16,8 +62,16 @@ def get_or_create_profile(db: Session, user_id: int) -> Profile:
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
+        # 프로필 없이 쌓인 팔로우가 있으면 카운터 초기값으로 반영
         profile = Profile(
-            id=user_id, profile_image="/assets/profile/default_profile.png"
+            id=user_id,
+            profile_image="/assets/profile/default_profile.png",
+            follower_count=db.query(Follow)
+            .filter(Follow.following_id == user_id, Follow.deleted_at.is_(None))
+            .count(),
+            following_count=db.query(Follow)
+            .filter(Follow.follower_id == user_id, Follow.deleted_at.is_(None))
+            .count(),
         )
         db.add(profile)
         db.commit()
@@ -26,89 +80,79 @@ def get_or_create_profile(db: Session, user_id: int) -> Profile:
     return profile
 
 
-def get_profile_detail(db: Session, user_id: int, current_user_id: int = None, current_user_role: str = None):
-    user = db.get(User, user_id)
-    if not user:
+def _load_profile(db: Session, user_id: int) -> dict:
+    """조회자와 무관한 프로필 원본 (공개 범위 필터 전)"""
+    rows = db.execute(_PROFILE_SQL, {"user_id": user_id}).mappings().all()
+    if not rows:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    if rows[0]["profile_id"] is None:
+        get_or_create_profile(db, user_id)
+        rows = db.execute(_PROFILE_SQL, {"user_id": user_id}).mappings().all()
 
-    profile = get_or_create_profile(db, user_id)
-
-    user_skills = (
-        db.query(UserSkill, Skill)
-        .join(Skill, UserSkill.skill_id == Skill.id)
-        .filter(UserSkill.user_id == user_id)
-        .all()
-    )
-    skills_out = [
-        {
-            "id": skill.id,
-            "name": skill.name,
-            "level": user_skill.level,
-            "icon": f"/assets/skills/{skill.name.lower()}.png",
-        }
-        for user_skill, skill in user_skills
-    ]
+    row = rows[0]
+    return {
+        "id": row["id"],
+        "nickname": row["nickname"],
+        "email": row["email"],
+        "profile_image": row["profile_image"],
+        "headline": row["headline"],
+        "bio": row["bio"],
+        "experience": row["experience"],
+        "certifications": row["certifications"],
+        "birth_date": row["birth_date"],
+        "gender": row["gender"],
+        "visibility": row["visibility"] or {},
+        "follower_count": row["follower_count"] or 0,
+        "following_count": row["following_count"] or 0,
+        "skills": [
+            {
+                "id": r["skill_id"],
+                "name": r["skill_name"],
+                "level": r["skill_level"],
+                "icon": f"/assets/skills/{r['skill_name'].lower()}.png",
+            }
+            for r in rows
+            if r["skill_id"] is not None
+        ],
+    }
+
+
+def get_profile_detail(db: Session, user_id: int, current_user_id: int = None, current_user_role: str = None):
+    key = (user_id, _version(user_id))
+    base = _cache.get(key)
+    if base is MISSING:
+        base = _load_profile(db, user_id)
+        _cache.set(key, base)
 
+    # 조회자 본인의 팔로우 여부는 항상 DB (팔로우 그래프는 다른 워커 변경분이 늦게 반영됨)
     is_following = False
     if current_user_id and current_user_id != user_id:
-        follow = (
+        is_following = db.query(
             db.query(Follow)
             .filter(
                 Follow.follower_id == current_user_id,
                 Follow.following_id == user_id,
                 Follow.deleted_at.is_(None),
             )
-            .first()
-        )
-        is_following = follow is not None
-
-    follower_count = (
-        db.query(Follow)
-        .filter(Follow.following_id == user_id, Follow.deleted_at.is_(None))
-        .count()
-    )
-    following_count = (
-        db.query(Follow)
-        .filter(Follow.follower_id == user_id, Follow.deleted_at.is_(None))
-        .count()
-    )
-
-     # ✅ visibility 기반 공개 여부 처리
-    visibility = profile.visibility or {}
-    
-    # 본인이거나 관리자면 모든 정보 공개
-    if current_user_id == user_id or current_user_role == "ADMIN":
-        birth_date_value = profile.birth_date
-        gender_value = profile.gender
-        bio_value = profile.bio
-        experience_value = profile.experience
-        certifications_value = profile.certifications
-    else:
-        # 다른 유저 → visibility 설정에 따라 필터링
-        birth_date_value = profile.birth_date if visibility.get("birth_date", True) else None
-        gender_value = profile.gender if visibility.get("gender", True) else None
-        bio_value = profile.bio if visibility.get("bio", True) else None
-        experience_value = profile.experience if visibility.get("experience", True) else None
-        certifications_value = profile.certifications if visibility.get("certifications", True) else None
+            .exists()
+        ).scalar()
 
-    return {
-        "id": user.id,
-        "nickname": user.nickname,
-        "email": user.email,
-        "profile_image": profile.profile_image,
-        "headline": profile.headline,
-        "bio": bio_value,
-        "experience": experience_value,
-        "certifications": certifications_value,
-        "birth_date": birth_date_value,
-        "gender": gender_value,
-        "visibility": visibility,  # ✅ 프론트로 전달
-        "follower_count": follower_count,
-        "following_count": following_count,
-        "skills": skills_out,
+    result = {
+        **base,
+        "visibility": dict(base["visibility"]),
+        "skills": [dict(skill) for skill in base["skills"]],
         "is_following": is_following,
     }
 
+    # ✅ visibility 기반 공개 여부 처리
+    # 본인이거나 관리자면 모든 정보 공개, 다른 유저 → visibility 설정에 따라 필터링
+    if current_user_id != user_id and current_user_role != "ADMIN":
+        visibility = base["visibility"]
+        for field in PRIVATE_FIELDS:
+            if not visibility.get(field, True):
+                result[field] = None
+    return result
+
 
 def update_profile(db: Session, user_id: int, update_data: ProfileUpdate):
     profile = db.query(Profile).filter(Profile.id == user_id).first()
@@ -147,6 +191,7 @@ def update_profile(db: Session, user_id: int, update_data: ProfileUpdate):
     db.commit()
     db.refresh(profile)
     db.refresh(user)
+    invalidate_profile(user_id)
 
     return get_profile_detail(
     db,
@@ -1,10 +1,12 @@
 # app/profile/skill_router.py
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.http_cache import conditional_json
+from app.meta.catalog import get_catalog, skill_icon
 from app.profile.skill_schemas import SkillCreate, UserSkillCreate, SkillOut
 from app.profile.skill_service import (
     search_skills,
@@ -22,15 +24,18 @@ router = APIRouter(prefix="/skills", tags=["skills"])
 def search_skill_endpoint(
     q: Optional[str] = Query("", description="부분 검색어"),
     limit: int = Query(10, ge=1, le=200),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
-    return search_skills(db, q, limit)
+    # 결과는 (카탈로그, q, limit) 로 결정 → URL별 ETag 는 카탈로그 ETag 그대로
+    etag = get_catalog(db).skills_etag
+    return conditional_json(search_skills(db, q, limit), etag, if_none_match, "public, max-age=60")
 
 
 @router.post("/", response_model=SkillOut)
 def register_skill(skill: SkillCreate, db: Session = Depends(get_db)):
     skill_obj = create_skill(db, skill.name)
-    return {"id": skill_obj.id, "name": skill_obj.name, "level": None, "icon": f"/assets/skills/{skill_obj.name.lower()}.png"}
+    return {"id": skill_obj.id, "name": skill_obj.name, "level": None, "icon": skill_icon(skill_obj.name)}
 
 
 @router.get("/me", response_model=List[SkillOut])
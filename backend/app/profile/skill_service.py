@@ -5,25 +5,15 @@ from fastapi import HTTPException
 from typing import List
 from app.meta.skill_model import Skill  # ✅ meta에서 import
 from app.profile.user_skill_model import UserSkill
-import re
+from app.profile.profile_service import invalidate_profile
+from app.meta.catalog import get_catalog, refresh_catalog
 
 
 def search_skills(db: Session, q: str, limit: int = 10) -> List[dict]:
-    query = db.query(Skill)
-    if q:
-        q_escaped = re.escape(q)
-        like = f"%{q_escaped}%"
-        query = query.filter(Skill.name.ilike(like))
-    skills = query.order_by(Skill.name.asc()).limit(limit).all()
-
+    """카탈로그 스냅샷에서 검색 (키 입력마다 DB ILIKE 조회하지 않음)"""
     return [
-        {
-            "id": s.id,
-            "name": s.name,
-            "level": None,
-            "icon": f"/assets/skills/{s.name.lower().replace('+', 'plus').replace('#', 'sharp')}.png"
-        }
-        for s in skills
+        {"id": s.id, "name": s.name, "level": None, "icon": s.icon}
+        for s in get_catalog(db).search_skills(q, limit)
     ]
 
 
@@ -35,6 +25,7 @@ def create_skill(db: Session, name: str) -> Skill:
     db.add(skill)
     db.commit()
     db.refresh(skill)
+    refresh_catalog(db)
     return skill
 
 
@@ -57,6 +48,7 @@ def add_user_skill(db: Session, user_id: int, skill_id: int, level: int):
     db.add(user_skill)
     db.commit()
     db.refresh(user_skill)
+    invalidate_profile(user_id)
     return {
         "id": skill.id,
         "name": skill.name,
@@ -97,6 +89,7 @@ def update_user_skill_level(db: Session, user_id: int, skill_id: int, level: int
 
     user_skill.level = level
     db.commit()
+    invalidate_profile(user_id)
 
     skill = db.query(Skill).get(skill_id)
     return {
@@ -117,5 +110,6 @@ def remove_user_skill(db: Session, user_id: int, skill_id: int):
 
     db.delete(user_skill)
     db.commit()
+    invalidate_profile(user_id)
     return {"success": True, "message": "스킬이 삭제되었습니다."}
 
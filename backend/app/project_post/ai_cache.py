@@ -0,0 +1,168 @@
+# ============================================================
+# 📁 /app/project_post/ai_cache.py
+# ------------------------------------------------------------
+# AI 설명 생성 결과 캐시 + 사용자별 사용량(쿼터) 집계
+# - 키: sha256(시스템 프롬프트 버전 + 정규화된 요약문)
+# - 1차: 메모리 LRU / 2차(선택): SQLite 파일 (AI_CACHE_PATH 설정 시)
+# - 쿼터: 캐시 적중은 차감하지 않고 실제 업스트림 호출만 하루 단위로 집계
+# ============================================================
+
+import os
+import re
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, Optional, Tuple
+
+from app.core.cache import TTLCache, MISSING
+
+AI_CACHE_SIZE = int(os.getenv("AI_CACHE_SIZE", "512"))
+AI_CACHE_TTL_SEC = int(os.getenv("AI_CACHE_TTL_SEC", str(7 * 24 * 3600)))
+AI_CACHE_PATH = os.getenv("AI_CACHE_PATH")  # 예: cache/ai_expand.sqlite3
+AI_CACHE_DISK_MAX = int(os.getenv("AI_CACHE_DISK_MAX", "10000"))
+AI_DAILY_QUOTA = int(os.getenv("AI_DAILY_QUOTA", "20"))
+
+KST = timezone(timedelta(hours=9))
+
+
+def normalize_prompt(prompt: str) -> str:
+    """공백/대소문자/전각문자/끝 문장부호 차이를 무시한 비교용 문자열"""
+    text = unicodedata.normalize("NFKC", prompt or "").casefold()
+    text = re.sub(r"\s+", " ", text).strip()
+    return text.rstrip(".!?~ ")
+
+
+def cache_key(prompt: str, prompt_version: str) -> str:
+    raw = f"{prompt_version}\n{normalize_prompt(prompt)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# ============================================================
+# 🗃️ 결과 캐시
+# ============================================================
+class ExpansionCache:
+    def __init__(
+        self,
+        maxsize: int = AI_CACHE_SIZE,
+        ttl: int = AI_CACHE_TTL_SEC,
+        path: Optional[str] = AI_CACHE_PATH,
+        disk_max: int = AI_CACHE_DISK_MAX,
+    ):
+        self._memory = TTLCache(maxsize=maxsize, default_ttl=ttl)
+        self._path = path
+        self._disk_max = disk_max
+        self._lock = threading.Lock()
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS ai_expand_cache ("
+                    " cache_key TEXT PRIMARY KEY,"
+                    " description TEXT NOT NULL,"
+                    " last_used REAL NOT NULL)"
+                )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """커밋 후 연결까지 닫는 SQLite 세션"""
+        conn = sqlite3.connect(self._path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._memory.get(key)
+        if value is not MISSING:
+            return value
+        if not self._path:
+            return None
+
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT description FROM ai_expand_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row:
+                conn.execute(
+                    "UPDATE ai_expand_cache SET last_used = ? WHERE cache_key = ?",
+                    (datetime.now().timestamp(), key),
+                )
+        if not row:
+            return None
+        self._memory.set(key, row[0])
+        return row[0]
+
+    def set(self, key: str, description: str) -> None:
+        self._memory.set(key, description)
+        if not self._path:
+            return
+
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO ai_expand_cache (cache_key, description, last_used)"
+                " VALUES (?, ?, ?)",
+                (key, description, datetime.now().timestamp()),
+            )
+            # ✅ 디스크 LRU: 오래 안 쓰인 항목부터 정리
+            conn.execute(
+                "DELETE FROM ai_expand_cache WHERE cache_key IN ("
+                " SELECT cache_key FROM ai_expand_cache"
+                " ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self._disk_max,),
+            )
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self._path:
+            with self._lock, self._connect() as conn:
+                conn.execute("DELETE FROM ai_expand_cache")
+
+
+# ============================================================
+# 📊 사용자별 일일 쿼터
+# ============================================================
+class AIQuota:
+    """KST 자정 기준 하루 업스트림 호출 횟수 제한 (프로세스 로컬)"""
+
+    def __init__(self, daily_limit: int = AI_DAILY_QUOTA):
+        self.daily_limit = daily_limit
+        self._usage: Dict[str, Tuple[str, int]] = {}  # owner → (날짜, 사용 횟수)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(KST).date().isoformat()
+
+    def remaining(self, owner: str) -> int:
+        with self._lock:
+            day, used = self._usage.get(owner, (self._today(), 0))
+            if day != self._today():
+                used = 0
+            return max(self.daily_limit - used, 0)
+
+    def consume(self, owner: str) -> bool:
+        """1회 차감 (남은 횟수가 없으면 False)"""
+        today = self._today()
+        with self._lock:
+            day, used = self._usage.get(owner, (today, 0))
+            if day != today:
+                used = 0
+            if used >= self.daily_limit:
+                return False
+            self._usage[owner] = (today, used + 1)
+            return True
+
+    def refund(self, owner: str) -> None:
+        """업스트림 호출 실패 시 차감 취소"""
+        with self._lock:
+            day, used = self._usage.get(owner, (self._today(), 0))
+            if used > 0:
+                self._usage[owner] = (day, used - 1)
+
+
+expansion_cache = ExpansionCache()
+quota = AIQuota()
@@ -0,0 +1,149 @@
+# ============================================================
+# 📁 /app/project_post/ai_client.py
+# ------------------------------------------------------------
+# AI 설명 생성용 백엔드 (ai_router 전용)
+# - OpenAI 클라이언트는 프로세스당 1개만 생성해 커넥션 풀/TLS 재사용
+# - 요청 타임아웃 + 동시 요청 수 제한
+# - AI_BACKEND=fake 이면 네트워크 없이 고정 응답 (테스트/로컬 개발용)
+# ============================================================
+
+import os
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+AI_MODEL = os.getenv("AI_MODEL", "gpt-4o-mini")
+AI_TIMEOUT_SEC = float(os.getenv("AI_TIMEOUT_SEC", "60"))
+AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "8"))
+AI_QUEUE_TIMEOUT_SEC = float(os.getenv("AI_QUEUE_TIMEOUT_SEC", "10"))
+
+
+class AIBusyError(Exception):
+    """동시 요청 한도 초과로 대기 시간 안에 슬롯을 얻지 못함"""
+
+
+# ============================================================
+# 🤖 백엔드 구현
+# ============================================================
+class AIBackend(ABC):
+    @abstractmethod
+    async def complete(self, system_prompt: str, user_prompt: str) -> str:
+        ...
+
+    @abstractmethod
+    def stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        ...
+
+
+class OpenAIBackend(AIBackend):
+    """AsyncOpenAI 단일 인스턴스 재사용 (keep-alive 커넥션 풀)"""
+
+    def __init__(self):
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(
+                api_key=os.getenv("OPENAI_API_KEY"),
+                timeout=AI_TIMEOUT_SEC,
+                max_retries=1,
+                http_client=httpx.AsyncClient(
+                    timeout=httpx.Timeout(AI_TIMEOUT_SEC, connect=5.0),
+                    limits=httpx.Limits(
+                        max_connections=AI_MAX_CONCURRENCY,
+                        max_keepalive_connections=AI_MAX_CONCURRENCY,
+                    ),
+                ),
+            )
+        return self._client
+
+    def _messages(self, system_prompt: str, user_prompt: str) -> list:
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    async def complete(self, system_prompt: str, user_prompt: str) -> str:
+        completion = await self.client.chat.completions.create(
+            model=AI_MODEL,
+            temperature=0.7,
+            messages=self._messages(system_prompt, user_prompt),
+        )
+        return completion.choices[0].message.content or ""
+
+    async def stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        response = await self.client.chat.completions.create(
+            model=AI_MODEL,
+            temperature=0.7,
+            messages=self._messages(system_prompt, user_prompt),
+            stream=True,
+        )
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+class FakeAIBackend(AIBackend):
+    """네트워크 없이 동작하는 고정 응답 백엔드"""
+
+    def __init__(self, text: Optional[str] = None, chunk_size: int = 16):
+        self.text = text or (
+            "1. 프로젝트 소개\n\n1) 시작 동기\n테스트용 설명입니다.\n\n"
+            "2. 회의 진행 및 모임방식\n\n1) 회의 빈도\n주 1회\n\n"
+            "3. 나의 경험 및 역할\n\n1) 현재까지 경험\n없음"
+        )
+        self.chunk_size = chunk_size
+        self.calls = 0
+
+    async def complete(self, system_prompt: str, user_prompt: str) -> str:
+        self.calls += 1
+        return self.text
+
+    async def stream(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        self.calls += 1
+        for i in range(0, len(self.text), self.chunk_size):
+            yield self.text[i:i + self.chunk_size]
+
+
+# ============================================================
+# ⚙️ 백엔드 선택 / 동시성 제한
+# ============================================================
+_backend: AIBackend = FakeAIBackend() if os.getenv("AI_BACKEND") == "fake" else OpenAIBackend()
+_semaphore = asyncio.Semaphore(AI_MAX_CONCURRENCY)
+
+
+def get_backend() -> AIBackend:
+    return _backend
+
+
+def set_backend(backend: AIBackend) -> None:
+    """백엔드 교체 (테스트에서 FakeAIBackend 주입)"""
+    global _backend
+    _backend = backend
+
+
+@asynccontextmanager
+async def ai_slot():
+    """동시 요청 수 제한 (async with ai_slot(): ...)"""
+    try:
+        await asyncio.wait_for(_semaphore.acquire(), timeout=AI_QUEUE_TIMEOUT_SEC)
+    except asyncio.TimeoutError:
+        raise AIBusyError()
+    try:
+        yield
+    finally:
+        _semaphore.release()
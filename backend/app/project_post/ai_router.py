@@ -7,64 +7,31 @@
 # - '4. 그 외 자유기재' 섹션은 무조건 포함시키고 내용은 비움
 # ============================================================
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from openai import OpenAI
-import os
+import hashlib
+import json
 import re
+import sys
+import traceback
+from typing import Optional
 from dotenv import load_dotenv
 
+from app.core.deps import get_current_user_optional
+from app.users.user_model import User
+from app.project_post.ai_client import AIBusyError, ai_slot, get_backend
+from app.project_post.ai_cache import cache_key, expansion_cache, quota
+
 # ✅ .env 자동 로드
 load_dotenv()
 
 router = APIRouter(prefix="/ai", tags=["ai"])
 
 # ============================================================
-# 📦 Request 모델
-# ============================================================
-class PromptRequest(BaseModel):
-    prompt: str
-
-
-# ============================================================
-# 🔧 후처리: 4번 섹션 강제 삽입
+# 🧾 시스템 프롬프트 (✅ 벤치마킹 사이트 수준의 상세 서식)
 # ============================================================
-def ensure_section4_exists(text: str) -> str:
-    """
-    1) '4. 그 외 자유기재' 섹션이 없으면 자동 추가
-    2) 있을 경우 내용이 있으면 제거하고 안내문만 남김
-    """
-    title = "4. 그 외 자유기재"
-    hint = "(예: 모집 인원, 우대사항, 희망 일정 등)"
-
-    # 줄바꿈 통일
-    text = text.replace("\r\n", "\n").replace("\r", "\n").strip()
-
-    if title in text:
-        # 이미 존재하는 경우, 그 뒤의 내용 제거하고 안내문만 남김
-        text = re.split(rf"{title}.*", text, maxsplit=1)[0].rstrip()
-    # 섹션4 추가
-    text += f"\n\n{title}\n{hint}\n"
-    return text
-
-
-# ============================================================
-# 🤖 프로젝트 설명 확장 API
-# ------------------------------------------------------------
-# POST /ai/expand
-# ============================================================
-@router.post("/expand")
-def expand_description(req: PromptRequest):
-    """
-    사용자가 입력한 간단한 요약문(prompt)을 받아
-    프로젝트 설명 형식에 맞게 자연스럽고 정돈된 문장을 생성합니다.
-    """
-    try:
-        # ✅ 클라이언트는 요청 시점마다 새로 생성 (Windows 환경 안정화)
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
-        # ✅ 벤치마킹 사이트 수준의 상세 서식
-        system_prompt = """
+SYSTEM_PROMPT = """
 너는 '프로젝트 모집 게시글 작성 보조 AI'야.
 사용자가 50자 내외의 간단한 요약문을 입력하면,
 아래와 같은 **기획서 형식**으로 완성도 높은 프로젝트 설명을 작성해줘.
@@ -133,21 +100,165 @@ def expand_description(req: PromptRequest):
 ──────────────────────────────
 """
 
-        completion = client.chat.completions.create(
-            model="gpt-4o-mini",  # ✅ 성능/가격 균형
-            temperature=0.7,      # ✅ 구조 고정성 향상
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": f"리더의 요약문: {req.prompt}"},
-            ],
+# ✅ 프롬프트가 수정되면 버전이 바뀌어 이전 캐시는 자동으로 무시됨
+PROMPT_VERSION = hashlib.sha256(SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:12]
+
+
+# ============================================================
+# 📦 Request 모델
+# ============================================================
+class PromptRequest(BaseModel):
+    prompt: str
+
+
+# ============================================================
+# 🔧 후처리: 4번 섹션 강제 삽입
+# ============================================================
+def ensure_section4_exists(text: str) -> str:
+    """
+    1) '4. 그 외 자유기재' 섹션이 없으면 자동 추가
+    2) 있을 경우 내용이 있으면 제거하고 안내문만 남김
+    """
+    title = "4. 그 외 자유기재"
+    hint = "(예: 모집 인원, 우대사항, 희망 일정 등)"
+
+    # 줄바꿈 통일
+    text = text.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+    if title in text:
+        # 이미 존재하는 경우, 그 뒤의 내용 제거하고 안내문만 남김
+        text = re.split(rf"{title}.*", text, maxsplit=1)[0].rstrip()
+    # 섹션4 추가
+    text += f"\n\n{title}\n{hint}\n"
+    return text
+
+
+# ============================================================
+# 🤖 프로젝트 설명 확장 API
+# ------------------------------------------------------------
+# POST /ai/expand
+# ============================================================
+def _user_prompt(prompt: str) -> str:
+    return f"리더의 요약문: {prompt}"
+
+
+def _busy_exception() -> HTTPException:
+    return HTTPException(
+        status_code=503, detail="AI 요청이 많습니다. 잠시 후 다시 시도해주세요."
+    )
+
+
+def _quota_owner(request: Request, user: Optional[User]) -> str:
+    """쿼터 집계 단위: 로그인 사용자는 user.id, 비로그인은 IP"""
+    if user:
+        return f"user:{user.id}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def _consume_quota(owner: str) -> None:
+    if not quota.consume(owner):
+        raise HTTPException(
+            status_code=429,
+            detail=f"오늘 AI 생성 가능 횟수({quota.daily_limit}회)를 모두 사용했습니다.",
         )
 
-        result = completion.choices[0].message.content.strip()
-        result = ensure_section4_exists(result)  # ✅ 4번 섹션 강제 추가
 
-        return {"description": result}
+@router.post("/expand")
+async def expand_description(
+    req: PromptRequest,
+    request: Request,
+    user: Optional[User] = Depends(get_current_user_optional),
+):
+    """
+    사용자가 입력한 간단한 요약문(prompt)을 받아
+    프로젝트 설명 형식에 맞게 자연스럽고 정돈된 문장을 생성합니다.
+    (같은/거의 같은 요약문은 캐시에서 즉시 반환, 쿼터 차감 없음)
+    """
+    key = cache_key(req.prompt, PROMPT_VERSION)
+    cached = expansion_cache.get(key)
+    if cached is not None:
+        return {"description": cached, "cached": True}
 
+    owner = _quota_owner(request, user)
+    _consume_quota(owner)
+    try:
+        # ✅ 공유 클라이언트 재사용 + 동시 요청 수 제한
+        async with ai_slot():
+            result = await get_backend().complete(SYSTEM_PROMPT, _user_prompt(req.prompt))
+
+        result = ensure_section4_exists(result.strip())  # ✅ 4번 섹션 강제 추가
+        expansion_cache.set(key, result)
+        return {
+            "description": result,
+            "cached": False,
+            "quota_remaining": quota.remaining(owner),
+        }
+
+    except AIBusyError:
+        quota.refund(owner)
+        raise _busy_exception()
     except Exception as e:
-        import traceback, sys
+        quota.refund(owner)
         print("🔥 AI Error:\n", traceback.format_exc(), file=sys.stderr, flush=True)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+# ============================================================
+# 📡 스트리밍 버전 (Server-Sent Events)
+# ------------------------------------------------------------
+# POST /ai/expand/stream
+# - event: delta → {"text": 생성 중인 조각}
+# - event: done  → {"description": 4번 섹션 후처리된 최종본}
+# - event: error → {"detail": 오류 메시지}
+# ============================================================
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _sse_response(source) -> StreamingResponse:
+    return StreamingResponse(
+        source,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/expand/stream")
+async def expand_description_stream(
+    req: PromptRequest,
+    request: Request,
+    user: Optional[User] = Depends(get_current_user_optional),
+):
+    """생성되는 문장을 도착하는 대로 SSE로 전달 (캐시 적중 시 한 번에 전달)"""
+    key = cache_key(req.prompt, PROMPT_VERSION)
+    cached = expansion_cache.get(key)
+    if cached is not None:
+
+        async def cached_source():
+            yield _sse("delta", {"text": cached})
+            yield _sse("done", {"description": cached, "cached": True})
+
+        return _sse_response(cached_source())
+
+    owner = _quota_owner(request, user)
+    _consume_quota(owner)  # ✅ 스트림 시작 전에 검사해야 429 상태코드 전달 가능
+
+    async def event_source():
+        parts = []
+        try:
+            async with ai_slot():
+                async for delta in get_backend().stream(SYSTEM_PROMPT, _user_prompt(req.prompt)):
+                    parts.append(delta)
+                    yield _sse("delta", {"text": delta})
+            result = ensure_section4_exists("".join(parts).strip())
+            expansion_cache.set(key, result)
+            yield _sse("done", {"description": result, "cached": False})
+        except AIBusyError:
+            quota.refund(owner)
+            yield _sse("error", {"detail": _busy_exception().detail})
+        except Exception as e:
+            quota.refund(owner)
+            print("🔥 AI Stream Error:\n", traceback.format_exc(), file=sys.stderr, flush=True)
+            yield _sse("error", {"detail": str(e)})
+
+    return _sse_response(event_source())
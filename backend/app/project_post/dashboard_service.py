@@ -0,0 +1,185 @@
+# ============================================================
+# 📁 /app/project_post/dashboard_service.py
+# ------------------------------------------------------------
+# 마이페이지 대시보드: 내가 리더인 공고 / 참여중인 공고 / 지원 대기 공고
+# - 세 구역을 UNION ALL 한 번 + 스킬 IN 조회 한 번 (총 2쿼리)
+# - 필요한 컬럼만 조회 (멤버/지원분야 컬렉션 로드 없음)
+# - 구역별 커서 페이지네이션: (정렬시각, post_id) 내림차순 keyset
+# - 사용자별 캐시: 멤버십/지원 상태가 바뀌면 invalidate_user() → 버전 증가
+# ============================================================
+
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text, bindparam, Date, DateTime
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache, MISSING
+from app.core.pagination import encode_cursor, decode_cursor
+
+DASHBOARD_CACHE_TTL_SEC = float(os.getenv("DASHBOARD_CACHE_TTL_SEC", "60"))
+DASHBOARD_MAX_LIMIT = 50
+
+SECTIONS = ("led", "joined", "applied")
+
+_POST_FIELDS = (
+    "id", "title", "type", "image_url", "capacity", "current_members",
+    "status", "recruit_status", "project_status", "leader_id", "created_at",
+    "start_date", "end_date", "project_start", "project_end",
+)
+_POST_COLUMNS = ", ".join(f"p.{field}" for field in _POST_FIELDS)
+# 구역별 서브쿼리 결과 컬럼 (바깥 SELECT 에서 그대로 나열)
+_ROW_COLUMNS = ", ".join(("section", "sort_at", "member_role", "application_id") + _POST_FIELDS)
+
+# 구역별: (정렬 기준 컬럼, FROM/WHERE 절, 구역 전용 컬럼)
+_SECTION_SQL = {
+    "led": (
+        "p.created_at",
+        "FROM posts p WHERE p.leader_id = :user_id AND p.deleted_at IS NULL",
+        "NULL AS member_role, NULL AS application_id",
+    ),
+    "joined": (
+        "pm.joined_at",
+        "FROM post_members pm JOIN posts p ON p.id = pm.post_id"
+        " WHERE pm.user_id = :user_id AND pm.role = 'MEMBER' AND p.deleted_at IS NULL",
+        "pm.role AS member_role, NULL AS application_id",
+    ),
+    "applied": (
+        "a.created_at",
+        "FROM applications a JOIN posts p ON p.id = a.post_id"
+        " WHERE a.user_id = :user_id AND a.status = 'PENDING' AND p.deleted_at IS NULL",
+        "NULL AS member_role, a.id AS application_id",
+    ),
+}
+
+
+# ============================================================
+# 🗃️ 사용자별 캐시
+# ============================================================
+_cache = TTLCache(maxsize=4096, default_ttl=DASHBOARD_CACHE_TTL_SEC)
+_versions: Dict[int, int] = {}
+_versions_lock = threading.Lock()
+
+
+def invalidate_user(*user_ids: Optional[int]) -> None:
+    with _versions_lock:
+        for user_id in user_ids:
+            if user_id is not None:
+                _versions[user_id] = _versions.get(user_id, 0) + 1
+
+
+def invalidate_post_members(db: Session, post_id: int) -> None:
+    """공고 자체가 바뀐 경우 (수정/종료/삭제/인원 변동) 리더·멤버·대기 지원자 모두"""
+    user_ids = db.execute(
+        text("""
+            SELECT user_id FROM post_members WHERE post_id = :pid
+            UNION
+            SELECT user_id FROM applications WHERE post_id = :pid AND status = 'PENDING'
+        """),
+        {"pid": post_id},
+    ).scalars().all()
+    invalidate_user(*user_ids)
+
+
+def _version(user_id: int) -> int:
+    with _versions_lock:
+        return _versions.get(user_id, 0)
+
+
+# ============================================================
+# 📋 조회
+# ============================================================
+def _section_query(section: str, cursor: Optional[Tuple[datetime, int]]) -> str:
+    sort_col, from_where, extra = _SECTION_SQL[section]
+    keyset = ""
+    if cursor:
+        keyset = (
+            f" AND ({sort_col} < :{section}_ts"
+            f" OR ({sort_col} = :{section}_ts AND p.id < :{section}_id))"
+        )
+    return (
+        f"SELECT {_ROW_COLUMNS} FROM (SELECT '{section}' AS section, {sort_col} AS sort_at, {extra}, {_POST_COLUMNS}"
+        f" {from_where}{keyset}"
+        f" ORDER BY sort_at DESC, p.id DESC LIMIT :limit) {section}_rows"
+    )
+
+
+def _load_skills(db: Session, post_ids: Iterable[int]) -> Dict[int, List[dict]]:
+    post_ids = list(set(post_ids))
+    if not post_ids:
+        return {}
+    rows = db.execute(
+        text("""
+            SELECT ps.post_id, s.id, s.name
+            FROM post_skills ps
+            JOIN skills s ON s.id = ps.skill_id
+            WHERE ps.post_id IN :post_ids
+            ORDER BY ps.post_id, s.id
+        """).bindparams(bindparam("post_ids", expanding=True)),
+        {"post_ids": post_ids},
+    ).all()
+    skills: Dict[int, List[dict]] = {}
+    for post_id, skill_id, name in rows:
+        skills.setdefault(post_id, []).append({"id": skill_id, "name": name})
+    return skills
+
+
+def get_dashboard(
+    db: Session,
+    user_id: int,
+    limit: int = 10,
+    cursors: Optional[Dict[str, Optional[str]]] = None,
+    sections: Iterable[str] = SECTIONS,
+) -> dict:
+    """
+    {"led": {"items": [...], "next_cursor": str|None}, "joined": {...}, "applied": {...}}
+    - cursors: 구역별 다음 페이지 커서 (더보기)
+    - sections: 일부 구역만 조회할 때
+    """
+    limit = max(1, min(limit, DASHBOARD_MAX_LIMIT))
+    cursors = {s: c for s, c in (cursors or {}).items() if c}
+    sections = [s for s in SECTIONS if s in set(sections)]
+
+    key = (user_id, _version(user_id), limit, tuple(sections), tuple(sorted(cursors.items())))
+    cached = _cache.get(key)
+    if cached is not MISSING:
+        return cached
+
+    params = {"user_id": user_id, "limit": limit + 1}
+    binds = []
+    parts = []
+    for section in sections:
+        cursor = decode_cursor(cursors[section]) if section in cursors else None
+        if cursor:
+            params[f"{section}_ts"], params[f"{section}_id"] = cursor
+            binds.append(bindparam(f"{section}_ts", type_=DateTime))
+        parts.append(_section_query(section, cursor))
+
+    result = {section: {"items": [], "next_cursor": None} for section in sections}
+    if parts:
+        stmt = (
+            text(" UNION ALL ".join(parts))
+            .bindparams(*binds)
+            .columns(
+                sort_at=DateTime, created_at=DateTime,
+                start_date=Date, end_date=Date, project_start=Date, project_end=Date,
+            )
+        )
+        rows = db.execute(stmt, params).mappings().all()
+
+        for row in rows:
+            result[row["section"]]["items"].append({k: v for k, v in row.items() if k != "section"})
+
+        skills = _load_skills(db, (row["id"] for row in rows))
+        for section, page in result.items():
+            items = page["items"]
+            if len(items) > limit:
+                items.pop()
+                page["next_cursor"] = encode_cursor(items[-1]["sort_at"], items[-1]["id"])
+            for item in items:
+                item["skills"] = skills.get(item["id"], [])
+
+    _cache.set(key, result)
+    return result
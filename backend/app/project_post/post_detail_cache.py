@@ -0,0 +1,88 @@
+# ============================================================
+# 📁 /app/project_post/post_detail_cache.py
+# ------------------------------------------------------------
+# 모집공고 상세(/recipe/{post_id}) DTO 읽기 캐시
+# - 게시글별 버전 카운터: 수정/지원/승인/거절/탈퇴/강퇴/종료/삭제 시 invalidate() → 버전 증가
+#   (최근 invalidate 된 게시글만 보관, 밀려난 게시글은 _floor 버전으로 취급 → 메모리 상한)
+# - 조회 도중 invalidate 되면 이전 버전 결과는 저장하지 않음 (stale 덮어쓰기 방지)
+# - ETag = DTO JSON 해시 → 조건부 GET(If-None-Match) 304 응답
+# - 프로세스 로컬 캐시이므로 TTL로 다른 워커/프로필 변경분의 지연 상한을 둠
+# ============================================================
+
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+from app.core.cache import TTLCache, MISSING
+
+POST_DETAIL_CACHE_SIZE = int(os.getenv("POST_DETAIL_CACHE_SIZE", "2048"))
+POST_DETAIL_CACHE_TTL_SEC = float(os.getenv("POST_DETAIL_CACHE_TTL_SEC", "60"))
+
+
+class CachedDetail(NamedTuple):
+    version: int
+    etag: str
+    payload: Dict[str, Any]  # jsonable_encoder 적용된 RecipePostResponse
+
+
+def make_etag(post_id: int, payload: Dict[str, Any]) -> str:
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return f'"p{post_id}-{hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]}"'
+
+
+class PostDetailCache:
+    def __init__(self, maxsize: int = POST_DETAIL_CACHE_SIZE, ttl: float = POST_DETAIL_CACHE_TTL_SEC):
+        self._entries = TTLCache(maxsize=maxsize, default_ttl=ttl)
+        self._versions: "OrderedDict[int, int]" = OrderedDict()  # 최근 invalidate 된 게시글 (최대 maxsize개)
+        self._max_versions = maxsize
+        self._counter = 0  # 전역 단조 증가 버전
+        self._floor = 0    # 목록에 없는 게시글의 버전 (밀려난 버전 중 최댓값 → 진행 중 조회의 stale 저장 방지 유지)
+        self._lock = threading.Lock()
+
+    def _current(self, post_id: int) -> int:
+        return self._versions.get(post_id, self._floor)
+
+    def version(self, post_id: int) -> int:
+        """DB 조회 직전에 읽어 두고 set()에 넘긴다"""
+        with self._lock:
+            return self._current(post_id)
+
+    def get(self, post_id: int) -> Optional[CachedDetail]:
+        entry = self._entries.get(post_id)
+        if entry is MISSING:
+            return None
+        with self._lock:
+            if entry.version != self._current(post_id):
+                return None
+        return entry
+
+    def set(self, post_id: int, version: int, payload: Dict[str, Any]) -> CachedDetail:
+        entry = CachedDetail(version, make_etag(post_id, payload), payload)
+        with self._lock:
+            if version == self._current(post_id):
+                self._entries.set(post_id, entry)
+        return entry
+
+    def invalidate(self, post_id: int) -> None:
+        with self._lock:
+            self._counter += 1
+            self._versions[post_id] = self._counter
+            self._versions.move_to_end(post_id)
+            while len(self._versions) > self._max_versions:
+                _, evicted = self._versions.popitem(last=False)
+                self._floor = max(self._floor, evicted)
+            self._entries.delete(post_id)
+
+    def clear(self) -> None:
+        """스케줄러 일괄 상태 전환 등 다수 게시글이 바뀐 경우"""
+        with self._lock:
+            self._counter += 1
+            self._floor = self._counter
+            self._versions.clear()
+            self._entries.clear()
+
+
+post_detail_cache = PostDetailCache()
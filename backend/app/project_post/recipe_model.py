@@ -1,5 +1,5 @@
 # app/project_post/recipe_model.py
-from sqlalchemy import Column, BigInteger, String, Text, Date, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, BigInteger, Integer, String, Text, Date, DateTime, Enum, ForeignKey
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.core.base import Base
@@ -50,9 +50,13 @@ class RecipeFile(Base):
 
     id = Column(BigInteger, primary_key=True, index=True)
     post_id = Column(BigInteger, ForeignKey("posts.id", ondelete="CASCADE"))
-    user_id = Column(BigInteger, ForeignKey("users.id"), nullable=False)
+    user_id = Column(BigInteger, ForeignKey("users.id"), nullable=True)  # 기존 파일 일괄 등록 시 NULL
     file_url = Column(String(255), nullable=False)
     file_type = Column(String(50))
+    content_hash = Column(String(64), unique=True)     # sha256 (업로드 중복 제거 키)
+    size_bytes = Column(BigInteger)
+    ref_count = Column(Integer, nullable=False, default=0)  # 게시글/프로필/게시판 참조 수
+    last_seen_at = Column(DateTime)                    # 마지막 업로드/참조 변경 (GC 유예 기준)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     post = relationship("RecipePost", back_populates="files")
@@ -1,9 +1,10 @@
 # app/project_post/recipe_router.py
-from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Body, Header, Response
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session, joinedload, aliased
 from typing import List, Optional
-from datetime import date, datetime, timedelta  # ✅ timedelta 추가 (쿨타임 계산용)
-from sqlalchemy import func, text, or_, and_  # ✅ or_, and_ 추가
+from datetime import date, datetime
+from sqlalchemy import text
 from app.profile.profile_model import Profile
 from app.users.user_model import User
 
@@ -14,7 +15,12 @@ from app.project_post.recipe_schema import (
     RecipePostResponse,
     PostMemberResponse,
 )
-from app.project_post import recipe_service, recipe_model as models
+from app.project_post import recipe_service, dashboard_service, recipe_model as models
+from app.project_post.post_detail_cache import post_detail_cache
+from app.core.http_cache import conditional_json
+from app.project_post.skill_index import skill_index
+from app.files.image_derivatives import thumbnail_url
+from app.files import file_store
 from app.project_post.post_member_model import PostMember
 from app.project_post.recipe_model import Application
 from app.users.user_model import User
@@ -30,32 +36,24 @@ router = APIRouter(prefix="/recipe", tags=["recipe"])
 # ---------------------------------------------------------------------
 # ✅ 내부 유틸: 상태 자동 갱신
 # ---------------------------------------------------------------------
+# ⚠️ 목록 조회에서는 호출하지 않음 (날짜 전환은 recipe_scheduler가 자정마다 일괄 처리)
+#    멤버가 이미 로드된 단건/소량 조회에서만 사용
 def _apply_auto_state_updates_for_posts(db: Session, posts: List[models.RecipePost]):
-    today = date.today()
+    today = recipe_service.kst_today()
     changed = False
 
     for post in posts:
-        # 모집 기간 종료 시 자동 마감
-        if post.end_date and post.end_date < today and post.recruit_status == "OPEN":
-            post.recruit_status = "CLOSED"
-            changed = True
-
-        # 프로젝트 기간 종료 시 자동 종료
-        if (
-            post.project_end
-            and post.project_end < today
-            and post.project_status == "ONGOING"
-        ):
-            post.project_status = "ENDED"
+        # 모집 기간 종료 시 자동 마감 / 프로젝트 기간 종료 시 자동 종료
+        if recipe_service.apply_date_transitions_for_post(post, today):
             changed = True
 
         # 정원 자동 마감 처리
-        if len(post.members) >= post.capacity and post.recruit_status == "OPEN":
+        if post.current_members >= post.capacity and post.recruit_status == "OPEN":
             post.recruit_status = "CLOSED"
             changed = True
         # ✅ 정원 늘린 경우 자동 재개 (단, 리더가 수동으로 닫은 상태는 유지)
         elif (
-            len(post.members) < post.capacity
+            post.current_members < post.capacity
             and post.recruit_status == "CLOSED"
             and post.project_status != "ONGOING"  # ⚠️ 진행중인 프로젝트는 자동 재개 금지
         ):
@@ -76,17 +74,22 @@ def _apply_auto_state_updates_for_single(db: Session, post: models.RecipePost):
 # ---------------------------------------------------------------------
 # ✅ DTO 변환
 # ---------------------------------------------------------------------
-def to_dto(post: models.RecipePost) -> RecipePostResponse:
-    """게시글 → DTO 변환"""
+# ✅ 이미지 경로를 절대경로로 보정하는 헬퍼
+def _full_url(path: str | None):
+    if not path:
+        return None
+    if path.startswith("http"):
+        return path
+    return f"http://localhost:8000{path}"  # ✅ 로컬 서버 기준
 
-    # ✅ 이미지 경로를 절대경로로 보정하는 헬퍼
-    def _full_url(path: str | None):
-        if not path:
-            return None
-        if path.startswith("http"):
-            return path
-        return f"http://localhost:8000{path}"  # ✅ 로컬 서버 기준
 
+def to_dto(post: models.RecipePost, include_members: bool = True, thumbnail: bool = False) -> RecipePostResponse:
+    """
+    게시글 → DTO 변환
+    - 목록에선 include_members=False → 멤버 행 로드 안 함
+    - thumbnail=True → image_url 을 목록 카드용 썸네일(WebP)로
+    """
+    image_url = thumbnail_url(post.image_url, "md") if thumbnail else post.image_url
     return RecipePostResponse(
         id=post.id,
         title=post.title,
@@ -102,8 +105,8 @@ def to_dto(post: models.RecipePost) -> RecipePostResponse:
         status=post.status,
         recruit_status=post.recruit_status,
         created_at=post.created_at,
-        current_members=len(post.members),
-        image_url=_full_url(post.image_url),
+        current_members=post.current_members or 0,  # ✅ 비정규화 컬럼 사용
+        image_url=_full_url(image_url),
         leader_id=post.leader_id,
         skills=[
             SkillResponse(id=s.skill.id, name=s.skill.name)
@@ -123,7 +126,7 @@ def to_dto(post: models.RecipePost) -> RecipePostResponse:
                 ),  # ✅ 절대경로 보정
             )
             for m in post.members
-        ],
+        ] if include_members else [],
     )
 
 
@@ -141,6 +144,7 @@ async def create_post(
         leader_id=current_user.id,
         **payload.dict()
     )
+    dashboard_service.invalidate_user(current_user.id)
     db.refresh(new_post)
     return to_dto(new_post)
 
@@ -175,6 +179,7 @@ async def update_post(
     post.end_date = payload.end_date
     post.project_start = payload.project_start
     post.project_end = payload.project_end
+    file_store.replace_ref(db, post.image_url, payload.image_url)
     post.image_url = payload.image_url
 
     # skill 갱신
@@ -189,7 +194,10 @@ async def update_post(
 
     # ✅ 정원 변경 시 상태 자동 업데이트
     db.commit()
+    skill_index.set_post(post.id, payload.skills)
     _apply_auto_state_updates_for_single(db, post)
+    post_detail_cache.invalidate(post_id)
+    dashboard_service.invalidate_post_members(db, post_id)
     db.refresh(post)
     return to_dto(post)
 
@@ -218,88 +226,26 @@ async def get_posts(
         "CLOSED" → 모집완료 (CLOSED and ONGOING)
         None → 전체 (project_status != ENDED)
     """
-    # ✅ 상태 자동 업데이트 (모집기간 / 프로젝트기간 / 정원)
-    prescan = db.query(models.RecipePost).filter(
-        models.RecipePost.status == status,
-        models.RecipePost.deleted_at.is_(None)
-    ).all()
-    _apply_auto_state_updates_for_posts(db, prescan)
-
-    # ✅ 기본 쿼리
-    query = (
-        db.query(models.RecipePost)
-        .options(
-            joinedload(models.RecipePost.skills).joinedload(models.RecipePostSkill.skill),
-            joinedload(models.RecipePost.application_fields).joinedload(models.RecipePostRequiredField.field),
-            joinedload(models.RecipePost.members),
-        )
-        .filter(models.RecipePost.status == status)
-        .filter(models.RecipePost.deleted_at.is_(None))
+    # ✅ 읽기 전용: 상태 전환은 스케줄러(기간) / 승인·탈퇴·강퇴(정원)에서 처리
+    # ✅ COUNT / id 페이지 / 연관 컬렉션 일괄 로드를 분리 (recipe_service.list_recipe_posts)
+    posts, total = recipe_service.list_recipe_posts(
+        db,
+        status=status,
+        recruit_status=recruit_status,
+        type=type,
+        skill_ids=skill_ids,
+        match_mode=match_mode,
+        start_date=start_date,
+        end_date=end_date,
+        search=search,
+        page=page,
+        page_size=page_size,
     )
-
-    # ✅ 모집상태별 조건 처리 (수정된 핵심 부분)
-    if recruit_status == "OPEN":
-        # 모집중 → 모집상태가 OPEN이고, 종료되지 않은 프로젝트만
-        query = query.filter(
-            and_(
-                models.RecipePost.recruit_status == "OPEN",
-                models.RecipePost.project_status != "ENDED"
-            )
-        )
-    elif recruit_status == "CLOSED":
-        # 모집완료 → 모집상태가 CLOSED이고, 종료되지 않은 프로젝트만
-        query = query.filter(
-            and_(
-                models.RecipePost.recruit_status == "CLOSED",
-                models.RecipePost.project_status != "ENDED"
-            )
-        )
-    else:
-        # 전체 보기 → 종료된 프로젝트 제외
-        query = query.filter(models.RecipePost.project_status != "ENDED")
-
-
-    # ✅ 구분 필터 (프로젝트/스터디)
-    if type:
-        query = query.filter(models.RecipePost.type == type)
-
-    # ✅ 스킬 필터
-    if skill_ids:
-        if match_mode == "AND":
-            query = (
-                query.join(models.RecipePostSkill)
-                .filter(models.RecipePostSkill.skill_id.in_(skill_ids))
-                .group_by(models.RecipePost.id)
-                .having(func.count(models.RecipePostSkill.skill_id) == len(skill_ids))
-            )
-        else:
-            query = query.join(models.RecipePostSkill).filter(
-                models.RecipePostSkill.skill_id.in_(skill_ids)
-            )
-
-    # ✅ 모집기간 필터
-    if start_date and end_date:
-        query = query.filter(
-            models.RecipePost.start_date <= end_date,
-            models.RecipePost.end_date >= start_date,
-        )
-
-    # ✅ 검색어 필터
-    if search:
-        query = query.filter(
-            (models.RecipePost.title.contains(search)) |
-            (models.RecipePost.description.contains(search))
-        )
-
-    # ✅ 정렬 및 페이지네이션
-    query = query.order_by(models.RecipePost.created_at.desc())
-    total = query.count()
-    posts = query.offset((page - 1) * page_size).limit(page_size).all()
     has_next = page * page_size < total
 
     # ✅ 결과 반환
     return {
-        "items": [to_dto(post) for post in posts],
+        "items": [to_dto(post, include_members=False, thumbnail=True) for post in posts],
         "total": total,
         "page": page,
         "page_size": page_size,
@@ -312,6 +258,47 @@ async def get_posts(
 # ✅ (⚠️ 라우팅 충돌 방지용) 내 프로젝트 / 내 지원 목록을
 #    반드시 /{post_id} 보다 위에 둔다.
 # ---------------------------------------------------------------------
+@router.get("/dashboard")
+async def get_dashboard(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    limit: int = Query(10, ge=1, le=dashboard_service.DASHBOARD_MAX_LIMIT),
+    sections: Optional[List[str]] = Query(None),
+    led_cursor: Optional[str] = None,
+    joined_cursor: Optional[str] = None,
+    applied_cursor: Optional[str] = None,
+):
+    """
+    마이페이지 대시보드 (한 번의 요청으로 세 구역)
+    - led: 내가 리더인 공고 / joined: 멤버로 참여중 / applied: 승인 대기중인 지원
+    - 구역별 next_cursor 를 {구역}_cursor 로 넘기면 다음 페이지 (sections 로 구역 한정 가능)
+    """
+    if sections and not set(sections) <= set(dashboard_service.SECTIONS):
+        raise HTTPException(status_code=400, detail="유효하지 않은 구역입니다.")
+    try:
+        data = dashboard_service.get_dashboard(
+            db,
+            current_user.id,
+            limit=limit,
+            cursors={"led": led_cursor, "joined": joined_cursor, "applied": applied_cursor},
+            sections=sections or dashboard_service.SECTIONS,
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+    # 캐시된 결과는 수정하지 않고 응답용 사본에만 이미지 경로 보정
+    return {
+        section: {
+            "items": [
+                {**item, "image_url": _full_url(thumbnail_url(item["image_url"], "md"))}
+                for item in page["items"]
+            ],
+            "next_cursor": page["next_cursor"],
+        }
+        for section, page in data.items()
+    }
+
+
 @router.get("/my-projects", response_model=List[RecipePostResponse])
 async def get_my_projects(
     db: Session = Depends(get_db),
@@ -388,8 +375,22 @@ async def get_my_applications(
 # ---------------------------------------------------------------------
 # ✅ 상세 조회 (프로필/상세 페이지 공통 사용)
 # ---------------------------------------------------------------------
+def _detail_response(cached, if_none_match: Optional[str]) -> Response:
+    return conditional_json(cached.payload, cached.etag, if_none_match, "private, no-cache")
+
+
 @router.get("/{post_id}", response_model=RecipePostResponse)
-async def get_post_detail(post_id: int, db: Session = Depends(get_db)):
+async def get_post_detail(
+    post_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    # ✅ 캐시 적중 시 DB 조회/DTO 변환 생략 (ETag 일치하면 304)
+    cached = post_detail_cache.get(post_id)
+    if cached:
+        return _detail_response(cached, if_none_match)
+
+    version = post_detail_cache.version(post_id)
     ProfileAlias = aliased(Profile)
 
     post = (
@@ -421,8 +422,8 @@ async def get_post_detail(post_id: int, db: Session = Depends(get_db)):
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"DTO 변환 오류: {str(e)}")
 
-    return dto
-
+    cached = post_detail_cache.set(post_id, version, jsonable_encoder(dto))
+    return _detail_response(cached, if_none_match)
 
 
 # ---------------------------------------------------------------------
@@ -432,122 +433,40 @@ async def get_post_detail(post_id: int, db: Session = Depends(get_db)):
 #     - 정원 가득/모집마감이면 신청 불가
 # ---------------------------------------------------------------------
 @router.post("/{post_id}/apply")
-async def apply_post(
+def apply_post(
     post_id: int,
     answers: List[dict],
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    post = (
-        db.query(models.RecipePost)
-        .filter(models.RecipePost.id == post_id, models.RecipePost.deleted_at.is_(None))
-        .first()
+    # ✅ 검사 + 신청 + 답변 저장을 posts 행 잠금 아래 단일 트랜잭션으로 처리
+    #    (동기 핸들러 → 스레드풀 실행, 잠금 대기가 이벤트 루프를 막지 않음)
+    application_id, leader_id = recipe_service.submit_application(
+        db, post_id=post_id, user_id=current_user.id, answers=answers
     )
-    if not post:
-        raise HTTPException(status_code=404, detail="게시글 없음")
-
-    # 1) 모집 상태 확인 (모집중이 아니면 신청 불가)
-    if post.recruit_status != "OPEN":
-        raise HTTPException(status_code=400, detail="모집이 마감되었습니다.")
+    post_detail_cache.invalidate(post_id)
+    dashboard_service.invalidate_user(current_user.id)
 
-    # 2) 정원 확인 (안전장치) - 현재 멤버 수가 정원 이상이면 차단
-    current_members = (
-        db.query(models.PostMember)
-        .filter(models.PostMember.post_id == post_id)
-        .count()
+    # ✅ 리더 알림/쪽지는 응답 이후 별도 세션으로 발송
+    background_tasks.add_task(
+        _notify_application_submitted, application_id, post_id, leader_id, current_user.id
     )
-    if current_members >= post.capacity:
-        # 상태 불일치 보정
-        if post.recruit_status != "CLOSED":
-            post.recruit_status = "CLOSED"
-            db.commit()
-        raise HTTPException(status_code=400, detail="정원이 가득 찼습니다.")
-
-    # 3) 중복 신청 방지 (PENDING/APPROVED 진행 중이면 차단)
-    existing_app = (
-        db.query(models.Application)
-        .filter(
-            models.Application.post_id == post_id,
-            models.Application.user_id == current_user.id,
-            models.Application.status.in_(["PENDING", "APPROVED"]),
-        )
-        .first()
-    )
-    if existing_app:
-        raise HTTPException(status_code=400, detail="이미 지원 진행 중입니다.")
-
-    # 4) ✅ 24시간 쿨타임 체크 (REJECTED / WITHDRAWN 최근 변경시각 기준)
-    # 4) ✅ 24시간 쿨타임 체크 (REJECTED / WITHDRAWN / KICKED 최근 변경시각 기준)
-    latest_row = db.execute(
-        text(
-            """
-            SELECT status_changed_at, status
-            FROM applications
-            WHERE post_id = :post_id
-            AND user_id = :user_id
-            AND status IN ('REJECTED','WITHDRAWN','KICKED')
-            ORDER BY COALESCE(status_changed_at, created_at) DESC
-            LIMIT 1
-            """
-        ),
-        {"post_id": post_id, "user_id": current_user.id},
-    ).mappings().first()
-
-    if latest_row:
-        last_changed = latest_row["status_changed_at"]
-        if latest_row["status"] == "KICKED":
-            # 🚫 강퇴된 유저는 재신청 불가
-            raise HTTPException(
-                status_code=403,
-                detail="이 프로젝트에서 제외된 유저는 다시 신청할 수 없습니다.",
-            )
+    return {"message": "✅ 지원 완료", "application_id": application_id}
 
-        if last_changed:
-            cutoff = datetime.utcnow() - timedelta(hours=24)
-            if last_changed > cutoff:
-                remaining = last_changed + timedelta(hours=24) - datetime.utcnow()
-                remaining_sec = int(remaining.total_seconds())
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"쿨타임이 남았습니다. {remaining_sec}초 후 재신청 가능",
-                )
-
-
-    # 5) 신청 생성 (PENDING)
-    application = models.Application(
-        post_id=post_id,
-        user_id=current_user.id,
-        status="PENDING",
-    )
-    db.add(application)
-    db.commit()
-    db.refresh(application)
-
-    # 6) 지원자 답변 저장
-    for ans in answers:
-        db.add(
-            models.ApplicationAnswer(
-                application_id=application.id,
-                field_id=ans["field_id"],
-                answer_text=ans["answer_text"],
-            )
-        )
-    db.commit()
 
-    # 7) 이벤트 (있으면 호출)
+def _notify_application_submitted(application_id: int, post_id: int, leader_id: int, applicant_id: int):
     try:
         from app.events.events import on_application_submitted
         on_application_submitted(
-            application_id=application.id,
-            post_id=post.id,
-            leader_id=post.leader_id,
-            applicant_id=current_user.id,
+            application_id=application_id,
+            post_id=post_id,
+            leader_id=leader_id,
+            applicant_id=applicant_id,
         )
     except Exception:
         pass  # events 모듈 미존재/오류 시 무시
 
-    return {"message": "✅ 지원 완료", "application_id": application.id}
-
 
 # ---------------------------------------------------------------------
 # ✅ 지원서 거절 (status_changed_at 기록)
@@ -581,6 +500,8 @@ async def reject_application(
         {"now": datetime.utcnow(), "id": application.id},
     )
     db.commit()
+    post_detail_cache.invalidate(post_id)
+    dashboard_service.invalidate_user(application.user_id)
 
     # 이벤트 알림
     try:
@@ -600,24 +521,32 @@ async def reject_application(
 # ✅ 지원서 승인 (status_changed_at 기록)
 # ---------------------------------------------------------------------
 @router.post("/{post_id}/applications/{application_id}/approve")
-async def approve_application(
+def approve_application(
     post_id: int,
     application_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    post = db.query(models.RecipePost).filter(models.RecipePost.id == post_id).first()
+    # posts 행 잠금 → 동시 승인이 정원 확인 ~ 인원 증가 사이에 끼어들지 못함 (commit 시 해제)
+    # 동기 핸들러라 스레드풀에서 실행 → 잠금 대기가 이벤트 루프를 막지 않음
+    post = (
+        db.query(models.RecipePost)
+        .filter(models.RecipePost.id == post_id)
+        .with_for_update()
+        .first()
+    )
     if not post:
         raise HTTPException(status_code=404, detail="게시글 없음")
 
     if current_user.id != post.leader_id:
+        db.rollback()
         raise HTTPException(status_code=403, detail="리더만 승인 가능")
 
     # 정원 초과 방지
-    member_count = db.query(models.PostMember).filter(models.PostMember.post_id == post_id).count()
-    if member_count >= post.capacity:
+    if (post.current_members or 0) >= post.capacity:
         post.recruit_status = "CLOSED"
         db.commit()
+        post_detail_cache.invalidate(post_id)
         raise HTTPException(status_code=400, detail="정원이 가득 찼습니다.")
 
     application = db.query(models.Application).filter(
@@ -625,6 +554,7 @@ async def approve_application(
         models.Application.post_id == post_id,
     ).first()
     if not application:
+        db.rollback()
         raise HTTPException(status_code=404, detail="지원서 없음")
 
     # ✅ 승인 처리 + 변경시각 기록 (RAW SQL)
@@ -635,13 +565,14 @@ async def approve_application(
         {"now": datetime.utcnow(), "id": application.id},
     )
     db.add(models.PostMember(post_id=post_id, user_id=application.user_id, role="MEMBER"))
-    db.commit()
+    db.flush()
+    recipe_service.change_member_count(db, post, +1)
 
-    # 승인 후 정원 확인
-    member_count = db.query(models.PostMember).filter(models.PostMember.post_id == post_id).count()
-    if member_count >= post.capacity:
-        post.recruit_status = "CLOSED"
-        db.commit()
+    # 승인 후 정원 확인 (같은 트랜잭션에서 마감 처리)
+    recipe_service.sync_recruit_status(db, post)
+    db.commit()
+    post_detail_cache.invalidate(post_id)
+    dashboard_service.invalidate_post_members(db, post_id)
 
     # 이벤트 알림
     try:
@@ -682,13 +613,14 @@ async def update_recruit_status(
         raise HTTPException(status_code=403, detail="리더만 변경 가능")
 
     # 정원 체크
-    member_count = db.query(models.PostMember).filter(models.PostMember.post_id == post_id).count()
-    if status_value == "OPEN" and member_count >= post.capacity:
+    if status_value == "OPEN" and (post.current_members or 0) >= post.capacity:
         raise HTTPException(status_code=403, detail="정원이 가득 차서 모집을 열 수 없습니다.")
 
     # ✅ 상태 갱신
     post.recruit_status = status_value
     db.commit()
+    post_detail_cache.invalidate(post_id)
+    dashboard_service.invalidate_post_members(db, post_id)
     db.refresh(post)
 
     # ✅ 최신 DTO 반환 (프론트 즉시 반영 가능)
@@ -717,6 +649,8 @@ async def end_project(
     if post.recruit_status != "CLOSED":
         post.recruit_status = "CLOSED"
     db.commit()
+    post_detail_cache.invalidate(post_id)
+    dashboard_service.invalidate_post_members(db, post_id)
 
     return {"message": "✅ 프로젝트가 종료되었습니다."}
 
@@ -741,6 +675,9 @@ async def delete_post(
 
     post.deleted_at = datetime.utcnow()
     db.commit()
+    post_detail_cache.invalidate(post_id)
+    dashboard_service.invalidate_post_members(db, post_id)
+    skill_index.remove_post(post_id)
     return {"message": "🗑 게시글이 삭제 처리되었습니다."}
 
 
@@ -774,6 +711,8 @@ async def leave_post(
 
     # ✅ 멤버 삭제
     db.delete(membership)
+    db.flush()
+    recipe_service.change_member_count(db, post, -1)
     db.commit()
 
     # ✅ 기존 Application 상태 변경 (APPROVED → WITHDRAWN) + 변경시각 기록
@@ -796,10 +735,11 @@ async def leave_post(
         db.commit()
 
     # ✅ 탈퇴 후 인원 감소 → 자동 OPEN
-    current_count = db.query(models.PostMember).filter(models.PostMember.post_id == post_id).count()
-    if current_count < post.capacity and post.recruit_status == "CLOSED":
-        post.recruit_status = "OPEN"
-        db.commit()
+    recipe_service.sync_recruit_status(db, post, allow_reopen=True)
+    db.commit()
+    post_detail_cache.invalidate(post_id)
+    dashboard_service.invalidate_user(current_user.id)
+    dashboard_service.invalidate_post_members(db, post_id)
 
     return {"message": "✅ 탈퇴 완료"}
 
@@ -836,6 +776,8 @@ async def kick_member(
 
     # ✅ PostMember 삭제
     db.delete(membership)
+    db.flush()
+    recipe_service.change_member_count(db, post, -1)
     db.commit()
 
     # ✅ Application 상태를 KICKED로 변경 (새 enum)
@@ -848,12 +790,11 @@ async def kick_member(
     db.commit()
 
     # ✅ 정원 감소 → 자동 OPEN 처리
-    current_count = db.query(models.PostMember).filter(
-        models.PostMember.post_id == post_id
-    ).count()
-    if current_count < post.capacity and post.recruit_status == "CLOSED":
-        post.recruit_status = "OPEN"
-        db.commit()
+    recipe_service.sync_recruit_status(db, post, allow_reopen=True)
+    db.commit()
+    post_detail_cache.invalidate(post_id)
+    dashboard_service.invalidate_user(user_id)
+    dashboard_service.invalidate_post_members(db, post_id)
 
     # ✅ 알림 이벤트 (있으면)
     try:
@@ -0,0 +1,82 @@
+# app/project_post/recipe_scheduler.py
+from sqlalchemy.orm import Session
+from app.core.database import SessionLocal
+from app.board.hot3_scheduler import scheduler  # ✅ 스케줄러 인스턴스 공유
+from app.project_post.recipe_service import apply_date_transitions, kst_today, reconcile_member_counts
+from app.project_post.post_detail_cache import post_detail_cache
+from app.project_post.skill_index import skill_index
+
+
+def refresh_post_states():
+    """매일 자정: 모집기간/프로젝트기간이 지난 게시글 상태 일괄 전환"""
+    db: Session = SessionLocal()
+    try:
+        today = kst_today()
+        result = apply_date_transitions(db, today)
+        if any(result.values()):
+            post_detail_cache.clear()
+        print(f"✅ [SCHEDULER] 모집공고 상태 전환 완료 ({today}): {result}")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ [SCHEDULER] 모집공고 상태 전환 실패: {e}")
+    finally:
+        db.close()
+
+
+def reconcile_post_members():
+    """매일 새벽: posts.current_members 를 post_members 실제 행 수로 보정"""
+    db: Session = SessionLocal()
+    try:
+        result = reconcile_member_counts(db)
+        if any(result.values()):
+            post_detail_cache.clear()
+        print(f"✅ [SCHEDULER] 모집공고 인원 수 보정 완료: {result}")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ [SCHEDULER] 모집공고 인원 수 보정 실패: {e}")
+    finally:
+        db.close()
+
+
+def refresh_skill_index():
+    """주기적으로 스킬 비트맵 인덱스 전체 재적재 (다른 워커에서 바뀐 게시글 반영)"""
+    db: Session = SessionLocal()
+    try:
+        count = skill_index.load(db)
+        print(f"✅ [SCHEDULER] 스킬 인덱스 재적재 완료: posts={count}")
+    except Exception as e:
+        print(f"❌ [SCHEDULER] 스킬 인덱스 재적재 실패: {e}")
+    finally:
+        db.close()
+
+
+def start_recipe_jobs():
+    """hot3 스케줄러에 모집공고 상태 전환/인원 보정 작업 등록 (서버 시작 시 1회 즉시 실행)"""
+    reconcile_post_members()
+    refresh_post_states()
+    refresh_skill_index()
+    scheduler.add_job(
+        refresh_post_states,
+        "cron",
+        hour=0,
+        minute=0,
+        second=30,
+        id="recipe_post_states",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        reconcile_post_members,
+        "cron",
+        hour=4,
+        minute=0,
+        id="recipe_member_reconcile",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        refresh_skill_index,
+        "interval",
+        minutes=10,
+        id="recipe_skill_index",
+        replace_existing=True,
+    )
+    print("⏰ 모집공고 상태 전환(매일 0시) / 인원 보정(매일 4시) / 스킬 인덱스(10분) 스케줄러 등록 + 최초 1회")
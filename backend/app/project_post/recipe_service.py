@@ -1,11 +1,24 @@
 # app/project_post/recipe_service.py
-from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from sqlalchemy import text, func, select, insert
+from sqlalchemy.orm import Session, selectinload
 from app import models
-from datetime import date
-from typing import Optional
+from app.project_post.skill_index import skill_index
+from app.files import file_store
+from app.admin.admin_stats import admin_stats
+from app.project_post.post_detail_cache import post_detail_cache
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Tuple
 
 DEFAULT_PROJECT_IMAGE = "/assets/profile/project.png"
 DEFAULT_STUDY_IMAGE = "/assets/profile/study.png"
+KST = timezone(timedelta(hours=9))
+
+
+def kst_today() -> date:
+    """모집/프로젝트 기간 판정 기준일 (KST) — 단건 반영과 자정 스케줄러가 같은 날짜 사용"""
+    return datetime.now(KST).date()
+
 
 def create_recipe_post(
     db: Session,
@@ -44,9 +57,13 @@ def create_recipe_post(
         image_url=image_url,   # ✅ 기본 이미지든 사용자 입력이든 최종 값 저장
         current_members=1,     # 리더 포함
     )
+    apply_date_transitions_for_post(new_post)  # 이미 지난 기간이면 즉시 반영
     db.add(new_post)
+    file_store.add_ref(db, image_url)
     db.commit()
     db.refresh(new_post)
+    if new_post.status == "PENDING":
+        admin_stats.adjust(pending_posts=1)
 
     # 리더 자동 등록
     leader_member = models.PostMember(
@@ -64,9 +81,309 @@ def create_recipe_post(
 
     db.commit()
     db.refresh(new_post)
+    skill_index.set_post(new_post.id, skills)
 
     # ✅ 게시글 생성 후 관리자 승인요청 알림 트리거
     from app.events.events import on_post_submitted
     on_post_submitted(post_id=new_post.id, leader_id=new_post.leader_id)
 
     return new_post
+
+
+# ---------------------------------------------------------------------
+# ✅ 모집/프로젝트 상태 전환
+# - 날짜 기준 전환(모집 마감/프로젝트 종료)은 스케줄러가 자정마다 일괄 처리
+# - 정원 기준 전환은 승인/탈퇴/강퇴 시점에 즉시 처리
+# ---------------------------------------------------------------------
+def apply_date_transitions(db: Session, today: date) -> dict:
+    """모집기간/프로젝트기간이 지난 게시글만 골라 일괄 UPDATE"""
+    closed = db.execute(
+        text("""
+            UPDATE posts
+            SET recruit_status = 'CLOSED'
+            WHERE recruit_status = 'OPEN'
+              AND end_date < :today
+              AND deleted_at IS NULL
+        """),
+        {"today": today},
+    ).rowcount
+    ended = db.execute(
+        text("""
+            UPDATE posts
+            SET project_status = 'ENDED'
+            WHERE project_status = 'ONGOING'
+              AND project_end < :today
+              AND deleted_at IS NULL
+        """),
+        {"today": today},
+    ).rowcount
+    db.commit()
+    return {"recruit_closed": closed or 0, "project_ended": ended or 0}
+
+
+def apply_date_transitions_for_post(post, today: Optional[date] = None) -> bool:
+    """단건 생성/수정 시 이미 지난 기간이면 즉시 반영 (commit은 호출 측)"""
+    today = today or kst_today()
+    changed = False
+    if post.end_date and post.end_date < today and post.recruit_status == "OPEN":
+        post.recruit_status = "CLOSED"
+        changed = True
+    if post.project_end and post.project_end < today and post.project_status == "ONGOING":
+        post.project_status = "ENDED"
+        changed = True
+    return changed
+
+
+def change_member_count(db: Session, post, delta: int) -> int:
+    """
+    posts.current_members 원자적 증감 (동시 승인/탈퇴에도 유실 없음)
+    - 갱신된 값만 다시 읽어 post 객체에 반영
+    """
+    db.execute(
+        text("""
+            UPDATE posts
+            SET current_members = GREATEST(current_members + :delta, 0)
+            WHERE id = :post_id
+        """),
+        {"delta": delta, "post_id": post.id},
+    )
+    db.refresh(post, attribute_names=["current_members"])
+    return post.current_members
+
+
+def sync_recruit_status(db: Session, post, allow_reopen: bool = False) -> int:
+    """
+    멤버 수 변경 직후 정원 기준 모집상태 보정 (commit은 호출 측)
+    - 정원 도달 → CLOSED
+    - allow_reopen=True 이고 정원 미만 + 모집기간 남음 → OPEN (탈퇴/강퇴 시)
+    """
+    member_count = post.current_members or 0
+    if member_count >= post.capacity and post.recruit_status == "OPEN":
+        post.recruit_status = "CLOSED"
+    elif (
+        allow_reopen
+        and member_count < post.capacity
+        and post.recruit_status == "CLOSED"
+        and (post.end_date is None or post.end_date >= kst_today())
+    ):
+        post.recruit_status = "OPEN"
+    return member_count
+
+
+def reconcile_member_counts(db: Session) -> dict:
+    """current_members 드리프트 보정 (post_members 실제 행 수 기준) + 정원 초과 모집 마감"""
+    fixed = db.execute(
+        text("""
+            UPDATE posts p
+            LEFT JOIN (
+                SELECT post_id, COUNT(*) AS cnt
+                FROM post_members
+                GROUP BY post_id
+            ) m ON m.post_id = p.id
+            SET p.current_members = COALESCE(m.cnt, 0)
+            WHERE p.current_members IS NULL
+               OR p.current_members <> COALESCE(m.cnt, 0)
+        """)
+    ).rowcount
+    closed = db.execute(
+        text("""
+            UPDATE posts
+            SET recruit_status = 'CLOSED'
+            WHERE recruit_status = 'OPEN'
+              AND current_members >= capacity
+              AND deleted_at IS NULL
+        """)
+    ).rowcount
+    db.commit()
+    return {"count_fixed": fixed or 0, "recruit_closed": closed or 0}
+
+
+# ---------------------------------------------------------------------
+# ✅ 지원서 제출 (단일 트랜잭션)
+# - posts 행을 SELECT ... FOR UPDATE 로 잠가 같은 공고에 대한 지원을 직렬화
+#   → 모집상태/정원/중복/쿨타임 검사와 INSERT 사이에 끼어드는 요청 없음
+# - 지원서 + 답변(bulk INSERT)을 한 번에 commit
+# - 알림/쪽지 발송은 호출 측에서 commit 이후 백그라운드로 처리
+# ---------------------------------------------------------------------
+APPLY_COOLDOWN = timedelta(hours=24)
+
+
+def submit_application(db: Session, post_id: int, user_id: int, answers: list[dict]):
+    """지원서 생성 후 (application_id, leader_id) 반환 — 실패 시 HTTPException"""
+    try:
+        post = (
+            db.query(models.RecipePost)
+            .filter(models.RecipePost.id == post_id, models.RecipePost.deleted_at.is_(None))
+            .with_for_update()
+            .first()
+        )
+        if not post:
+            raise HTTPException(status_code=404, detail="게시글 없음")
+
+        # 1) 모집 상태 확인 (모집중이 아니면 신청 불가)
+        if post.recruit_status != "OPEN":
+            raise HTTPException(status_code=400, detail="모집이 마감되었습니다.")
+
+        # 2) 정원 확인 (안전장치) - 상태 불일치면 마감으로 보정 후 차단
+        if (post.current_members or 0) >= post.capacity:
+            post.recruit_status = "CLOSED"
+            db.commit()
+            post_detail_cache.invalidate(post_id)  # 예외로 빠지므로 호출 측 무효화가 실행되지 않음
+            raise HTTPException(status_code=400, detail="정원이 가득 찼습니다.")
+
+        # 3) 중복 신청 방지 + 24시간 쿨타임 (REJECTED / WITHDRAWN / KICKED 최근 변경시각 기준)
+        rows = db.execute(
+            text("""
+                SELECT status, status_changed_at
+                FROM applications
+                WHERE post_id = :post_id
+                  AND user_id = :user_id
+                  AND status IN ('PENDING','APPROVED','REJECTED','WITHDRAWN','KICKED')
+                ORDER BY COALESCE(status_changed_at, created_at) DESC
+            """),
+            {"post_id": post_id, "user_id": user_id},
+        ).mappings().all()
+
+        if any(row["status"] in ("PENDING", "APPROVED") for row in rows):
+            raise HTTPException(status_code=400, detail="이미 지원 진행 중입니다.")
+
+        if rows:  # 여기부터는 REJECTED / WITHDRAWN / KICKED 만 남음
+            latest = rows[0]
+            if latest["status"] == "KICKED":
+                # 🚫 강퇴된 유저는 재신청 불가
+                raise HTTPException(
+                    status_code=403,
+                    detail="이 프로젝트에서 제외된 유저는 다시 신청할 수 없습니다.",
+                )
+            last_changed = latest["status_changed_at"]
+            if last_changed and last_changed > datetime.utcnow() - APPLY_COOLDOWN:
+                remaining = last_changed + APPLY_COOLDOWN - datetime.utcnow()
+                raise HTTPException(
+                    status_code=403,
+                    detail=f"쿨타임이 남았습니다. {int(remaining.total_seconds())}초 후 재신청 가능",
+                )
+
+        # 4) 신청 생성 (PENDING) + 답변 일괄 저장
+        application = models.Application(post_id=post_id, user_id=user_id, status="PENDING")
+        db.add(application)
+        db.flush()
+        if answers:
+            db.execute(
+                insert(models.ApplicationAnswer),
+                [
+                    {
+                        "application_id": application.id,
+                        "field_id": ans["field_id"],
+                        "answer_text": ans["answer_text"],
+                    }
+                    for ans in answers
+                ],
+            )
+        db.commit()
+        return application.id, post.leader_id
+    except Exception:
+        db.rollback()  # 잠금 해제
+        raise
+
+
+# ---------------------------------------------------------------------
+# ✅ 모집공고 목록 쿼리
+# - 1) 필터만 적용한 가벼운 COUNT
+# - 2) 정렬/페이지 기준으로 게시글 id만 조회
+# - 3) 해당 id들의 게시글 + 스킬/지원분야를 selectinload(IN 쿼리)로 일괄 로드
+#   → JOIN으로 스킬 × 지원분야 × 멤버 행이 곱해지지 않음
+# ---------------------------------------------------------------------
+def _listing_conditions(
+    status: Optional[str],
+    recruit_status: Optional[str],
+    type: Optional[str],
+    skill_ids: Optional[List[int]],
+    match_mode: Optional[str],
+    start_date: Optional[date],
+    end_date: Optional[date],
+    search: Optional[str],
+) -> list:
+    Post = models.RecipePost
+    conditions = [Post.status == status, Post.deleted_at.is_(None)]
+
+    # 모집중(OPEN) / 모집완료(CLOSED) / 전체 → 모두 종료된 프로젝트는 제외
+    if recruit_status in ("OPEN", "CLOSED"):
+        conditions.append(Post.recruit_status == recruit_status)
+    conditions.append(Post.project_status != "ENDED")
+
+    if type:
+        conditions.append(Post.type == type)
+
+    # 스킬 필터: 비트맵 인덱스 후보 id → 없으면 post_skills 서브쿼리 (본 쿼리에 JOIN 없음)
+    if skill_ids:
+        candidates = skill_index.candidates(skill_ids, match_mode)
+        if candidates is not None:
+            conditions.append(Post.id.in_(candidates))
+            skill_ids = None
+    if skill_ids:
+        unique_ids = set(skill_ids)
+        matched = select(models.RecipePostSkill.post_id).where(
+            models.RecipePostSkill.skill_id.in_(unique_ids)
+        )
+        if match_mode == "AND":
+            matched = matched.group_by(models.RecipePostSkill.post_id).having(
+                func.count(models.RecipePostSkill.skill_id) == len(unique_ids)
+            )
+        conditions.append(Post.id.in_(matched))
+
+    if start_date and end_date:
+        conditions.append(Post.start_date <= end_date)
+        conditions.append(Post.end_date >= start_date)
+
+    if search:
+        conditions.append(Post.title.contains(search) | Post.description.contains(search))
+
+    return conditions
+
+
+def list_recipe_posts(
+    db: Session,
+    status: Optional[str] = "APPROVED",
+    recruit_status: Optional[str] = "OPEN",
+    type: Optional[str] = None,
+    skill_ids: Optional[List[int]] = None,
+    match_mode: Optional[str] = "OR",
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    search: Optional[str] = None,
+    page: int = 1,
+    page_size: int = 10,
+) -> Tuple[list, int]:
+    """모집공고 목록 (게시글 목록, 전체 개수) — 멤버는 로드하지 않음"""
+    Post = models.RecipePost
+    if skill_ids:
+        skill_index.ensure_loaded(db)
+    conditions = _listing_conditions(
+        status, recruit_status, type, skill_ids, match_mode, start_date, end_date, search
+    )
+
+    total = db.query(func.count(Post.id)).filter(*conditions).scalar() or 0
+
+    page_ids = [
+        row[0]
+        for row in db.query(Post.id)
+        .filter(*conditions)
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    ]
+    if not page_ids:
+        return [], total
+
+    posts = (
+        db.query(Post)
+        .options(
+            selectinload(Post.skills).selectinload(models.RecipePostSkill.skill),
+            selectinload(Post.application_fields).selectinload(models.RecipePostRequiredField.field),
+        )
+        .filter(Post.id.in_(page_ids))
+        .all()
+    )
+    # IN 조회는 순서를 보장하지 않으므로 id 페이지 순서대로 재정렬
+    by_id = {post.id: post for post in posts}
+    return [by_id[post_id] for post_id in page_ids if post_id in by_id], total
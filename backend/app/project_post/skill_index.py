@@ -0,0 +1,117 @@
+# ============================================================
+# 📁 /app/project_post/skill_index.py
+# ------------------------------------------------------------
+# 스킬 → 게시글 id 비트맵 인덱스 (목록 스킬 필터 후보 계산용)
+# - 스킬마다 Python int 하나를 비트셋으로 사용 (bit n = post_id n)
+# - OR: 비트셋 합집합 / AND: 교집합 → DB에는 posts.id IN (...) 조건만 전달
+# - 게시글 생성/수정/삭제 시 증분 갱신 + 스케줄러 주기적 전체 재적재
+#   (프로세스 로컬이므로 다른 워커의 변경은 재적재 주기만큼 늦게 반영)
+# ============================================================
+
+import os
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# 후보가 이보다 많으면 IN 목록 대신 post_skills 서브쿼리 사용
+SKILL_INDEX_MAX_CANDIDATES = int(os.getenv("SKILL_INDEX_MAX_CANDIDATES", "2000"))
+
+
+def bits_to_ids(bits: int) -> List[int]:
+    """비트셋 → post_id 목록 (내림차순 = 최신 글 우선)"""
+    ids = []
+    while bits:
+        top = bits.bit_length() - 1
+        ids.append(top)
+        bits ^= 1 << top
+    return ids
+
+
+class SkillIndex:
+    def __init__(self):
+        self._bits: Dict[int, int] = {}                    # skill_id → 비트셋
+        self._post_skills: Dict[int, FrozenSet[int]] = {}  # post_id → skill_ids
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self, db: Session) -> int:
+        """삭제되지 않은 게시글 기준 전체 재적재 (적재한 게시글 수 반환)"""
+        rows = db.execute(
+            text("""
+                SELECT ps.post_id, ps.skill_id
+                FROM post_skills ps
+                JOIN posts p ON p.id = ps.post_id
+                WHERE p.deleted_at IS NULL
+            """)
+        ).all()
+
+        bits: Dict[int, int] = {}
+        post_skills: Dict[int, set] = {}
+        for post_id, skill_id in rows:
+            bits[skill_id] = bits.get(skill_id, 0) | (1 << post_id)
+            post_skills.setdefault(post_id, set()).add(skill_id)
+
+        with self._lock:
+            self._bits = bits
+            self._post_skills = {pid: frozenset(s) for pid, s in post_skills.items()}
+            self._loaded = True
+        return len(post_skills)
+
+    def ensure_loaded(self, db: Session) -> None:
+        if not self._loaded:
+            self.load(db)
+
+    def set_post(self, post_id: int, skill_ids: Iterable[int]) -> None:
+        """게시글 생성/스킬 수정 후 호출"""
+        new = frozenset(skill_ids)
+        mask = 1 << post_id
+        with self._lock:
+            old = self._post_skills.get(post_id, frozenset())
+            for skill_id in old - new:
+                remaining = self._bits.get(skill_id, 0) & ~mask
+                if remaining:
+                    self._bits[skill_id] = remaining
+                else:
+                    self._bits.pop(skill_id, None)
+            for skill_id in new - old:
+                self._bits[skill_id] = self._bits.get(skill_id, 0) | mask
+            if new:
+                self._post_skills[post_id] = new
+            else:
+                self._post_skills.pop(post_id, None)
+
+    def remove_post(self, post_id: int) -> None:
+        """게시글 삭제 후 호출"""
+        self.set_post(post_id, ())
+
+    def match_bits(self, skill_ids: Iterable[int], match_mode: str = "OR") -> int:
+        skill_ids = set(skill_ids)
+        if not skill_ids:
+            return 0
+        with self._lock:
+            sets = [self._bits.get(skill_id, 0) for skill_id in skill_ids]
+        result = sets[0]
+        for bits in sets[1:]:
+            result = result & bits if match_mode == "AND" else result | bits
+        return result
+
+    def candidates(self, skill_ids: Iterable[int], match_mode: str = "OR") -> Optional[List[int]]:
+        """
+        스킬 필터에 맞는 게시글 id 후보 (내림차순)
+        - None → 인덱스 미적재 또는 후보가 너무 많음 (호출 측에서 DB 서브쿼리 사용)
+        """
+        if not self._loaded:
+            return None
+        bits = self.match_bits(skill_ids, match_mode)
+        if bits.bit_count() > SKILL_INDEX_MAX_CANDIDATES:
+            return None
+        return bits_to_ids(bits)
+
+
+skill_index = SkillIndex()
@@ -10,6 +10,7 @@
 from typing import Optional, List, Dict, Literal
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 from datetime import datetime  # 🩵 [추가] UTC 시간 기록용
 import logging
@@ -18,6 +19,7 @@ from app.core.database import get_db
 from app.events.events import on_report_created
 from app.notifications.notification_model import NotificationType, NotificationCategory  # 🩵 [수정] NotificationCategory 추가
 from app.notifications.notification_service import send_notification
+from app.admin.admin_stats import admin_stats
 from app.messages.message_service import send_message
 from app.messages.message_model import MessageCategory
 
@@ -85,32 +87,21 @@ def create_report(
         if role == "ADMIN":
             raise HTTPException(status_code=403, detail="관리자는 신고할 수 없습니다.")
 
-        # ✅ 중복 신고 방지
-        duplicate = db.execute(
-            text("""
-                SELECT id FROM reports
-                 WHERE reporter_user_id = :r
-                   AND target_type = :tt
-                   AND target_id = :tid
-                   AND status = 'PENDING'
-                 LIMIT 1
-            """),
-            {"r": reporter_user_id, "tt": target_type, "tid": target_id},
-        ).scalar()
-        if duplicate:
+        # ✅ 신고 등록 (UTC 기준)
+        # 중복 신고는 UNIQUE(reporter_user_id, target_type, target_id) 로 차단 (사전 COUNT 없음)
+        try:
+            res = db.execute(
+                text("""
+                    INSERT INTO reports (reported_user_id, reporter_user_id, target_type, target_id, reason, status, created_at)
+                    VALUES (:ru, :r, :tt, :tid, :reason, 'PENDING', UTC_TIMESTAMP())
+                """),
+                {"ru": reported_user_id, "r": reporter_user_id, "tt": target_type, "tid": target_id, "reason": reason.strip()},
+            )
+        except IntegrityError:
+            db.rollback()
             logger.warning(f"⚠️ 중복 신고 감지: reporter={reporter_user_id}, target={target_type}({target_id})")
             return {"success": False, "message": "이미 신고한 대상입니다.", "already_reported": True}
-
-        # ✅ 신고 등록 (UTC 기준)
-        db.execute(
-            text("""
-                INSERT INTO reports (reported_user_id, reporter_user_id, target_type, target_id, reason, status, created_at)
-                VALUES (:ru, :r, :tt, :tid, :reason, 'PENDING', UTC_TIMESTAMP())
-            """),
-            {"ru": reported_user_id, "r": reporter_user_id, "tt": target_type, "tid": target_id, "reason": reason.strip()},
-        )
-        db.flush()
-        report_id = db.execute(text("SELECT LAST_INSERT_ID()")).scalar()
+        report_id = res.lastrowid
 
         # ===============================
         # 🩵 신고자 알림 & 관리자 알림 (쪽지 제거)
@@ -150,6 +141,7 @@ def create_report(
         # ❌ on_report_created(report_id=int(report_id), reporter_user_id=reporter_user_id, db=db)
 
         db.commit()
+        admin_stats.adjust(pending_reports=1)
         return {"success": True, "message": "신고가 정상적으로 접수되었습니다.", "report_id": int(report_id)}
 
     finally:
@@ -160,18 +152,18 @@ def create_report(
 # ✅ 중복 신고 여부 확인
 # ----------------------------
 def has_already_reported(db: Session, reporter_user_id: int, target_type: str, target_id: int) -> bool:
-    """✅ 동일 대상에 대한 중복 신고 여부 검사"""
+    """✅ 동일 대상에 대한 중복 신고 여부 검사 (UNIQUE 키 조회, 처리 완료된 신고 포함)"""
     exists = db.execute(
         text("""
-            SELECT COUNT(*) FROM reports
+            SELECT 1 FROM reports
              WHERE reporter_user_id=:r
                AND target_type=:tt
                AND target_id=:tid
-               AND status='PENDING'
+             LIMIT 1
         """),
         {"r": reporter_user_id, "tt": target_type, "tid": target_id},
-    ).scalar()
-    return bool(exists)
+    ).first()
+    return exists is not None
 
 # ----------------------------
 # ✅ 내가 작성한 신고 목록 조회
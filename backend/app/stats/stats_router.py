@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from app.core.database import get_db
+from app.files.image_derivatives import thumbnail_url
 
 router = APIRouter(prefix="/stats", tags=["Stats"])
 
@@ -46,7 +47,7 @@ def get_user_ranking(db: Session = Depends(get_db)):
         ranking.append({
             "id": row["id"],
             "nickname": row["nickname"],
-            "avatar_path": row["avatar_path"],  
+            "avatar_path": thumbnail_url(row["avatar_path"], "sm"),  # ✅ 썸네일 우선
             "followers": row["followers"],
             "project_posts": row["project_posts"],
             "board_posts": row["board_posts"],
@@ -0,0 +1,98 @@
+# backend/app/test/conftest.py
+# ✅ 테스트 공용 SQLite 픽스처
+# - 매핑된 테이블은 Base.metadata 로, 매핑되지 않은 테이블은 db_schemas.sql 의 DDL 로 생성
+# - MySQL 전용 함수/구문은 SQLite 에서 동작하도록 보정
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+for key in ("DB_USER", "DB_PASSWORD", "DB_NAME"):
+    os.environ.setdefault(key, "test")  # app.core.database import 용 (세션은 SQLite 로 대체)
+
+import re
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import BigInteger, create_engine, event, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import models  # noqa: F401  (모델 등록)
+from app.board import board_model  # noqa: F401
+from app.messages import message_model  # noqa: F401
+from app.notifications import notification_model  # noqa: F401
+from app.core.base import Base
+
+SCHEMA_SQL = Path(__file__).resolve().parents[3] / "database" / "db_schemas.sql"
+
+# ORM 모델이 없는 테이블 (raw SQL 로만 접근)
+UNMAPPED_TABLES = ("notification_counters", "report_actions", "message_user_status", "user_warnings")
+
+# MySQL 전용 DDL → SQLite
+_MYSQL_DDL = [
+    (r"\bBIGINT\b", "INTEGER"),
+    (r"\bAUTO_INCREMENT\b", ""),
+    (r"\bENUM\([^)]*\)", "VARCHAR(30)"),
+    (r"\bON UPDATE CURRENT_TIMESTAMP\b", ""),
+    (r"\bCOMMENT\s+'[^']*'", ""),
+]
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    return "INTEGER"  # SQLite 는 INTEGER PRIMARY KEY 만 자동 증가
+
+
+def schema_ddl(table: str) -> str:
+    """db_schemas.sql 에서 CREATE TABLE 문을 꺼내 SQLite 문법으로 변환"""
+    sql = SCHEMA_SQL.read_text(encoding="utf-8")
+    match = re.search(rf"CREATE TABLE {table} \(.*?\n\);", sql, re.S)
+    if not match:
+        raise LookupError(f"db_schemas.sql 에 {table} 테이블이 없습니다.")
+    ddl = match.group(0)
+    for pattern, repl in _MYSQL_DDL:
+        ddl = re.sub(pattern, repl, ddl)
+    return ddl
+
+
+def _mysql_functions(dbapi_conn, _):
+    """MySQL 함수 대체 (NOW / UTC_TIMESTAMP / GREATEST / LEAST)"""
+    dbapi_conn.create_function("NOW", 0, lambda: datetime.now().isoformat(" "))
+    dbapi_conn.create_function("UTC_TIMESTAMP", 0, lambda: datetime.utcnow().isoformat(" "))
+    dbapi_conn.create_function("GREATEST", -1, lambda *args: None if None in args else max(args))
+    dbapi_conn.create_function("LEAST", -1, lambda *args: None if None in args else min(args))
+
+
+def _mysql_upsert(conn, cursor, statement, parameters, context, executemany):
+    """INSERT ... ON DUPLICATE KEY UPDATE → INSERT ... ON CONFLICT DO UPDATE SET"""
+    if "ON DUPLICATE KEY UPDATE" in statement:
+        head, tail = statement.split("ON DUPLICATE KEY UPDATE", 1)
+        statement = head + "ON CONFLICT DO UPDATE SET" + re.sub(r"VALUES\((\w+)\)", r"excluded.\1", tail)
+    return statement, parameters
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", _mysql_functions)
+    event.listen(engine, "before_cursor_execute", _mysql_upsert, retval=True)
+
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for table in UNMAPPED_TABLES:
+            conn.execute(text(schema_ddl(table)))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
@@ -0,0 +1,129 @@
+# backend/app/test/test_admin_reports.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import DateTime, bindparam, event, text
+
+from app import models
+from app.admin import admin_service
+from app.board.board_model import BoardPost, Comment
+from app.messages.message_model import Message
+
+INSERT_REPORT = text(
+    "INSERT INTO reports (id, reporter_user_id, reported_user_id, target_type, target_id, reason, status, created_at) "
+    "VALUES (:id, :reporter, 2, :type, :target, '스팸', :status, :ts)"
+).bindparams(bindparam("ts", type_=DateTime))
+
+# (id, target_type, target_id, status)
+REPORTS = [
+    (1, "POST", 1, "PENDING"),
+    (2, "BOARD_POST", 1, "PENDING"),
+    (3, "COMMENT", 1, "PENDING"),
+    (4, "MESSAGE", 1, "PENDING"),
+    (5, "COMMENT", 1, "PENDING"),
+    (6, "BOARD_POST", 1, "RESOLVED"),
+    (7, "USER", 2, "PENDING"),
+]
+
+
+def _add_user(db, uid, nickname):
+    db.add(models.User(id=uid, nickname=nickname, email=f"u{uid}@test.com", name=nickname))
+
+
+@pytest.fixture
+def report_db(db):
+    _add_user(db, 1, "reporter")
+    _add_user(db, 2, "spammer")
+    db.add(models.RecipePost(id=1, leader_id=2, type="PROJECT", title="프로젝트", description="프로젝트 설명", capacity=3))
+    db.add(BoardPost(id=1, author_id=2, title="자유글", content="자유글 본문"))
+    db.add(Comment(id=1, board_post_id=1, user_id=2, content="댓글 본문"))
+    db.add(Message(id=1, sender_id=2, receiver_id=1, content="쪽지 본문"))
+    db.flush()
+    for rid, target_type, target_id, status in REPORTS:
+        db.execute(INSERT_REPORT, {"id": rid, "reporter": 1, "type": target_type, "target": target_id,
+                                   "status": status, "ts": datetime(2025, 1, 1) + timedelta(minutes=rid)})
+    db.commit()
+    return db
+
+
+def test_pending_reports_page_through_newest_first(report_db):
+    db = report_db
+    first = admin_service.list_pending_reports(db, limit=4)
+    second = admin_service.list_pending_reports(db, limit=4, cursor=first["next_cursor"])
+
+    assert [r["id"] for r in first["items"]] == [7, 5, 4, 3]
+    assert [r["id"] for r in second["items"]] == [2, 1]  # RESOLVED 제외
+    assert second["next_cursor"] is None
+    assert first["items"][0]["reporter_nickname"] == "reporter"
+    assert first["items"][0]["reported_nickname"] == "spammer"
+
+
+def test_targets_hydrated_with_one_query_per_type(report_db, engine):
+    db = report_db
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    items = {r["id"]: r for r in admin_service.list_pending_reports(db, limit=10)["items"]}
+
+    # 신고 조회 1 + 대상 유형(POST/BOARD_POST/COMMENT/MESSAGE) 4 (USER 는 내용 없음)
+    assert len(statements) == 5
+    assert items[1]["project_title"] == "프로젝트" and items[1]["post_content"] == "프로젝트 설명"
+    assert items[2]["board_post_title"] == "자유글" and items[2]["post_title"] == "자유글"
+    assert items[3]["comment_content"] == items[5]["comment_content"] == "댓글 본문"
+    assert items[4]["message_content"] == "쪽지 본문"
+    assert items[7]["post_title"] is None and items[7]["comment_content"] is None
+
+
+def test_bulk_resolve_handles_all_reports_on_target_in_one_pass(report_db, engine):
+    from app.admin.admin_schema import BulkResolveReportsRequest
+
+    db = report_db
+    # 같은 게시글에 다른 신고자 2명 추가 (기존 #2 포함 대기 3건, #6 은 이미 처리됨)
+    _add_user(db, 3, "r3")
+    _add_user(db, 4, "r4")
+    db.flush()
+    for rid, reporter in ((8, 3), (9, 4)):
+        db.execute(INSERT_REPORT, {"id": rid, "reporter": reporter, "type": "BOARD_POST", "target": 1,
+                                   "status": "PENDING", "ts": datetime(2025, 1, 1)})
+    db.execute(text("INSERT INTO notification_counters (user_id, unread_count) VALUES (1, 0), (3, 0), (4, 2)"))
+    db.commit()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    body = BulkResolveReportsRequest(target_type="BOARD_POST", target_id=1, action="RESOLVE",
+                                     content_action="HIDE", user_action="WARNING", reason="도배")
+    result = admin_service.resolve_reports_for_target(body, admin_id=1, db=db)
+    # 조회 1 + 상태 변경 1 + 처리 이력 1(executemany) + 숨김 1 + 경고 1 + 알림 1 + 알림 카운터 1 (executemany)
+    assert len(statements) == 7
+
+    assert result == {"processed": 3, "report_ids": [2, 8, 9]}
+    assert db.execute(text("SELECT status FROM board_posts WHERE id=1")).scalar() == "HIDDEN"
+    assert db.execute(text("SELECT COUNT(*) FROM user_warnings WHERE user_id=2")).scalar() == 1
+    assert db.execute(text("SELECT COUNT(*) FROM report_actions")).scalar() == 3
+    notified = db.execute(text("SELECT user_id, related_id FROM notifications ORDER BY related_id")).all()
+    assert [tuple(n) for n in notified] == [(1, 2), (3, 8), (4, 9)]
+    counters = db.execute(text("SELECT user_id, unread_count FROM notification_counters ORDER BY user_id")).all()
+    assert [tuple(c) for c in counters] == [(1, 1), (3, 1), (4, 3)]
+    assert db.execute(text("SELECT status FROM reports WHERE id=6")).scalar() == "RESOLVED"
+
+
+def test_single_resolve_stops_when_report_was_claimed_concurrently(report_db, engine):
+    from types import SimpleNamespace
+    from fastapi import HTTPException
+
+    db = report_db
+
+    def bulk_resolved_first(conn, cursor, statement, *args):
+        # 상태 확인(일반 SELECT) 이후, 조건부 UPDATE 직전에 일괄 처리가 먼저 commit 된 상황
+        if "AND status='PENDING'" in statement and "WHERE id=" in statement:
+            conn.connection.execute("UPDATE reports SET status='RESOLVED' WHERE id=1")
+
+    event.listen(engine, "before_cursor_execute", bulk_resolved_first)
+    body = SimpleNamespace(post_action="REJECT", reason=None)
+    with pytest.raises(HTTPException) as exc:
+        admin_service.resolve_post_report(1, body, admin_id=1, db=db)
+    assert exc.value.status_code == 400
+    assert db.execute(text("SELECT COUNT(*) FROM messages")).scalar() == 1  # 반려 쪽지 미발송
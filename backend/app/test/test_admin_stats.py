@@ -0,0 +1,72 @@
+# backend/app/test/test_admin_stats.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from app import models
+from app.admin.admin_stats import AdminStats
+
+
+@pytest.fixture
+def stats_db(db):
+    for uid, role in ((1, "ADMIN"), (2, "MEMBER"), (3, "ADMIN")):
+        db.add(models.User(id=uid, nickname=f"user{uid}", email=f"u{uid}@test.com", name=f"유저{uid}", role=role))
+    for pid, status in ((1, "PENDING"), (2, "APPROVED"), (3, "PENDING")):
+        db.add(models.RecipePost(id=pid, leader_id=2, type="STUDY", title=f"공고{pid}", capacity=3, status=status))
+    db.flush()
+    db.execute(text(
+        "INSERT INTO reports (id, reporter_user_id, reported_user_id, target_type, target_id, reason, status) "
+        "VALUES (1, 1, 2, 'USER', 2, '스팸', 'PENDING'), (2, 1, 2, 'POST', 1, '스팸', 'RESOLVED')"
+    ))
+    db.commit()
+    return db
+
+
+def test_counters_load_once_then_follow_adjustments(stats_db):
+    db = stats_db
+    stats = AdminStats()
+    stats.adjust(pending_reports=1)  # 적재 전 증감은 무시 (첫 조회 때 COUNT)
+
+    assert stats.snapshot(db) == {"pending_posts": 2, "pending_reports": 1}
+    stats.adjust(pending_reports=1)
+    stats.adjust(pending_posts=-1)
+    stats.adjust(pending_posts=-5)  # 0 미만으로 내려가지 않음
+    assert stats.snapshot(db) == {"pending_posts": 0, "pending_reports": 2}
+
+    # 주기 재집계가 실제 값으로 보정
+    assert stats.load(db) == {"pending_posts": 2, "pending_reports": 1}
+
+
+def test_changes_pushed_to_connected_admin_sessions(stats_db, monkeypatch):
+    from app.notifications.notification_ws_manager import manager
+
+    sent = []
+    done = threading.Event()
+
+    async def fake_send(user_id, message):
+        sent.append((user_id, message))
+        done.set()
+
+    monkeypatch.setattr(manager, "active_connections", {"1": {}, "2": {}})  # 3번 관리자는 미접속
+    monkeypatch.setattr(manager, "send_personal_message", fake_send)
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        stats = AdminStats()
+        stats.load(stats_db)  # 루프 등록 전 → 전송 없음
+        stats.bind_loop(loop)
+        stats.adjust(pending_reports=1)
+        assert done.wait(2)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(2)
+        loop.close()
+
+    assert sent == [(1, {"type": "ADMIN_STATS", "data": {"pending_posts": 2, "pending_reports": 2}})]
@@ -0,0 +1,59 @@
+# backend/app/test/test_ai_expand.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+for key in ("DB_USER", "DB_PASSWORD", "DB_NAME"):
+    os.environ.setdefault(key, "test")  # 비로그인 요청은 DB에 접속하지 않음
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.project_post import ai_router, ai_client
+from app.project_post.ai_client import FakeAIBackend
+from app.project_post.ai_cache import expansion_cache, quota
+
+app = FastAPI()
+app.include_router(ai_router.router)
+client = TestClient(app)
+
+
+def test_expand_uses_fake_backend(monkeypatch):
+    """✅ 네트워크 없이 /ai/expand 응답 + 4번 섹션 후처리"""
+    expansion_cache.clear()
+    monkeypatch.setattr(ai_client, "_backend", FakeAIBackend())
+    res = client.post("/ai/expand", json={"prompt": "여행 일정 공유 앱"})
+    assert res.status_code == 200
+    assert res.json()["description"].rstrip().endswith("(예: 모집 인원, 우대사항, 희망 일정 등)")
+
+
+def test_expand_stream_sends_deltas_then_done(monkeypatch):
+    """✅ SSE: delta 이벤트 여러 개 → done 이벤트에 최종본"""
+    fake = FakeAIBackend(text="1. 프로젝트 소개\n스트리밍 테스트", chunk_size=4)
+    expansion_cache.clear()
+    monkeypatch.setattr(ai_client, "_backend", fake)
+    res = client.post("/ai/expand/stream", json={"prompt": "테스트"})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/event-stream")
+
+    events = [e for e in res.text.split("\n\n") if e]
+    assert sum(e.startswith("event: delta") for e in events) > 1
+    assert events[-1].startswith("event: done")
+    assert "4. 그 외 자유기재" in events[-1]
+
+
+def test_near_identical_prompt_hits_cache(monkeypatch):
+    """✅ 공백/대소문자만 다른 요약문은 업스트림 호출 없이 캐시 응답 + 쿼터 미차감"""
+    expansion_cache.clear()
+    fake = FakeAIBackend()
+    monkeypatch.setattr(ai_client, "_backend", fake)
+    monkeypatch.setattr(quota, "daily_limit", 1)
+    monkeypatch.setattr(quota, "_usage", {})
+
+    first = client.post("/ai/expand", json={"prompt": "Travel  앱 만들기."})
+    second = client.post("/ai/expand", json={"prompt": " travel 앱 만들기"})
+    assert first.json()["cached"] is False
+    assert second.json()["cached"] is True
+    assert second.json()["description"] == first.json()["description"]
+    assert fake.calls == 1
+
+    third = client.post("/ai/expand", json={"prompt": "다른 프로젝트"})
+    assert third.status_code == 429
@@ -0,0 +1,100 @@
+# backend/app/test/test_apply_concurrency.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+for key in ("DB_USER", "DB_PASSWORD", "DB_NAME"):
+    os.environ.setdefault(key, "test")  # .env 없으면 접속 실패 → skip
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.database import SessionLocal
+from app import models
+from app.project_post import recipe_service
+
+APPLICANTS = 10
+REQUESTS = 100  # 지원자 1명당 10번씩 동시에 신청
+
+
+@pytest.fixture
+def capacity3_post():
+    """정원 3명 공고 + 지원자 10명 (MySQL 필요)"""
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT 1"))
+    except OperationalError:
+        db.close()
+        pytest.skip("MySQL 연결 불가")
+
+    tag = uuid.uuid4().hex[:8]
+    users = [
+        models.User(nickname=f"apply{i}", email=f"apply_{tag}_{i}@test.local", name=f"지원자{i}")
+        for i in range(APPLICANTS + 1)
+    ]
+    db.add_all(users)
+    db.flush()
+    field = db.query(models.ApplicationField).first()
+    post = models.RecipePost(
+        leader_id=users[0].id, type="PROJECT", title=f"동시 지원 테스트 {tag}",
+        capacity=3, current_members=1, status="APPROVED", recruit_status="OPEN",
+    )
+    db.add(post)
+    db.commit()
+
+    yield post.id, [u.id for u in users[1:]], field.id if field else None
+
+    db.execute(
+        text("DELETE aa FROM application_answers aa JOIN applications a ON a.id = aa.application_id "
+             "WHERE a.post_id = :pid"),
+        {"pid": post.id},
+    )
+    db.execute(text("DELETE FROM applications WHERE post_id = :pid"), {"pid": post.id})
+    db.execute(text("DELETE FROM posts WHERE id = :pid"), {"pid": post.id})
+    db.execute(text("DELETE FROM users WHERE email LIKE :pat"), {"pat": f"apply_{tag}_%"})
+    db.commit()
+    db.close()
+
+
+def test_concurrent_applies_create_one_application_per_user(capacity3_post):
+    """✅ 100건 동시 지원 → 지원자당 PENDING 1건 + 답변 누락/중복 없음"""
+    post_id, applicant_ids, field_id = capacity3_post
+    answers = [{"field_id": field_id, "answer_text": "열심히 하겠습니다"}] if field_id else []
+
+    def apply(i):
+        db = SessionLocal()
+        try:
+            recipe_service.submit_application(db, post_id, applicant_ids[i % APPLICANTS], answers)
+            return 200
+        except HTTPException as e:
+            return e.status_code
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=REQUESTS) as pool:
+        results = list(pool.map(apply, range(REQUESTS)))
+
+    assert results.count(200) == APPLICANTS
+    assert results.count(400) == REQUESTS - APPLICANTS
+
+    db = SessionLocal()
+    try:
+        per_user = db.execute(
+            text("SELECT user_id, COUNT(*) FROM applications WHERE post_id = :pid GROUP BY user_id"),
+            {"pid": post_id},
+        ).all()
+        assert sorted(u for u, _ in per_user) == sorted(applicant_ids)
+        assert all(cnt == 1 for _, cnt in per_user)
+
+        answer_count = db.execute(
+            text("SELECT COUNT(*) FROM application_answers aa JOIN applications a "
+                 "ON a.id = aa.application_id WHERE a.post_id = :pid"),
+            {"pid": post_id},
+        ).scalar()
+        assert answer_count == APPLICANTS * len(answers)
+    finally:
+        db.close()
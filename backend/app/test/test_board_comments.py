@@ -0,0 +1,60 @@
+# backend/app/test/test_board_comments.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import DateTime, bindparam, text
+
+from app import models
+from app.board import board_service
+
+
+@pytest.fixture
+def comment_db(db):
+    """게시글 1: 최상위 댓글 5개, 1번 댓글에 대댓글 5개 / 게시글 2: 다른 댓글 1개"""
+    base = datetime(2025, 1, 1, 9)
+    insert = text(
+        "INSERT INTO comments (id, board_post_id, user_id, parent_id, content, created_at, status) "
+        "VALUES (:id, :pid, 1, :parent, :content, :ts, :status)"
+    ).bindparams(bindparam("ts", type_=DateTime))
+    db.add(models.User(id=1, nickname="writer", email="writer@test.com", name="작성자"))
+    db.flush()
+    for i in range(1, 6):
+        db.execute(insert, {"id": i, "pid": 1, "parent": None, "content": f"c{i}",
+                            "ts": base + timedelta(minutes=i), "status": "DELETED" if i == 2 else "VISIBLE"})
+    for i in range(6, 11):
+        db.execute(insert, {"id": i, "pid": 1, "parent": 1, "content": f"r{i}",
+                            "ts": base + timedelta(hours=1, minutes=i), "status": "VISIBLE"})
+    db.execute(insert, {"id": 11, "pid": 2, "parent": None, "content": "other",
+                        "ts": base, "status": "VISIBLE"})
+    db.commit()
+    return db
+
+
+def test_comment_page_has_reply_previews_and_cursor(comment_db):
+    db = comment_db
+    first = board_service.list_comments(db, post_id=1, limit=2, reply_preview=2)
+
+    assert [t["comment"]["id"] for t in first["items"]] == [1, 2]
+    thread = first["items"][0]
+    assert [r["id"] for r in thread["replies"]] == [6, 7]
+    assert thread["reply_count"] == 5 and thread["replies_cursor"]
+    assert first["items"][1]["comment"]["content"] == "삭제된 댓글입니다."
+    assert first["items"][1]["reply_count"] == 0 and first["items"][1]["replies_cursor"] is None
+
+    second = board_service.list_comments(db, post_id=1, limit=2, cursor=first["next_cursor"])
+    last = board_service.list_comments(db, post_id=1, limit=2, cursor=second["next_cursor"])
+    assert [t["comment"]["id"] for t in second["items"] + last["items"]] == [3, 4, 5]
+    assert last["next_cursor"] is None
+
+
+def test_load_more_replies_continues_after_preview(comment_db):
+    db = comment_db
+    thread = board_service.list_comments(db, post_id=1, reply_preview=2)["items"][0]
+
+    page = board_service.list_replies(db, parent_id=1, limit=2, cursor=thread["replies_cursor"])
+    rest = board_service.list_replies(db, parent_id=1, limit=2, cursor=page["next_cursor"])
+    assert [r["id"] for r in page["items"] + rest["items"]] == [8, 9, 10]
+    assert rest["next_cursor"] is None
@@ -0,0 +1,53 @@
+# backend/app/test/test_board_user_lists.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import DateTime, bindparam, text
+
+from app.board import board_service
+
+
+@pytest.fixture
+def board_db(db):
+    db.execute(text("INSERT INTO categories (id, name) VALUES (1, '자유')"))
+    # 같은 시각 게시글 2개 포함 → (created_at, id) 동률 처리 확인
+    insert = text(
+        "INSERT INTO board_posts (id, category_id, author_id, title, content, created_at, status) "
+        "VALUES (:id, 1, 1, :title, 'x', :ts, :status)"
+    ).bindparams(bindparam("ts", type_=DateTime))
+    for i, day, status in [(1, 1, "VISIBLE"), (2, 2, "VISIBLE"), (3, 2, "VISIBLE"),
+                           (4, 3, "VISIBLE"), (5, 4, "HIDDEN")]:
+        db.execute(insert, {"id": i, "title": f"글{i}", "ts": datetime(2025, 1, day, 10), "status": status})
+    db.commit()
+    return db
+
+
+def test_user_posts_keyset_pages_cover_all_rows_once(board_db):
+    db = board_db
+    seen, cursor = [], None
+    for _ in range(5):
+        page = board_service.list_user_posts(db, author_id=1, limit=2, cursor=cursor)
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert seen == [4, 3, 2, 1]  # 숨김 글 제외, 최신순 + 동률은 id 역순
+    assert board_service.list_user_posts(db, author_id=1, limit=10)["items"][-1]["category"] == "자유"
+
+
+def test_comment_count_follows_create_and_delete(board_db):
+    db = board_db
+    first = board_service.create_comment(db, post_id=4, user_id=2, content="a", parent_id=None)
+    board_service.create_comment(db, post_id=4, user_id=2, content="b", parent_id=None)
+
+    assert board_service.delete_comment(db, first, user_id=2)
+    assert board_service.delete_comment(db, first, user_id=2)  # 이미 삭제된 댓글은 다시 차감하지 않음
+    post = board_service.list_user_posts(db, author_id=1, limit=1)["items"][0]
+    assert post["id"] == 4 and post["comment_count"] == 1
+
+    comments = board_service.list_user_comments(db, user_id=2, limit=1)
+    assert [c["content"] for c in comments["items"]] == ["b"]
+    assert comments["next_cursor"] is None
@@ -0,0 +1,64 @@
+# backend/app/test/test_dashboard.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import models
+from app.project_post import dashboard_service
+
+ME = 1
+
+
+@pytest.fixture
+def dashboard_db(db):
+    db.add(models.Skill(id=1, name="React"))
+    base = datetime(2025, 1, 1)
+
+    # 내가 리더인 공고 3개 (1~3) / 참여중 1개 (4) / 지원 대기 1개 (5)
+    for pid in range(1, 6):
+        db.add(models.RecipePost(
+            id=pid, leader_id=ME if pid <= 3 else 2, type="STUDY", title=f"공고{pid}",
+            capacity=4, current_members=1, status="APPROVED", created_at=base + timedelta(days=pid),
+        ))
+        db.add(models.RecipePostSkill(post_id=pid, skill_id=1))
+    db.add(models.PostMember(post_id=4, user_id=ME, role="MEMBER", joined_at=base))
+    db.add(models.Application(id=10, post_id=5, user_id=ME, status="PENDING", created_at=base))
+    db.commit()
+    return db
+
+
+def test_dashboard_sections_and_cursor(dashboard_db):
+    """✅ 세 구역 한 번에 + led 구역 커서로 다음 페이지"""
+    db = dashboard_db
+    dashboard_service.invalidate_user(ME)
+
+    first = dashboard_service.get_dashboard(db, ME, limit=2)
+    assert [i["id"] for i in first["led"]["items"]] == [3, 2]
+    assert [i["id"] for i in first["joined"]["items"]] == [4]
+    assert first["applied"]["items"][0]["application_id"] == 10
+    assert first["led"]["items"][0]["skills"] == [{"id": 1, "name": "React"}]
+    assert first["joined"]["next_cursor"] is None
+
+    more = dashboard_service.get_dashboard(
+        db, ME, limit=2, cursors={"led": first["led"]["next_cursor"]}, sections=["led"]
+    )
+    assert list(more) == ["led"]
+    assert [i["id"] for i in more["led"]["items"]] == [1]
+    assert more["led"]["next_cursor"] is None
+
+
+def test_dashboard_cache_invalidated_per_user(dashboard_db):
+    """✅ 캐시 적중 → 지원 상태 변경 후 invalidate_user 하면 새로 조회"""
+    db = dashboard_db
+    dashboard_service.invalidate_user(ME)
+    before = dashboard_service.get_dashboard(db, ME)
+
+    db.query(models.Application).filter_by(id=10).update({"status": "REJECTED"})
+    db.commit()
+    assert dashboard_service.get_dashboard(db, ME) is before
+
+    dashboard_service.invalidate_user(ME)
+    assert dashboard_service.get_dashboard(db, ME)["applied"]["items"] == []
@@ -0,0 +1,43 @@
+# backend/app/test/test_email_code_store.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import pytest
+from fastapi import HTTPException
+from app.core import email_verifier, verification_store
+from app.core.verification_store import CodeRecord, InMemoryCodeStore
+
+
+def test_send_verify_with_rate_limit(monkeypatch):
+    """✅ 발송 → 검증 → 인증 상태 확인 + 윈도우 내 발송 횟수 제한"""
+    store = InMemoryCodeStore()
+    email_verifier.set_store(store)
+    monkeypatch.setattr(email_verifier, "is_valid_email_domain", lambda e: True)
+    monkeypatch.setattr(email_verifier, "send_email_smtp", lambda *a: None)
+    monkeypatch.setattr(email_verifier, "RATE_LIMIT", 2)
+
+    email_verifier.send_code("User@Example.org")
+    code = store.get("user@example.org").code
+    assert not email_verifier.verify_code("user@example.org", "wrong!")
+    assert email_verifier.verify_code("user@example.org", code)
+    assert store.get("user@example.org").verified
+
+    email_verifier.send_code("user@example.org")
+    with pytest.raises(HTTPException) as exc:
+        email_verifier.send_code("user@example.org")
+    assert exc.value.status_code == 429
+
+
+def test_sweep_removes_only_expired(monkeypatch):
+    """✅ 타이밍 휠 sweep: 만료된 코드만 제거"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(verification_store, "_now", lambda: now[0])
+    store = InMemoryCodeStore(sweep_interval=3600, resolution=10)
+
+    store.put("old@example.org", CodeRecord("111111", now[0] + 30, False))
+    store.put("new@example.org", CodeRecord("222222", now[0] + 600, False))
+    now[0] += 60
+
+    assert store.sweep() == 1
+    assert store.get("old@example.org") is None
+    assert store.get("new@example.org").code == "222222"
@@ -0,0 +1,59 @@
+# backend/app/test/test_email_domain_cache.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import asyncio
+from app.core import email_utils
+
+
+def _fake_resolver(table: dict, calls: list):
+    """오프라인 MX resolver: table[domain] = (MX 존재 여부, TTL)"""
+    def resolve(domain: str):
+        calls.append(domain)
+        return table.get(domain, (False, 60))
+    return resolve
+
+
+def test_mx_lookup_is_cached():
+    """✅ 같은 도메인은 TTL 동안 한 번만 조회"""
+    calls = []
+    email_utils.set_mx_resolver(_fake_resolver({"example.org": (True, 600)}, calls))
+    try:
+        assert email_utils.is_valid_email_domain("a@example.org")
+        assert email_utils.is_valid_email_domain("b@EXAMPLE.org")
+        assert not email_utils.is_valid_email_domain("c@nope.invalid")
+        assert not email_utils.is_valid_email_domain("d@nope.invalid")
+        assert calls == ["example.org", "nope.invalid"]
+    finally:
+        email_utils.set_mx_resolver(None)
+
+
+def test_allowlist_and_bad_format_skip_lookup():
+    """✅ 허용 목록 도메인/형식 오류는 DNS 조회 없이 판정"""
+    calls = []
+    email_utils.set_mx_resolver(_fake_resolver({}, calls))
+    try:
+        assert email_utils.is_valid_email_domain("user@gmail.com")
+        assert not email_utils.is_valid_email_domain("no-at-sign")
+        assert not email_utils.is_valid_email_domain("user@localhost")
+        assert calls == []
+    finally:
+        email_utils.set_mx_resolver(None)
+
+
+def test_transient_failure_not_cached():
+    """✅ 일시적 DNS 오류(None)는 캐싱하지 않고 다음 요청에서 재조회"""
+    calls = []
+
+    def flaky(domain):
+        calls.append(domain)
+        return None if len(calls) == 1 else (True, 300)
+
+    email_utils.set_mx_resolver(flaky)
+    try:
+        assert not email_utils.is_valid_email_domain("x@flaky.org")
+        assert asyncio.run(email_utils.is_valid_email_domain_async("x@flaky.org"))
+        assert asyncio.run(email_utils.is_valid_email_domain_async("y@flaky.org"))
+        assert calls == ["flaky.org", "flaky.org"]
+    finally:
+        email_utils.set_mx_resolver(None)
@@ -0,0 +1,48 @@
+# backend/app/test/test_file_store.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from datetime import datetime, timedelta
+from sqlalchemy import text
+
+from app.board.board_model import BoardPost
+from app.files import file_store
+
+HASH_A = "a" * 64
+HASH_B = "b" * 64
+
+
+def test_register_blob_reuses_existing_url(db):
+    """✅ 같은 sha256 재업로드 → 기존(평면 경로) URL 재사용, 행 1개"""
+    legacy = f"/uploads/project_images/{HASH_A}.png"
+    assert file_store.register_blob(db, HASH_A, legacy, 10, "image/png") == legacy
+
+    sharded = file_store.sharded_url("/uploads/project_images", HASH_A, ".png")
+    assert sharded == f"/uploads/project_images/aa/aa/{HASH_A}.png"
+    assert file_store.register_blob(db, HASH_A, sharded, 10, "image/png", user_id=3) == legacy
+    assert db.execute(text("SELECT COUNT(*) FROM files")).scalar() == 1
+
+
+def test_collect_garbage_removes_only_unreferenced(db, tmp_path, monkeypatch):
+    """✅ 재집계 후 참조 0 + 유예 경과 파일만 삭제 (참조 중인 파일은 유지)"""
+    monkeypatch.chdir(tmp_path)
+    urls = {}
+    for file_hash in (HASH_A, HASH_B):
+        url = file_store.sharded_url("/uploads/project_images", file_hash, ".png")
+        path = tmp_path / file_store.url_to_path(url)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"img")
+        urls[file_hash] = url
+        file_store.register_blob(db, file_hash, url, 3, "image/png")
+
+    # A: 게시판 첨부로 참조 (절대 URL) / B: 증감 누락으로 ref_count 만 남은 고아
+    db.add(BoardPost(id=1, author_id=1, title="첨부", content="x",
+                     attachment_url=f"http://localhost:8000{urls[HASH_A]}"))
+    file_store.add_ref(db, urls[HASH_B])
+    db.execute(text("UPDATE files SET last_seen_at = :t"), {"t": datetime.utcnow() - timedelta(days=2)})
+    db.commit()
+
+    assert file_store.collect_garbage(db) == {"recounted": 2, "removed": 1}
+    assert (tmp_path / file_store.url_to_path(urls[HASH_A])).exists()
+    assert not (tmp_path / file_store.url_to_path(urls[HASH_B])).exists()
+    assert db.execute(text("SELECT content_hash, ref_count FROM files")).all() == [(HASH_A, 1)]
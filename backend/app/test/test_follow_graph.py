@@ -0,0 +1,95 @@
+# backend/app/test/test_follow_graph.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app import models
+from app.profile import follow_service
+from app.profile.follow_graph import FollowGraph
+
+# 1 → 2, 3, 4 / 2 → 1, 5, 6 / 3 → 5, 6 / 4 → 6, 1 / 7 → 1
+EDGES = [(1, 2), (1, 3), (1, 4), (2, 1), (2, 5), (2, 6), (3, 5), (3, 6), (4, 6), (4, 1), (7, 1)]
+
+
+@pytest.fixture
+def follow_db(db):
+    for uid in range(1, 8):
+        db.add(models.User(id=uid, nickname=f"user{uid}", email=f"u{uid}@test.com", name=f"유저{uid}"))
+        db.add(models.Profile(id=uid, headline=f"headline{uid}"))
+    for follower_id, following_id in EDGES:
+        db.add(models.Follow(follower_id=follower_id, following_id=following_id))
+    db.add(models.Follow(follower_id=5, following_id=1, deleted_at=datetime(2025, 1, 1)))  # 언팔로우된 관계
+    db.commit()
+    return db
+
+
+def test_graph_queries_and_incremental_updates():
+    """✅ 맞팔로우 / 일괄 팔로우 여부 / 추천 + 팔로우·언팔로우 증분 반영"""
+    graph = FollowGraph()
+    for follower_id, following_id in EDGES:
+        graph.add_edge(follower_id, following_id)
+    graph.add_edge(1, 2)  # 중복 무시
+
+    assert graph.following(1) == [2, 3, 4]
+    assert graph.followers(1) == [2, 4, 7]
+    assert graph.mutuals(1) == [2, 4]
+    assert graph.common_followings(2, 3) == [5, 6]
+    assert graph.follows_many(1, [2, 5, 4, 9]) == {2, 4}
+
+    # 6: 2·3·4 가 팔로우 (3회) / 5: 2·3 (2회) / 1 은 본인이라 제외
+    assert graph.suggestions(1) == [(6, 3), (5, 2)]
+    assert graph.suggestions(1, exclude=[6]) == [(5, 2)]
+
+    graph.add_edge(1, 6)
+    graph.remove_edge(4, 1)
+    assert graph.suggestions(1) == [(5, 2)]
+    assert graph.mutuals(1) == [2]
+    assert graph.followers(1) == [2, 7]
+
+
+def test_service_loads_graph_and_hydrates_cards(follow_db, monkeypatch):
+    """✅ DB 적재(soft delete 제외) + 추천/맞팔로우 카드 + 일괄 확인"""
+    graph = FollowGraph()
+    monkeypatch.setattr(follow_service, "follow_graph", graph)
+    db = follow_db
+
+    suggestions = follow_service.get_suggestions(db, 1)
+    assert graph.loaded
+    assert graph.followers(1) == [2, 4, 7]
+    assert [(s["id"], s["mutual_count"], s["headline"]) for s in suggestions] == [
+        (6, 3, "headline6"), (5, 2, "headline5"),
+    ]
+
+    mutuals = follow_service.get_mutuals(db, 1, current_user_id=3)
+    assert mutuals["total"] == 2
+    assert [(m["id"], m["is_following"]) for m in mutuals["items"]] == [(2, False), (4, False)]
+    assert follow_service.check_following(db, 1, [4, 5, 4]) == {4: True, 5: False}
+
+    follow_service.follow_user(db, 1, 5)
+    assert follow_service.check_following(db, 1, [5]) == {5: True}
+    assert [s["id"] for s in follow_service.get_suggestions(db, 1)] == [6]
+
+
+def test_changes_during_reload_are_replayed_after_swap(follow_db, monkeypatch):
+    """✅ 재적재 SELECT 이후 commit 된 팔로우/언팔로우가 이전 스냅샷으로 덮어써지지 않음"""
+    db = follow_db
+    graph = FollowGraph()
+    select_rows = db.execute
+
+    def execute(*args, **kwargs):
+        rows = select_rows(*args, **kwargs).all()  # 스냅샷 조회 완료
+        graph.add_edge(5, 1)     # 그 사이 다른 요청의 팔로우
+        graph.remove_edge(1, 2)  # 언팔로우
+        return SimpleNamespace(all=lambda: rows)
+
+    monkeypatch.setattr(db, "execute", execute)
+    graph.load(db)
+
+    assert graph.follows(5, 1)
+    assert not graph.follows(1, 2)
+    assert graph.followers(1) == [2, 4, 5, 7]
+    assert graph._journal == []
@@ -0,0 +1,38 @@
+# backend/app/test/test_image_derivatives.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import pytest
+from app.files import image_derivatives
+
+Image = pytest.importorskip("PIL.Image")
+
+HASH = "a" * 64
+
+
+def test_generates_webp_thumbnails_without_exif(tmp_path, monkeypatch):
+    """✅ 크기별 WebP 파생본 생성 + EXIF 제거 + 목록용 URL 치환"""
+    monkeypatch.setattr(image_derivatives, "THUMB_DIR", str(tmp_path))
+    monkeypatch.setattr(image_derivatives, "_known", set())
+
+    source = tmp_path / f"{HASH}.jpg"
+    exif = Image.Exif()
+    exif[0x010F] = "TestCamera"  # Make
+    Image.new("RGB", (1200, 800), "red").save(source, "JPEG", exif=exif)
+
+    url = f"/uploads/project_images/{HASH}.jpg"
+    assert image_derivatives.thumbnail_url(url) == url  # 생성 전엔 원본
+
+    assert image_derivatives.generate_derivatives(str(source), HASH) == 2
+    assert image_derivatives.generate_derivatives(str(source), HASH) == 0  # 이미 있음
+
+    with Image.open(image_derivatives.derivative_path(HASH, "md")) as thumb:
+        assert thumb.format == "WEBP"
+        assert thumb.size == (480, 320)
+        assert not thumb.getexif()
+
+    assert image_derivatives.thumbnail_url(url) == f"/uploads/thumbs/aa/aa/{HASH}_md.webp"
+    assert image_derivatives.thumbnail_url(f"http://localhost:8000{url}", "sm") == (
+        f"http://localhost:8000/uploads/thumbs/aa/aa/{HASH}_sm.webp"
+    )
+    assert image_derivatives.thumbnail_url("/assets/profile/project.png") == "/assets/profile/project.png"
@@ -0,0 +1,84 @@
+# backend/app/test/test_notification_counters.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import pytest
+from sqlalchemy import event, text
+
+from app import models
+from app.messages.message_model import Message
+from app.notifications import notification_service as svc
+from app.messages import message_service
+
+
+@pytest.fixture
+def counter_db(db):
+    for uid in (1, 2, 3):
+        db.add(models.User(id=uid, nickname=f"user{uid}", email=f"u{uid}@test.com", name=f"유저{uid}"))
+    db.add(Message(id=10, sender_id=2, receiver_id=1, content="쪽지"))
+    db.flush()
+    db.execute(text("""
+        INSERT INTO notifications (id, user_id, type, message, related_id, is_read) VALUES
+            (1, 1, 'FOLLOW', 'a', NULL, 0), (2, 1, 'FOLLOW', 'b', NULL, 0),
+            (3, 1, 'MESSAGE', 'c', 10, 0), (4, 1, 'FOLLOW', 'd', NULL, 1),
+            (5, 2, 'FOLLOW', 'e', NULL, 0)
+    """))
+    db.execute(text("INSERT INTO notification_counters (user_id, unread_count) VALUES (1, 3), (2, 1)"))
+    db.commit()
+    return db
+
+
+def test_send_increments_counter_in_same_transaction(counter_db):
+    db = counter_db
+    new_id = svc.send_notification(1, "FOLLOW", "f", db=db)
+    svc.send_notifications_bulk(db, [{"user_id": 1, "message": "g"}, {"user_id": 2, "message": "h"}], "WARNING")
+    db.rollback()  # 일괄 전송은 호출 측 commit → 롤백 시 알림/카운터 모두 취소
+
+    assert new_id == 6
+    assert svc.unread_count(1, db) == 4
+    assert svc.unread_count(2, db) == 1
+
+    # 카운터 행이 없는 사용자도 첫 알림에서 행 생성 (upsert)
+    svc.send_notification(3, "FOLLOW", "i", db=db)
+    assert svc.unread_count(3, db) == 1
+
+
+def test_read_paths_decrement_only_newly_read(counter_db, engine):
+    db = counter_db
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    assert svc.unread_count(1, db) == 3
+    assert len(statements) == 1 and "notification_counters" in statements[0]
+
+    # 이미 읽은 4번은 카운터에 영향 없음 / 다른 사용자 알림은 갱신 안 됨
+    assert svc.mark_read(1, [1, 4, 5], db) == 1
+    assert svc.unread_count(1, db) == 2
+    assert svc.mark_read(1, [1], db) == 0
+    assert svc.unread_count(1, db) == 2
+
+    # 쪽지 읽음 → MESSAGE 알림 동기화 (두 번째 호출은 감소 없음)
+    message_service.mark_read(1, 10, db)
+    message_service.mark_read(1, 10, db)
+    assert svc.unread_count(1, db) == 1
+
+    # 전체 읽음은 전환된 행 수만큼만 차감 → 그 사이 commit 된 알림(카운터만 반영된 상태)은 남음
+    db.execute(text("UPDATE notification_counters SET unread_count = unread_count + 1 WHERE user_id = 1"))
+    assert svc.mark_all_read(1, db) == 1
+    assert svc.unread_count(1, db) == 1
+    assert svc.unread_count(2, db) == 1
+    assert svc.unread_count(99, db) == 0  # 카운터 행 없음
+
+
+def test_recount_repairs_drifted_counters(counter_db):
+    db = counter_db
+    db.execute(text("UPDATE notification_counters SET unread_count = 7 WHERE user_id = 1"))
+    db.execute(text("UPDATE notifications SET is_read = 1 WHERE user_id = 2"))  # 직접 SQL 수정
+    db.execute(text("INSERT INTO notifications (id, user_id, type, message, is_read) VALUES (6, 3, 'FOLLOW', 'f', 0)"))
+    db.commit()
+
+    assert svc.recount_unread(db) == 3  # 보정 2 + 카운터 행 없던 사용자 1
+    assert svc.unread_count(1, db) == 3
+    assert svc.unread_count(2, db) == 0
+    assert svc.unread_count(3, db) == 1
+    assert svc.recount_unread(db) == 0
@@ -0,0 +1,67 @@
+# backend/app/test/test_oauth_stub.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+for key in ("DB_USER", "DB_PASSWORD", "DB_NAME"):
+    os.environ.setdefault(key, "test")  # 토큰 교환/사용자 조회만 검증 (DB 미사용)
+
+from app.auth import auth_service, oauth_http
+
+
+def test_kakao_profile_via_stub_provider():
+    """✅ 로컬 스텁 provider로 토큰 교환 → 사용자 조회 (공유 세션 재사용)"""
+
+    def token(request):
+        body = oauth_http.form_body(request)
+        if body.get("code") != "good-code":
+            return 400, {"error": "invalid_grant"}
+        return 200, {"access_token": "stub-token"}
+
+    stub = oauth_http.install_stub({
+        "https://kauth.kakao.com/oauth/token": token,
+        "https://kapi.kakao.com/v2/user/me": {
+            "id": 42,
+            "kakao_account": {"email": "stub@kakao.com", "profile": {"nickname": "스텁"}},
+        },
+    })
+    try:
+        session = oauth_http.get_session()
+        profile = auth_service._fetch_social_profile("kakao", "good-code")
+        assert profile == {"email": "stub@kakao.com", "name": "스텁", "social_id": "42"}
+        assert oauth_http.get_session() is session
+        assert stub.calls == [
+            ("POST", "https://kauth.kakao.com/oauth/token"),
+            ("GET", "https://kapi.kakao.com/v2/user/me"),
+        ]
+
+        try:
+            auth_service._fetch_social_profile("kakao", "bad-code")
+            assert False, "잘못된 코드는 ValueError"
+        except ValueError:
+            pass
+    finally:
+        oauth_http.close_session()
+
+
+def test_google_discovery_is_cached():
+    """✅ OIDC discovery는 한 번만 조회하고 userinfo의 sub도 social_id로 인식"""
+    stub = oauth_http.install_stub({
+        "https://accounts.google.com/.well-known/openid-configuration": {
+            "token_endpoint": "https://oauth2.googleapis.com/token",
+            "userinfo_endpoint": "https://openidconnect.googleapis.com/v1/userinfo",
+        },
+        "https://oauth2.googleapis.com/token": {"access_token": "g-token"},
+        "https://openidconnect.googleapis.com/v1/userinfo": {
+            "sub": "g-1", "email": "g@example.com", "name": "G",
+        },
+    })
+    auth_service._provider_metadata_cache.clear()
+    try:
+        for _ in range(2):
+            profile = auth_service._fetch_social_profile("google", "code")
+            assert profile["social_id"] == "g-1"
+        discovery_calls = [c for c in stub.calls if "well-known" in c[1]]
+        assert len(discovery_calls) == 1
+    finally:
+        auth_service._provider_metadata_cache.clear()
+        oauth_http.close_session()
@@ -0,0 +1,62 @@
+# backend/app/test/test_post_detail_cache.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+for key in ("DB_USER", "DB_PASSWORD", "DB_NAME"):
+    os.environ.setdefault(key, "test")  # 캐시 적중 경로는 DB에 접속하지 않음
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.project_post import recipe_router
+from app.project_post.post_detail_cache import PostDetailCache, post_detail_cache
+
+app = FastAPI()
+app.include_router(recipe_router.router)
+client = TestClient(app)
+
+
+def test_cached_detail_serves_etag_and_304():
+    """✅ 캐시된 상세 DTO → 200 + ETag / If-None-Match 일치 → 304"""
+    post_detail_cache.clear()
+    payload = {"id": 7, "title": "캐시된 공고"}
+    post_detail_cache.set(7, post_detail_cache.version(7), payload)
+
+    res = client.get("/recipe/7")
+    assert res.status_code == 200
+    assert res.json() == payload
+    etag = res.headers["etag"]
+
+    res = client.get("/recipe/7", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.headers["etag"] == etag
+
+
+def test_invalidate_drops_entry_and_stale_set():
+    """✅ invalidate 후에는 이전 버전으로 만든 DTO를 저장하지 않음"""
+    cache = PostDetailCache()
+    version = cache.version(1)
+    cache.set(1, version, {"title": "v1"})
+    assert cache.get(1).payload == {"title": "v1"}
+
+    cache.invalidate(1)
+    assert cache.get(1) is None
+    cache.set(1, version, {"title": "stale"})  # invalidate 이전에 시작된 조회
+    assert cache.get(1) is None
+
+    cache.set(1, cache.version(1), {"title": "v2"})
+    assert cache.get(1).payload == {"title": "v2"}
+
+
+def test_version_map_is_bounded_without_losing_stale_protection():
+    """✅ invalidate 기록은 maxsize 개까지만 보관 (밀려난 게시글도 이전 버전 저장은 거부)"""
+    cache = PostDetailCache(maxsize=2)
+    version = cache.version(1)
+    cache.invalidate(1)
+    for post_id in range(2, 10):
+        cache.invalidate(post_id)
+    assert len(cache._versions) == 2
+
+    cache.set(1, version, {"title": "stale"})  # 1번 기록이 밀려난 뒤 도착한 이전 조회
+    assert cache.get(1) is None
+    cache.set(1, cache.version(1), {"title": "fresh"})
+    assert cache.get(1).payload == {"title": "fresh"}
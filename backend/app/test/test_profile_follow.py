@@ -0,0 +1,108 @@
+# backend/app/test/test_profile_follow.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app import models
+from app.profile import follow_service, profile_service
+from app.profile.user_skill_model import UserSkill
+
+
+@pytest.fixture
+def profile_db(db):
+    for uid in (1, 2, 3):
+        db.add(models.User(id=uid, nickname=f"user{uid}", email=f"u{uid}@test.com", name=f"유저{uid}"))
+        db.add(models.Profile(id=uid, bio=f"bio{uid}", visibility={"bio": False}))
+    db.add(models.Skill(id=1, name="React"))
+    db.add(UserSkill(user_id=2, skill_id=1, level=3))
+    db.commit()
+    return db
+
+
+def _counts(db, user_id):
+    db.expire_all()
+    profile = db.get(models.Profile, user_id)
+    return profile.follower_count, profile.following_count
+
+
+def test_follow_unfollow_maintains_counters(profile_db):
+    """✅ 팔로우/언팔로우/재팔로우 시 카운터 증감 + 중복 팔로우 400"""
+    db = profile_db
+    follow_service.follow_user(db, 1, 2)
+    follow_service.follow_user(db, 3, 2)
+    assert _counts(db, 2) == (2, 0)
+    assert _counts(db, 1) == (0, 1)
+
+    with pytest.raises(HTTPException) as exc:
+        follow_service.follow_user(db, 1, 2)
+    assert exc.value.status_code == 400
+    assert _counts(db, 2) == (2, 0)
+
+    follow_service.unfollow_user(db, 1, 2)
+    with pytest.raises(HTTPException) as exc:
+        follow_service.unfollow_user(db, 1, 2)
+    assert exc.value.status_code == 404
+    assert _counts(db, 2) == (1, 0)
+    assert _counts(db, 1) == (0, 0)
+
+    follow_service.follow_user(db, 1, 2)  # soft delete 복구
+    assert _counts(db, 2) == (2, 0)
+
+
+def test_profile_detail_cached_until_follow_changes(profile_db, engine):
+    """✅ 프로필 조회는 캐시 적중 시 is_following 조회만, 팔로우 변경 시 갱신"""
+    db = profile_db
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    first = profile_service.get_profile_detail(db, 2, current_user_id=1, current_user_role="MEMBER")
+    assert first["skills"] == [{"id": 1, "name": "React", "level": 3, "icon": "/assets/skills/react.png"}]
+    assert (first["follower_count"], first["is_following"], first["bio"]) == (0, False, None)
+
+    statements.clear()
+    again = profile_service.get_profile_detail(db, 2, current_user_id=1, current_user_role="MEMBER")
+    assert again == first
+    assert len(statements) == 1  # is_following
+
+    own = profile_service.get_profile_detail(db, 2, current_user_id=2, current_user_role="MEMBER")
+    assert own["bio"] == "bio2"  # 본인은 비공개 필드도 조회
+
+    follow_service.follow_user(db, 1, 2)
+    after = profile_service.get_profile_detail(db, 2, current_user_id=1, current_user_role="MEMBER")
+    assert (after["follower_count"], after["is_following"]) == (1, True)
+
+
+def test_follow_list_pages_with_batched_is_following(profile_db, engine):
+    """✅ 팔로워 목록 커서 페이지 + 조회자 팔로우 여부는 페이지당 IN 1쿼리"""
+    db = profile_db
+    base = datetime(2025, 1, 1)
+    for uid in range(10, 16):
+        db.add(models.User(id=uid, nickname=f"user{uid}", email=f"u{uid}@test.com", name=f"유저{uid}"))
+        db.add(models.Follow(follower_id=uid, following_id=2, created_at=base + timedelta(minutes=uid)))
+    db.add(models.Follow(follower_id=1, following_id=12, created_at=base))  # 조회자(1)가 12 팔로우
+    db.add(models.Follow(follower_id=1, following_id=14, created_at=base))
+    db.commit()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    pages, cursor = [], None
+    while True:
+        statements.clear()
+        page = follow_service.get_followers(db, 2, current_user_id=1, limit=4, cursor=cursor)
+        assert len(statements) == 2  # 목록 + is_following IN
+        pages.append(page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert [[u["id"] for u in items] for items in pages] == [[15, 14, 13, 12], [11, 10]]
+    followed = {u["id"] for items in pages for u in items if u["is_following"]}
+    assert followed == {12, 14}
+
+    with pytest.raises(ValueError):
+        follow_service.get_followers(db, 2, cursor="not-a-cursor")
@@ -0,0 +1,83 @@
+# backend/app/test/test_recipe_listing.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import models
+from app.project_post import recipe_service
+from app.project_post.skill_index import SkillIndex, skill_index
+
+
+@pytest.fixture
+def listing_db(db):
+    db.add_all([models.Skill(id=i, name=f"skill{i}") for i in (1, 2, 3)])
+    db.add(models.ApplicationField(id=1, name="포트폴리오"))
+
+    # post 1: 스킬 1,2 / post 2: 스킬 1 / post 3: 스킬 2,3
+    base = datetime(2025, 1, 1)
+    for pid, skills in ((1, [1, 2]), (2, [1]), (3, [2, 3])):
+        db.add(models.RecipePost(
+            id=pid, leader_id=1, type="PROJECT", title=f"공고{pid}", capacity=3,
+            status="APPROVED", recruit_status="OPEN", project_status="ONGOING",
+            created_at=base + timedelta(days=pid),
+        ))
+        db.add_all([models.RecipePostSkill(post_id=pid, skill_id=s) for s in skills])
+        db.add(models.RecipePostRequiredField(post_id=pid, field_id=1))
+    db.commit()
+    skill_index.load(db)
+    return db
+
+
+def test_skill_filter_counts_each_post_once(listing_db):
+    """✅ OR 필터에 여러 스킬이 매칭돼도 total/페이지에 중복 없음 + 최신순"""
+    db = listing_db
+    posts, total = recipe_service.list_recipe_posts(db, skill_ids=[1, 2], page_size=2)
+    assert total == 3
+    assert [p.id for p in posts] == [3, 2]
+    assert [s.skill.name for s in posts[0].skills] == ["skill2", "skill3"]
+    assert posts[0].application_fields[0].field.name == "포트폴리오"
+
+
+def test_skill_filter_and_mode(listing_db, monkeypatch):
+    """✅ AND 필터: 요청한 스킬을 모두 가진 게시글만 (비트맵 인덱스 / DB 서브쿼리 동일 결과)"""
+    db = listing_db
+    posts, total = recipe_service.list_recipe_posts(db, skill_ids=[1, 2], match_mode="AND")
+    assert total == 1
+    assert [p.id for p in posts] == [1]
+
+    monkeypatch.setattr(skill_index, "_loaded", False)
+    monkeypatch.setattr(skill_index, "ensure_loaded", lambda db: None)
+    posts, total = recipe_service.list_recipe_posts(db, skill_ids=[1, 2], match_mode="AND")
+    assert [p.id for p in posts] == [1]
+
+
+def test_skill_index_incremental_update():
+    """✅ 게시글 스킬 수정/삭제가 OR/AND 후보에 즉시 반영"""
+    index = SkillIndex()
+    index._loaded = True
+    index.set_post(10, [1, 2])
+    index.set_post(11, [2])
+    assert index.candidates([1, 2], "OR") == [11, 10]
+    assert index.candidates([1, 2], "AND") == [10]
+
+    index.set_post(10, [2, 3])
+    assert index.candidates([1], "OR") == []
+    assert index.candidates([2, 3], "AND") == [10]
+
+    index.remove_post(11)
+    assert index.candidates([2], "OR") == [10]
+
+
+def test_member_leave_reopens_only_before_end_date():
+    today = recipe_service.kst_today()
+    expired = models.RecipePost(capacity=3, current_members=2, recruit_status="CLOSED",
+                                end_date=today - timedelta(days=1))
+    recipe_service.sync_recruit_status(None, expired, allow_reopen=True)
+    assert expired.recruit_status == "CLOSED"  # 모집기간 지난 공고는 다시 열지 않음
+
+    running = models.RecipePost(capacity=3, current_members=2, recruit_status="CLOSED", end_date=today)
+    recipe_service.sync_recruit_status(None, running, allow_reopen=True)
+    assert running.recruit_status == "OPEN"
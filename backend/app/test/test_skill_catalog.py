@@ -0,0 +1,59 @@
+# backend/app/test/test_skill_catalog.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app import models
+from app.core.database import get_db
+from app.meta import catalog, meta_router
+from app.profile import skill_router
+
+SKILLS = ["React", "React Native", "Next.js", "Node.js", "C++", "C#", "TypeScript", "JavaScript", "Java", "Go"]
+
+
+def test_search_matches_ilike_semantics_prefix_first():
+    """✅ 결과 집합은 '%q%' 와 동일, 접두사 일치가 먼저"""
+    snapshot = catalog.build_snapshot(list(enumerate(SKILLS, 1)), [])
+    for q in ["", "re", "REACT", "script", "java", "c+", "#", ".js", "a", "nat", "zzz", "act nat"]:
+        names = [s.name for s in snapshot.search_skills(q, limit=50)]
+        lower = q.lower()
+        expected = sorted((n for n in SKILLS if lower in n.lower()), key=lambda n: (not n.lower().startswith(lower), n.lower()))
+        assert names == expected, q
+
+    assert [s.name for s in snapshot.search_skills("java", limit=1)] == ["Java"]
+    assert snapshot.search_skills("c++")[0].icon == "/assets/skills/cplusplus.png"
+
+
+def test_meta_endpoints_serve_snapshot_with_etag(session_factory):
+    """✅ /meta 는 스냅샷 + ETag(304), 스킬 추가 시 즉시 갱신"""
+    with session_factory() as db:
+        db.add_all([models.Skill(id=i, name=n) for i, n in enumerate(SKILLS[:3], 1)])
+        db.add(models.ApplicationField(id=1, name="프론트엔드"))
+        db.commit()
+
+    def _get_test_db():
+        with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(meta_router.router)
+    app.include_router(skill_router.router)
+    app.dependency_overrides[get_db] = _get_test_db
+    client = TestClient(app)
+    catalog.clear_catalog()
+
+    res = client.get("/meta/skills")
+    assert res.status_code == 200
+    assert res.json() == [{"id": 1, "name": "React"}, {"id": 2, "name": "React Native"}, {"id": 3, "name": "Next.js"}]
+    assert res.headers["cache-control"] == catalog.CATALOG_CACHE_CONTROL
+    etag = res.headers["etag"]
+    assert client.get("/meta/skills", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/meta/required-fields").json() == [{"id": 1, "name": "프론트엔드"}]
+
+    assert [s["name"] for s in client.get("/skills/search", params={"q": "rea"}).json()] == ["React", "React Native"]
+    client.post("/skills/", json={"name": "Realm"})
+    assert [s["name"] for s in client.get("/skills/search", params={"q": "rea"}).json()] == ["React", "React Native", "Realm"]
+    assert client.get("/meta/skills", headers={"If-None-Match": etag}).status_code == 200
+    catalog.clear_catalog()
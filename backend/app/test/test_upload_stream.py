@@ -0,0 +1,90 @@
+# backend/app/test/test_upload_stream.py
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import hashlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.database import get_db
+from app.files import upload_router
+
+
+@pytest.fixture
+def client(session_factory):
+    # 업로드 등록은 스레드풀에서 실행 → 공용 엔진은 스레드 간 연결 공유 허용
+    def _get_test_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(upload_router.router)
+    app.dependency_overrides[get_db] = _get_test_db
+    return TestClient(app)
+
+
+def _files(root):
+    return sorted(
+        os.path.relpath(os.path.join(d, name), root).replace(os.sep, "/")
+        for d, _, names in os.walk(root) for name in names
+    )
+
+
+def test_upload_streams_to_content_addressed_file(client, session_factory, tmp_path, monkeypatch):
+    """✅ 청크 단위 저장 + sha256 샤딩 경로 + 같은 내용 재업로드 시 임시파일 정리"""
+    monkeypatch.setattr(upload_router, "PROJECT_UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(upload_router, "UPLOAD_CHUNK_SIZE", 1000)
+    content = os.urandom(4500)
+    digest = hashlib.sha256(content).hexdigest()
+    relpath = f"{digest[:2]}/{digest[2:4]}/{digest}.png"
+
+    for _ in range(2):
+        res = client.post("/upload/", files={"file": ("Photo.PNG", content, "image/png")})
+        assert res.status_code == 200
+        assert res.json()["url"] == f"/uploads/project_images/{relpath}"
+
+    assert _files(tmp_path) == [relpath]
+    assert (tmp_path / relpath).read_bytes() == content
+
+    with session_factory() as db:
+        row = db.execute(
+            text("SELECT size_bytes, ref_count, user_id FROM files WHERE content_hash = :h"), {"h": digest}
+        ).one()
+        assert tuple(row) == (4500, 0, None)
+
+
+def test_upload_over_limit_is_rejected(client, tmp_path, monkeypatch):
+    """✅ 최대 크기 초과 → 413 + 남은 파일 없음"""
+    monkeypatch.setattr(upload_router, "PROJECT_UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(upload_router, "UPLOAD_MAX_BYTES", 2048)
+
+    res = client.post("/upload/", files={"file": ("big.jpg", b"x" * 4096, "image/jpeg")})
+    assert res.status_code == 413
+    assert os.listdir(tmp_path) == []
+
+
+def test_reuse_restores_missing_canonical_file(client, session_factory, tmp_path, monkeypatch):
+    """✅ 인덱스가 가리키는 기존 파일이 디스크에 없으면 재업로드 내용으로 복구"""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(upload_router.PROJECT_UPLOAD_DIR, exist_ok=True)
+    content = os.urandom(1200)
+    digest = hashlib.sha256(content).hexdigest()
+    legacy_url = f"/uploads/project_images/{digest}.png"  # 샤딩 이전 평면 경로, 파일 유실
+    with session_factory() as db:
+        db.execute(
+            text("INSERT INTO files (file_url, content_hash, size_bytes, ref_count) VALUES (:u, :h, 1200, 1)"),
+            {"u": legacy_url, "h": digest},
+        )
+        db.commit()
+
+    res = client.post("/upload/", files={"file": ("a.png", content, "image/png")})
+    assert res.status_code == 200
+    assert res.json()["url"] == legacy_url
+    assert _files(tmp_path) == [f"uploads/project_images/{digest}.png"]
+    assert (tmp_path / "uploads/project_images" / f"{digest}.png").read_bytes() == content
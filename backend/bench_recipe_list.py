@@ -0,0 +1,213 @@
+# backend/bench_recipe_list.py
+# =============================================
+# 📊 모집공고 목록 쿼리 벤치마크 (MySQL 없이 SQLite 메모리 DB)
+# - 기존: skills/application_fields/members joinedload + JOIN 상태의 query.count()
+# - 변경: COUNT → id 페이지 → selectinload 일괄 로드 (recipe_service.list_recipe_posts)
+#         스킬 필터는 비트맵 인덱스 후보 id (skill_index) 또는 post_skills 서브쿼리
+# 실행: python bench_recipe_list.py --posts 10000
+# =============================================
+import os
+import sys
+import time
+import random
+import sqlite3
+import argparse
+from datetime import date, datetime, timedelta
+
+for key in ("DB_USER", "DB_PASSWORD", "DB_NAME"):
+    os.environ.setdefault(key, "bench")  # app.core.database 설정 검사 통과용 (접속은 하지 않음)
+
+from sqlalchemy import create_engine, event, func
+from sqlalchemy.orm import sessionmaker, joinedload
+from sqlalchemy.pool import StaticPool
+
+from app import models
+from app.core.base import Base
+from app.project_post import recipe_service
+from app.project_post.skill_index import skill_index
+
+SKILLS = 40
+FIELDS = 10
+
+
+class Stats:
+    statements = 0
+    rows = 0
+
+    @classmethod
+    def reset(cls):
+        cls.statements = 0
+        cls.rows = 0
+
+
+# ✅ DB에서 실제로 넘어온 행 수를 세기 위한 커서
+class CountingCursor(sqlite3.Cursor):
+    def fetchone(self):
+        row = super().fetchone()
+        Stats.rows += row is not None
+        return row
+
+    def fetchmany(self, *args):
+        rows = super().fetchmany(*args)
+        Stats.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = super().fetchall()
+        Stats.rows += len(rows)
+        return rows
+
+
+class CountingConnection(sqlite3.Connection):
+    def cursor(self, factory=CountingCursor):
+        return super().cursor(factory)
+
+
+def build_session():
+    engine = create_engine(
+        "sqlite://",
+        creator=lambda: sqlite3.connect(":memory:", factory=CountingConnection, check_same_thread=False),
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_statement(*args):
+        Stats.statements += 1
+
+    tables = [
+        models.User.__table__,
+        models.Profile.__table__,
+        models.Skill.__table__,
+        models.ApplicationField.__table__,
+        models.RecipePost.__table__,
+        models.RecipePostSkill.__table__,
+        models.RecipePostRequiredField.__table__,
+        models.PostMember.__table__,
+    ]
+    Base.metadata.create_all(engine, tables=tables)
+    return sessionmaker(bind=engine)()
+
+
+def seed(db, post_count: int, members_per_post: int):
+    """게시글마다 스킬 3개 × 지원분야 3개 × 멤버 N명"""
+    rnd = random.Random(42)
+    conn = db.connection()
+    conn.execute(models.Skill.__table__.insert(), [{"id": i, "name": f"skill{i}"} for i in range(1, SKILLS + 1)])
+    conn.execute(
+        models.ApplicationField.__table__.insert(),
+        [{"id": i, "name": f"field{i}"} for i in range(1, FIELDS + 1)],
+    )
+    conn.execute(
+        models.User.__table__.insert(),
+        [
+            {"id": i, "nickname": f"u{i}", "email": f"u{i}@bench.local", "name": f"u{i}",
+             "auth_provider": "LOCAL", "role": "MEMBER", "status": "ACTIVE",
+             "login_fail_count": 0, "account_locked": False, "is_logged_in": False}
+            for i in range(1, members_per_post + 2)
+        ],
+    )
+
+    base = datetime(2025, 1, 1)
+    posts, post_skills, post_fields, members = [], [], [], []
+    for pid in range(1, post_count + 1):
+        posts.append({
+            "id": pid, "leader_id": 1, "type": rnd.choice(["PROJECT", "STUDY"]),
+            "title": f"모집공고 {pid}", "description": "벤치마크용 설명",
+            "capacity": members_per_post + 2, "current_members": members_per_post,
+            "start_date": date(2025, 1, 1), "end_date": date(2099, 1, 1),
+            "project_status": "ONGOING", "status": "APPROVED", "recruit_status": "OPEN",
+            "created_at": base + timedelta(minutes=pid),
+        })
+        post_skills += [{"post_id": pid, "skill_id": s} for s in rnd.sample(range(1, SKILLS + 1), 3)]
+        post_fields += [{"post_id": pid, "field_id": f} for f in rnd.sample(range(1, FIELDS + 1), 3)]
+        members += [{"post_id": pid, "user_id": u, "role": "MEMBER"} for u in range(2, members_per_post + 2)]
+
+    conn.execute(models.RecipePost.__table__.insert(), posts)
+    conn.execute(models.RecipePostSkill.__table__.insert(), post_skills)
+    conn.execute(models.RecipePostRequiredField.__table__.insert(), post_fields)
+    conn.execute(models.PostMember.__table__.insert(), members)
+    db.commit()
+
+
+def legacy_list(db, skill_ids, page, page_size, match_mode="OR"):
+    """변경 전 get_posts 쿼리 (members joinedload 포함 버전)"""
+    Post = models.RecipePost
+    query = (
+        db.query(Post)
+        .options(
+            joinedload(Post.skills).joinedload(models.RecipePostSkill.skill),
+            joinedload(Post.application_fields).joinedload(models.RecipePostRequiredField.field),
+            joinedload(Post.members).joinedload(models.PostMember.user),
+        )
+        .filter(Post.status == "APPROVED", Post.deleted_at.is_(None))
+        .filter(Post.recruit_status == "OPEN", Post.project_status != "ENDED")
+    )
+    if skill_ids and match_mode == "AND":
+        query = (
+            query.join(models.RecipePostSkill)
+            .filter(models.RecipePostSkill.skill_id.in_(skill_ids))
+            .group_by(Post.id)
+            .having(func.count(models.RecipePostSkill.skill_id) == len(skill_ids))
+        )
+    elif skill_ids:
+        query = query.join(models.RecipePostSkill).filter(models.RecipePostSkill.skill_id.in_(skill_ids))
+    query = query.order_by(Post.created_at.desc())
+    total = query.count()
+    posts = query.offset((page - 1) * page_size).limit(page_size).all()
+    return posts, total
+
+
+def new_list(db, skill_ids, page, page_size, match_mode="OR"):
+    return recipe_service.list_recipe_posts(
+        db, skill_ids=skill_ids, match_mode=match_mode, page=page, page_size=page_size
+    )
+
+
+def measure(label, fn, db, repeat, **kwargs):
+    db.expire_all()
+    Stats.reset()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        db.expunge_all()
+        posts, total = fn(db, **kwargs)
+        for post in posts:  # DTO 변환과 동일하게 컬렉션 접근
+            [s.skill.name for s in post.skills]
+            [f.field.name for f in post.application_fields]
+    elapsed = (time.perf_counter() - started) / repeat * 1000
+    print(
+        f"{label:<8} total={total:<6} items={len(posts):<3} "
+        f"queries={Stats.statements // repeat:<3} rows={Stats.rows // repeat:<7} {elapsed:8.2f} ms"
+    )
+    return [post.id for post in posts], total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--members", type=int, default=4)
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    db = build_session()
+    seed(db, args.posts, args.members)
+    skill_index.load(db)  # 서버에선 start_recipe_jobs()에서 적재
+    print(f"posts={args.posts} (스킬 3 × 지원분야 3 × 멤버 {args.members})\n")
+
+    cases = [
+        ("전체 1페이지", dict(skill_ids=None, page=1)),
+        ("전체 중간페이지", dict(skill_ids=None, page=args.posts // args.page_size // 2)),
+        ("스킬 OR 필터", dict(skill_ids=[1, 2, 3, 4, 5], page=1)),
+        ("스킬 AND 필터", dict(skill_ids=[1, 2], match_mode="AND", page=1)),
+    ]
+    for title, kwargs in cases:
+        print(f"▶ {title}")
+        old_ids, old_total = measure("legacy", legacy_list, db, args.repeat, page_size=args.page_size, **kwargs)
+        new_ids, new_total = measure("new", new_list, db, args.repeat, page_size=args.page_size, **kwargs)
+        if old_ids != new_ids or old_total != new_total:
+            print("  ⚠️ 결과 차이: legacy는 JOIN 중복으로 total/페이지가 부풀려짐")
+        print()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
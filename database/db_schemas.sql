@@ -507,3 +507,127 @@ CREATE TABLE IF NOT EXISTS user_sessions (
 -- ======================================================================
 ALTER TABLE users
 ADD COLUMN is_logged_in BOOLEAN NOT NULL DEFAULT FALSE COMMENT '현재 로그인 상태';
+
+-- ======================================================================
+-- ✅ 이메일 인증 코드 공유 저장소 (EMAIL_CODE_STORE=db 일 때 사용)
+-- - 멀티 워커 간 인증 코드 공유 + 이메일별 발송 횟수 제한
+-- ======================================================================
+CREATE TABLE IF NOT EXISTS email_verification_codes (
+  email VARCHAR(255) NOT NULL COMMENT '소문자 이메일',
+  code CHAR(6) NULL COMMENT '인증 코드 (폐기 시 NULL)',
+  expires_at DATETIME NOT NULL COMMENT '코드 만료 시각 (UTC)',
+  verified BOOLEAN NOT NULL DEFAULT FALSE COMMENT '인증 완료 여부',
+  window_started_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '발송 제한 윈도우 시작 (UTC)',
+  send_count INT NOT NULL DEFAULT 0 COMMENT '윈도우 내 발송 횟수',
+  created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성일',
+  updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일',
+  PRIMARY KEY (email),
+  KEY idx_email_codes_expires (expires_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- ======================================================================
+-- ✅ 모집공고 상태 전환 스케줄러용 인덱스 (매일 자정 기간 만료 게시글만 조회)
+-- ======================================================================
+CREATE INDEX idx_posts_recruit_end ON posts (recruit_status, end_date);
+CREATE INDEX idx_posts_project_end ON posts (project_status, project_end);
+
+-- ======================================================================
+-- ✅ posts.current_members 비정규화 컬럼 보정 (승인/탈퇴/강퇴 시 원자적 증감)
+-- - 기존 데이터는 post_members 실제 행 수로 1회 백필
+-- ======================================================================
+SET SQL_SAFE_UPDATES = 0;
+UPDATE posts p
+LEFT JOIN (
+  SELECT post_id, COUNT(*) AS cnt FROM post_members GROUP BY post_id
+) m ON m.post_id = p.id
+SET p.current_members = COALESCE(m.cnt, 0);
+SET SQL_SAFE_UPDATES = 1;
+
+ALTER TABLE posts
+  MODIFY COLUMN current_members INT NOT NULL DEFAULT 0 COMMENT '현재 참여 인원 (post_members 행 수, 리더 포함)';
+
+-- ======================================================================
+-- ✅ 업로드 파일 sha256 인덱스 (중복 제거 + 참조 수 기반 GC)
+-- - 기존 파일 등록: python -m app.files.file_store
+-- ======================================================================
+ALTER TABLE files
+  MODIFY COLUMN user_id BIGINT NULL COMMENT '업로더 (기존 파일 일괄 등록 시 NULL)',
+  ADD COLUMN content_hash CHAR(64) NULL COMMENT '파일 내용 sha256 (중복 제거 키)' AFTER file_type,
+  ADD COLUMN size_bytes BIGINT NULL COMMENT '파일 크기' AFTER content_hash,
+  ADD COLUMN ref_count INT NOT NULL DEFAULT 0 COMMENT '게시글/프로필/게시판 이미지 참조 수' AFTER size_bytes,
+  ADD COLUMN last_seen_at DATETIME NULL COMMENT '마지막 업로드/참조 변경 시각 (GC 유예 기준)' AFTER ref_count,
+  ADD UNIQUE KEY uq_files_content_hash (content_hash),
+  ADD KEY idx_files_gc (ref_count, last_seen_at);
+
+-- ======================================================================
+-- ✅ profiles.follower_count / following_count 비정규화 카운터 보정
+-- - 팔로우/언팔로우 시 원자적 증감, 기존 데이터는 follows 활성 행 수로 1회 백필
+-- ======================================================================
+SET SQL_SAFE_UPDATES = 0;
+UPDATE profiles p
+LEFT JOIN (
+  SELECT following_id, COUNT(*) AS cnt FROM follows WHERE deleted_at IS NULL GROUP BY following_id
+) fr ON fr.following_id = p.id
+LEFT JOIN (
+  SELECT follower_id, COUNT(*) AS cnt FROM follows WHERE deleted_at IS NULL GROUP BY follower_id
+) fg ON fg.follower_id = p.id
+SET p.follower_count = COALESCE(fr.cnt, 0),
+    p.following_count = COALESCE(fg.cnt, 0);
+SET SQL_SAFE_UPDATES = 1;
+
+-- ======================================================================
+-- ✅ 프로필 탭(유저별 게시글/댓글) 커서 페이지네이션 인덱스
+-- ✅ board_posts.comment_count 비정규화 (VISIBLE 댓글 수, 작성/삭제 시 증감)
+-- ======================================================================
+CREATE INDEX idx_board_posts_author ON board_posts (author_id, status, created_at);
+CREATE INDEX idx_comments_user ON comments (user_id, status, created_at);
+
+ALTER TABLE board_posts
+  ADD COLUMN comment_count INT NOT NULL DEFAULT 0 COMMENT 'VISIBLE 댓글 수' AFTER like_count;
+
+SET SQL_SAFE_UPDATES = 0;
+UPDATE board_posts bp
+LEFT JOIN (
+  SELECT board_post_id, COUNT(*) AS cnt FROM comments WHERE status = 'VISIBLE' GROUP BY board_post_id
+) c ON c.board_post_id = bp.id
+SET bp.comment_count = COALESCE(c.cnt, 0);
+SET SQL_SAFE_UPDATES = 1;
+
+-- ======================================================================
+-- ✅ 게시글 댓글 트리 페이지네이션 (최상위 댓글 페이지 + 대댓글 미리보기/더보기)
+-- ======================================================================
+CREATE INDEX idx_comments_post_parent ON comments (board_post_id, parent_id, created_at);
+CREATE INDEX idx_comments_parent ON comments (parent_id, created_at);
+
+-- ======================================================================
+-- ✅ 관리자 처리 대기 신고 큐 (status + 최신순 커서 페이지네이션)
+-- ======================================================================
+CREATE INDEX idx_reports_status_created ON reports (status, created_at, id);
+
+-- ======================================================================
+-- ✅ 신고 중복 방지 / 같은 대상 일괄 처리
+-- - 중복 신고는 UNIQUE(reporter_user_id, target_type, target_id) INSERT 실패로 판정
+-- - 일괄 처리: (target_type, target_id, status) 로 대상별 대기 신고 조회
+-- ======================================================================
+CREATE INDEX idx_reports_target_status ON reports (target_type, target_id, status);
+
+-- ======================================================================
+-- ✅ 사용자별 안 읽은 알림 카운터 (배지 조회 = PK 조회)
+-- - 회원가입 시 행 생성, 알림 생성 / 읽음 / 전체 읽음 / 쪽지 읽음 처리와 같은 트랜잭션에서 증감
+-- - 스케줄러가 매시 notifications 기준으로 재집계
+-- ======================================================================
+CREATE TABLE notification_counters (
+  user_id BIGINT NOT NULL,
+  unread_count INT NOT NULL DEFAULT 0,
+  updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (user_id),
+  CONSTRAINT FK_notification_counters_user FOREIGN KEY (user_id) REFERENCES users (id)
+);
+
+CREATE INDEX idx_notifications_user_read ON notifications (user_id, is_read);
+
+INSERT INTO notification_counters (user_id, unread_count)
+SELECT u.id, COUNT(n.id)
+FROM users u
+LEFT JOIN notifications n ON n.user_id = u.id AND n.is_read = 0
+GROUP BY u.id;
@@ -161,6 +161,12 @@ export default function App() {
             const data = JSON.parse(event.data);
             console.log("💬 WebSocket 수신:", data);
 
+            // ✅ 관리자 대시보드 카운터 실시간 반영
+            if (data.type === "ADMIN_STATS") {
+              window.dispatchEvent(new CustomEvent("adminStats", { detail: data.data }));
+              return;
+            }
+
             // ✅ 서버/클라이언트 모두 대응: FORCE_LOGOUT 또는 FORCED_LOGOUT
             if (data.type === "FORCED_LOGOUT" || data.type === "FORCE_LOGOUT") {
               console.warn("🚨 다른 기기에서 로그인됨 → 자동 로그아웃");
@@ -19,6 +19,11 @@ export default function AdminDashboard() {
 
   useEffect(() => {
     fetchStats();
+
+    // ✅ 서버 카운터 변경 시 WebSocket(App.jsx) → adminStats 이벤트로 즉시 반영
+    const handleStats = (e) => setStats((prev) => ({ ...prev, ...e.detail }));
+    window.addEventListener("adminStats", handleStats);
+    return () => window.removeEventListener("adminStats", handleStats);
   }, []);
 
   async function fetchStats() {
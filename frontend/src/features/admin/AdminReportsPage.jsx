@@ -5,6 +5,7 @@ import "./adminReports.css";
 
 export default function AdminReportsPage() {
   const [reports, setReports] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null); // 다음 페이지 커서
   const [loading, setLoading] = useState(false);
 
   // 🩵 [추가] 공통 API BASE URL 상수화
@@ -15,6 +16,7 @@ export default function AdminReportsPage() {
     open: false,
     mode: "user-comment", // 'user-comment' | 'post'
     report: null,
+    bulk: false, // 같은 대상 신고 일괄 처리 여부
   });
 
   const [commentAction, setCommentAction] = useState("NONE");
@@ -28,16 +30,19 @@ export default function AdminReportsPage() {
     fetchReports();
   }, []);
 
-  async function fetchReports() {
+  async function fetchReports(cursor = null) {
     setLoading(true);
     try {
       const token = localStorage.getItem("access_token");
       const res = await axios.get(`${base}/admin/pending-reports`, {
         headers: { Authorization: `Bearer ${token}` },
+        params: cursor ? { cursor } : {},
       });
 
       if (res.data?.success) {
-        setReports(res.data.data || []);
+        const items = res.data.data || [];
+        setReports((prev) => (cursor ? [...prev, ...items] : items));
+        setNextCursor(res.data.next_cursor || null);
       } else {
         alert(res.data?.message || "신고 목록을 불러오지 못했습니다.");
       }
@@ -57,31 +62,38 @@ export default function AdminReportsPage() {
     ["POST", "BOARD_POST"].includes(r.target_type)
   );
 
+  // ✅ 같은 대상에 쌓인 신고 수 (2건 이상이면 일괄 처리 버튼 표시)
+  const targetKey = (r) => `${r.target_type}:${r.target_id}`;
+  const sameTargetCounts = reports.reduce((acc, r) => {
+    acc[targetKey(r)] = (acc[targetKey(r)] || 0) + 1;
+    return acc;
+  }, {});
+
   // ✅ [수정] prompt → 드롭다운 모달로 교체
-  async function handleResolveDynamic(report) {
+  async function handleResolveDynamic(report, bulk = false) {
     const { target_type } = report;
 
     if (["USER", "COMMENT", "MESSAGE"].includes(target_type)) {
       // ✅ 댓글/유저 신고 모달 열기
-      openResolveModal(report, "user-comment");
+      openResolveModal(report, "user-comment", bulk);
     } else if (["POST", "BOARD_POST"].includes(target_type)) {
       // ✅ 게시글 신고 모달 열기
-      openResolveModal(report, "post");
+      openResolveModal(report, "post", bulk);
     } else {
       alert("처리할 수 없는 신고 유형입니다.");
     }
   }
 
   // ✅ 모달 열기/닫기 헬퍼
-  function openResolveModal(report, mode) {
-    setResolveModal({ open: true, mode, report });
+  function openResolveModal(report, mode, bulk = false) {
+    setResolveModal({ open: true, mode, report, bulk });
     setCommentAction("NONE");
     setUserAction("WARNING");
     setReason("");
   }
 
   function closeResolveModal() {
-    setResolveModal({ open: false, mode: "user-comment", report: null });
+    setResolveModal({ open: false, mode: "user-comment", report: null, bulk: false });
   }
 
   // ✅ 모달 내 "확인" 클릭 시 API 호출
@@ -90,7 +102,28 @@ export default function AdminReportsPage() {
     const id = resolveModal.report.id;
 
     try {
-      if (resolveModal.mode === "user-comment") {
+      // ✅ 같은 대상 신고 일괄 처리 (대상 조치/제재 1회 + 신고자 전원 알림)
+      if (resolveModal.bulk) {
+        const report = resolveModal.report;
+        const res = await axios.post(
+          `${base}/admin/reports/bulk-resolve`,
+          {
+            target_type: report.target_type,
+            target_id: report.target_id,
+            action: "RESOLVE",
+            content_action: resolveModal.mode === "post" ? "DELETE" : commentAction,
+            user_action: userAction,
+            reason: reason || "관리자 판단에 따라 처리되었습니다.",
+          },
+          { headers: { Authorization: `Bearer ${token}` } }
+        );
+        if (res.data?.success) {
+          alert(`✅ ${res.data.message}`);
+        } else {
+          alert(res.data?.message || "신고 일괄 처리 실패");
+        }
+      }
+      else if (resolveModal.mode === "user-comment") {
         // ✅ 댓글/유저 신고 처리
         const res = await axios.post(
           `${base}/admin/reports/${id}/resolve/user-comment`,
@@ -282,6 +315,14 @@ export default function AdminReportsPage() {
                       >
                         반려
                       </button>
+                      {sameTargetCounts[targetKey(r)] > 1 && (
+                        <button
+                          className="report-btn btn-resolve"
+                          onClick={() => handleResolveDynamic(r, true)}
+                        >
+                          동일 대상 {sameTargetCounts[targetKey(r)]}건 일괄 처리
+                        </button>
+                      )}
                     </div>
                   </li>
                 ))}
@@ -349,12 +390,26 @@ export default function AdminReportsPage() {
                       >
                         반려
                       </button>
+                      {sameTargetCounts[targetKey(r)] > 1 && (
+                        <button
+                          className="report-btn btn-delete"
+                          onClick={() => handleResolveDynamic(r, true)}
+                        >
+                          동일 대상 {sameTargetCounts[targetKey(r)]}건 일괄 삭제
+                        </button>
+                      )}
                     </div>
                   </li>
                 ))}
               </ul>
             )}
           </section>
+
+          {nextCursor && (
+            <button className="load-more-btn" onClick={() => fetchReports(nextCursor)}>
+              이전 신고 더보기
+            </button>
+          )}
         </div>
       )}
 
@@ -366,6 +421,7 @@ export default function AdminReportsPage() {
               {resolveModal.mode === "user-comment"
                 ? "댓글/유저 신고 처리"
                 : "게시글 신고 처리"}
+              {resolveModal.bulk && " (동일 대상 일괄)"}
             </h3>
 
             {resolveModal.mode === "user-comment" && (
@@ -21,9 +21,10 @@ export async function rejectPost(id, reason, token) {
   });
 }
 
-export async function getPendingReports(token) {
+export async function getPendingReports(token, cursor = null) {
   const res = await axios.get(`${API}/pending-reports`, {
     headers: { Authorization: `Bearer ${token}` },
+    params: cursor ? { cursor } : {},
   });
   return res.data.data;
 }
@@ -19,7 +19,11 @@ export async function getBoardPosts(params = {}) {
 
 export async function getBoardPostDetail(postId) {
   const res = await authFetch(`/public/board/${postId}`, { method: "GET" }, { skipRedirect: true });
-  return { post: res.post || {}, comments: res.comments || [] };
+  return {
+    post: res.post || {},
+    comments: res.comments || [],
+    commentsNextCursor: res.comments_next_cursor || null,
+  };
 }
 export async function createBoardPost(data) {
   const res = await authFetch(`/board`, {
@@ -62,9 +66,18 @@ export async function reportBoardPost(postId, reason) {
 // ----------------------
 // 💬 댓글
 // ----------------------
-export async function getBoardComments(postId) {
-  const res = await authFetch(`/board/${postId}/comments`, { method: "GET" });
-  return res.comments || [];
+// 최상위 댓글 다음 페이지 → { items, next_cursor }
+export async function getBoardComments(postId, cursor = null) {
+  const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+  const res = await authFetch(`/board/${postId}/comments${query}`, { method: "GET" });
+  return { items: res?.items || [], next_cursor: res?.next_cursor || null };
+}
+
+// 대댓글 더보기 → { items, next_cursor }
+export async function getBoardReplies(commentId, cursor = null) {
+  const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+  const res = await authFetch(`/board/comments/${commentId}/replies${query}`, { method: "GET" });
+  return { items: res?.items || [], next_cursor: res?.next_cursor || null };
 }
 
 export async function createBoardComment(postId, data) {
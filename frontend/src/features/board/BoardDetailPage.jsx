@@ -3,6 +3,8 @@ import { useEffect, useState } from "react";
 import { useNavigate, useParams } from "react-router-dom";
 import {
   getBoardPostDetail,
+  getBoardComments,
+  getBoardReplies,
   toggleBoardLike,
   deleteBoardPost,
   createBoardComment,
@@ -19,6 +21,7 @@ export default function BoardDetailPage() {
 
   const [post, setPost] = useState(null);
   const [comments, setComments] = useState([]);
+  const [commentsCursor, setCommentsCursor] = useState(null); // 다음 댓글 페이지 커서
   const [replyMap, setReplyMap] = useState({});
   const [newComment, setNewComment] = useState("");
   const [currentUser, setCurrentUser] = useState(null);
@@ -51,6 +54,7 @@ export default function BoardDetailPage() {
       const res = await getBoardPostDetail(id);
       setPost(res.post);
       setComments(res.comments || []);
+      setCommentsCursor(res.commentsNextCursor);
     } catch (err) {
       console.error("❌ 게시글 조회 실패:", err);
     } finally {
@@ -62,6 +66,34 @@ export default function BoardDetailPage() {
     fetchPost();
   }, [id]);
 
+  // ===============================
+  // 댓글 / 대댓글 더보기
+  // ===============================
+  const handleMoreComments = async () => {
+    try {
+      const res = await getBoardComments(id, commentsCursor);
+      setComments((prev) => [...prev, ...res.items]);
+      setCommentsCursor(res.next_cursor);
+    } catch {
+      alert("댓글을 불러오지 못했습니다.");
+    }
+  };
+
+  const handleMoreReplies = async (thread) => {
+    try {
+      const res = await getBoardReplies(thread.comment.id, thread.replies_cursor);
+      setComments((prev) =>
+        prev.map((t) =>
+          t.comment.id === thread.comment.id
+            ? { ...t, replies: [...t.replies, ...res.items], replies_cursor: res.next_cursor }
+            : t
+        )
+      );
+    } catch {
+      alert("답글을 불러오지 못했습니다.");
+    }
+  };
+
   useEffect(() => {
     if (post?.badge) {
       console.log("✅ [DEBUG] post.badge:", post.badge);
@@ -197,13 +229,8 @@ export default function BoardDetailPage() {
 
   const isOwner = currentUser && post.author.id === currentUser.id;
 
-  // ✅ 댓글 수 계산 (삭제 제외)
-  const visibleCommentCount = comments.reduce((sum, thread) => {
-    const c = thread.comment;
-    const replies = thread.replies || [];
-    const validReplies = replies.filter((r) => r.status !== "DELETED").length;
-    return sum + (c.status !== "DELETED" ? 1 : 0) + validReplies;
-  }, 0);
+  // ✅ 댓글 수 (삭제 제외, 페이지로 나눠 받으므로 서버 집계값 사용)
+  const visibleCommentCount = post.comment_count ?? 0;
 
   // ✅ 권한별 버튼 렌더
   const renderButtons = (item, isMine) => {
@@ -513,6 +540,11 @@ export default function BoardDetailPage() {
                         </div>
                       );
                     })}
+                    {thread.replies_cursor && (
+                      <button className="more-replies-btn" onClick={() => handleMoreReplies(thread)}>
+                        답글 {thread.reply_count - replies.length}개 더보기
+                      </button>
+                    )}
                   </div>
                 )}
 
@@ -544,6 +576,12 @@ export default function BoardDetailPage() {
               </div>
             );
           })}
+
+          {commentsCursor && (
+            <button className="more-comments-btn" onClick={handleMoreComments}>
+              댓글 더보기
+            </button>
+          )}
         </div>
       </div>
     </div>
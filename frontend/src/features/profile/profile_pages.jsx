@@ -27,6 +27,7 @@ export default function ProfilePage() {
   const [showModal, setShowModal] = useState(false);
   const [modalType, setModalType] = useState("followers");
   const [list, setList] = useState([]);
+  const [listCursor, setListCursor] = useState(null); // 팔로워/팔로잉 다음 페이지 커서
 
   // 프로젝트 상태
   const [ongoingProjects, setOngoingProjects] = useState([]);
@@ -47,6 +48,7 @@ export default function ProfilePage() {
   //  게시글/댓글 상태 추가
   const [myPosts, setMyPosts] = useState([]);
   const [myComments, setMyComments] = useState([]);
+  const [postCursors, setPostCursors] = useState({ posts: null, comments: null }); // 다음 페이지 커서
   const [postTab, setPostTab] = useState("posts");
 
   const SKILL_ICONS = useMemo(
@@ -209,7 +211,7 @@ export default function ProfilePage() {
     }
   };
 
-const fetchMyPosts = async () => {
+const fetchMyPosts = async (cursor = null) => {
   try {
     const token = localStorage.getItem("access_token");
     const config = token ? { headers: { Authorization: `Bearer ${token}` } } : {};
@@ -218,8 +220,12 @@ const fetchMyPosts = async () => {
     if (!targetUserId) return;
 
     // ✅ 비로그인자도 접근 가능 (공개 API)
-    const res = await api.get(`/board/user/${targetUserId}/posts`, config);
-    setMyPosts(Array.isArray(res.data) ? res.data : res.data.posts || []);
+    const res = await api.get(`/board/user/${targetUserId}/posts`, {
+      ...config,
+      params: cursor ? { cursor } : {},
+    });
+    setMyPosts((prev) => (cursor ? [...prev, ...res.data.items] : res.data.items));
+    setPostCursors((prev) => ({ ...prev, posts: res.data.next_cursor }));
   } catch (err) {
     console.error("❌ 게시글 불러오기 실패:", err);
     setMyPosts([]);
@@ -227,7 +233,7 @@ const fetchMyPosts = async () => {
 };
 
 // ✅ 내 댓글 가져오기 (본인만)
-const fetchMyComments = async () => {
+const fetchMyComments = async (cursor = null) => {
   try {
     const token = localStorage.getItem("access_token");
     if (!token) return;
@@ -243,8 +249,10 @@ const fetchMyComments = async () => {
 
     const res = await api.get(`/board/user/${targetUserId}/comments`, {
       headers: { Authorization: `Bearer ${token}` },
+      params: cursor ? { cursor } : {},
     });
-    setMyComments(Array.isArray(res.data) ? res.data : []);
+    setMyComments((prev) => (cursor ? [...prev, ...res.data.items] : res.data.items));
+    setPostCursors((prev) => ({ ...prev, comments: res.data.next_cursor }));
   } catch (err) {
     console.error("❌ 댓글 불러오기 실패:", err);
     setMyComments([]);
@@ -297,7 +305,7 @@ const handleFollowToggle = async () => {
   }
 };
 
-const fetchFollowList = async (type) => {
+const fetchFollowList = async (type, cursor = null) => {
   try {
     const token = localStorage.getItem("access_token");
     if (!token) {
@@ -312,8 +320,10 @@ const fetchFollowList = async (type) => {
         : `/follows/${profile.id}/followings`;
     const res = await api.get(endpoint, {
       headers: { Authorization: `Bearer ${token}` },
+      params: cursor ? { cursor } : {},
     });
-    setList(res.data);
+    setList((prev) => (cursor ? [...prev, ...res.data.items] : res.data.items));
+    setListCursor(res.data.next_cursor);
     setModalType(type);
     setShowModal(true);
   } catch {
@@ -327,7 +337,11 @@ const handleUnfollowInModal = async (targetId) => {
     await api.delete(`/follows/${targetId}`, {
       headers: { Authorization: `Bearer ${token}` },
     });
-    setList((prev) => prev.filter((u) => u.id !== targetId));
+    setList((prev) =>
+      modalType === "followings" && currentUser?.id === profile.id
+        ? prev.filter((u) => u.id !== targetId)
+        : prev.map((u) => (u.id === targetId ? { ...u, is_following: false } : u))
+    );
     fetchProfile();
   } catch {
     alert("팔로우 취소 실패");
@@ -422,7 +436,26 @@ const renderProjectList = (projects, tabName) => {  // ✅ tabName 파라미터
     </>
   );
 };
-// ✅ 게시글 리스트 렌더링
+// ✅ 서버 다음 페이지 불러오기 버튼
+const renderLoadMore = (onClick) => (
+  <button
+    onClick={onClick}
+    style={{
+      width: "100%",
+      marginTop: "8px",
+      padding: "8px",
+      background: "none",
+      border: "1px solid #e5e7eb",
+      borderRadius: "8px",
+      fontSize: "13px",
+      color: "#6b7280",
+      cursor: "pointer",
+    }}
+  >
+    더보기
+  </button>
+);
+
 // ✅ 게시글 리스트 렌더링
 const renderPostList = () => {
   if (myPosts.length === 0) {
@@ -483,6 +516,7 @@ const renderPostList = () => {
           setPostPages(prev => ({ ...prev, posts: newPage }));
         }}
       />
+      {postCursors.posts && renderLoadMore(() => fetchMyPosts(postCursors.posts))}
     </>
   );
 };
@@ -542,6 +576,7 @@ const renderCommentList = () => {
           setPostPages(prev => ({ ...prev, comments: newPage }));
         }}
       />
+      {postCursors.comments && renderLoadMore(() => fetchMyComments(postCursors.comments))}
     </>
   );
 };
@@ -936,7 +971,7 @@ return (
               fontWeight: postTab === "posts" ? "500" : "normal",
             }}
           >
-            게시글 ({myPosts.length})
+            게시글 ({myPosts.length}{postCursors.posts ? "+" : ""})
           </button>
 
           {/* ✅ 댓글 탭은 본인 또는 관리자일 때만 보임 */}
@@ -954,7 +989,7 @@ return (
                 fontWeight: postTab === "comments" ? "500" : "normal",
               }}
             >
-              댓글 ({myComments.length})
+              댓글 ({myComments.length}{postCursors.comments ? "+" : ""})
             </button>
           )}
         </div>
@@ -1049,6 +1084,23 @@ return (
             ) : (
               <p style={{ textAlign: "center", color: "#9ca3af", padding: "16px" }}>아직 아무도 없습니다.</p>
             )}
+            {listCursor && (
+              <button
+                onClick={() => fetchFollowList(modalType, listCursor)}
+                style={{
+                  width: "100%",
+                  padding: "8px",
+                  background: "none",
+                  border: "1px solid #e5e7eb",
+                  borderRadius: "8px",
+                  fontSize: "13px",
+                  color: "#6b7280",
+                  cursor: "pointer",
+                }}
+              >
+                더보기
+              </button>
+            )}
           </div>
           <button
             onClick={() => setShowModal(false)}
@@ -1,12 +1,13 @@
 // /src/features/project_post/components/AIModal.jsx
 import { useState } from "react";
-import { generateAIDescription } from "./api";
+import { streamAIDescription } from "./api";
 import "./aiForm.css";
 
 export default function AIModal({ onClose, onResult }) {
   const [prompt, setPrompt] = useState("");
   const [loading, setLoading] = useState(false);
   const [result, setResult] = useState("");
+  const [streaming, setStreaming] = useState("");
 
   // ✅ 줄바꿈 → <p> / <br> 변환 함수
   const formatToHTML = (text) => {
@@ -20,7 +21,8 @@ export default function AIModal({ onClose, onResult }) {
     if (!prompt.trim()) return alert("프로젝트 설명을 입력해주세요.");
     setLoading(true);
     try {
-      const desc = await generateAIDescription(prompt);
+      // ✅ 생성되는 문장을 실시간으로 미리보기
+      const desc = await streamAIDescription(prompt, setStreaming);
 
       // ✅ HTML 형식으로 변환
       const formattedDesc = formatToHTML(desc);
@@ -31,6 +33,7 @@ export default function AIModal({ onClose, onResult }) {
       alert("AI 생성 실패: " + err.message);
     } finally {
       setLoading(false);
+      setStreaming("");
     }
   };
 
@@ -85,6 +88,13 @@ export default function AIModal({ onClose, onResult }) {
           )}
         </div>
 
+        {/* ✅ 생성 중 미리보기 */}
+        {!result && streaming && (
+          <div className="ai-modal-result" style={{ whiteSpace: "pre-wrap" }}>
+            {streaming}
+          </div>
+        )}
+
         {/* ✅ 결과 표시 */}
         {result && (
           <div
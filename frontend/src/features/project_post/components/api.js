@@ -1,6 +1,15 @@
 // /src/features/project_post/components/api.js
 const API_URL = import.meta.env.VITE_API_BASE_URL || "http://localhost:8000";
 
+// ✅ 로그인 상태면 토큰 첨부 (사용자별 AI 사용량 집계용)
+function authHeaders() {
+  const token = localStorage.getItem("access_token");
+  return {
+    "Content-Type": "application/json",
+    ...(token ? { Authorization: `Bearer ${token}` } : {}),
+  };
+}
+
 /**
  * 🤖 AI 설명 생성 요청
  * @param {string} prompt - 사용자 입력 프롬프트
@@ -23,3 +32,53 @@ export async function generateAIDescription(prompt) {
     throw new Error("AI 생성 요청 중 오류가 발생했습니다.");
   }
 }
+
+/**
+ * 📡 AI 설명 스트리밍 생성 (Server-Sent Events)
+ * @param {string} prompt - 사용자 입력 프롬프트
+ * @param {(partial: string) => void} onDelta - 지금까지 생성된 텍스트 콜백
+ * @returns {Promise<string>} 4번 섹션 후처리된 최종 설명
+ */
+export async function streamAIDescription(prompt, onDelta) {
+  const res = await fetch(`${API_URL}/ai/expand/stream`, {
+    method: "POST",
+    headers: authHeaders(),
+    body: JSON.stringify({ prompt }),
+  });
+  if (res.status === 429) {
+    const data = await res.json();
+    throw new Error(data.detail);
+  }
+  if (!res.ok || !res.body) throw new Error(`HTTP ${res.status}`);
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder("utf-8");
+  let buffer = "";
+  let partial = "";
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    // 이벤트는 빈 줄(\n\n)로 구분
+    let sep;
+    while ((sep = buffer.indexOf("\n\n")) !== -1) {
+      const raw = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+
+      const event = raw.match(/^event: (.*)$/m)?.[1];
+      const data = JSON.parse(raw.match(/^data: (.*)$/m)?.[1] || "{}");
+
+      if (event === "delta") {
+        partial += data.text;
+        onDelta?.(partial);
+      } else if (event === "done") {
+        return data.description;
+      } else if (event === "error") {
+        throw new Error(data.detail || "AI 생성 요청 중 오류가 발생했습니다.");
+      }
+    }
+  }
+  throw new Error("AI 응답이 중간에 끊겼습니다.");
+}